@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+from typing import Iterator
+
+# Utterance templates per intent; "{x}" slots are filled from FILLERS.
+TEMPLATES: dict[str, list[str]] = {
+    "open_whatsapp_web": ["open chrome and open whatsapp", "open chrome then whatsapp please", "Open Chrome and WhatsApp"],
+    "change_theme": ["open settings and change theme", "open settings theme to dark", "open display settings for the theme"],
+    "install_library": ["open terminal and download {lib}", "open terminal download this library {lib}"],
+    "shutdown_system": ["shut down the computer", "shutdown now", "please shut down"],
+    "tell_time": ["what time is it", "what time is it now", "tell me the current time"],
+    "tell_date": ["what date is it", "what date is today", "today date please"],
+    "save_note": ["note: {note}", "note {note}", "Note - {note}", "take a note {note}"],
+    "find_notes": ["find note about {note}", "search my notes for {note}"],
+    "list_notes": ["list notes from {period}", "show my notes", "show notes for {period}"],
+    "open_calculator": ["open calculator", "open calculator please"],
+    "open_notepad": ["open editor", "open editor for me"],
+    "open_app_or_site": ["open {site}", "open {site} please"],
+    "chat": [
+        "tell me a joke",
+        "what can you do",
+        "how far away is the moon",
+        "explain {topic} in simple terms",
+        "write a short poem about {topic}",
+        "who won the match yesterday",
+    ],
+}
+
+FILLERS: dict[str, list[str]] = {
+    "lib": ["requests", "numpy", "flask", "rich", "pydantic-core", "opencv-python"],
+    "note": ["buy milk", "call mom at six", "renew passport", "ship the release notes", "water the plants"],
+    "site": ["youtube", "gmail", "whatsapp", "github.com", "spotify", "the news"],
+    "period": ["today", "yesterday", "this week", "last 7 days"],
+    "topic": ["recursion", "black holes", "tax brackets", "photosynthesis", "the stock market"],
+}
+
+WAKE_PREFIXES = ["hey jane ", "Hey Jane, ", "hey jane... ", "HEY JANE: "]
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(**{slot: rng.choice(values) for slot, values in FILLERS.items()})
+
+
+def generate(count: int, seed: int = 1234, chat_ratio: float = 0.3) -> Iterator[tuple[str, str]]:
+    """Yield ``(expected_action, utterance)`` pairs; every intent appears, chat gets ``chat_ratio``."""
+    rng = random.Random(seed)
+    intents = [name for name in TEMPLATES if name != "chat"]
+    for i in range(count):
+        if i < len(TEMPLATES):
+            action = list(TEMPLATES)[i]
+        elif rng.random() < chat_ratio:
+            action = "chat"
+        else:
+            action = rng.choice(intents)
+        yield action, _fill(rng.choice(TEMPLATES[action]), rng)
+
+
+def generate_transcripts(count: int, seed: int = 1234, wake_ratio: float = 0.8) -> Iterator[str]:
+    """Yield voice transcripts, ``wake_ratio`` of them led by a wake-word variant."""
+    rng = random.Random(seed + 1)
+    for _action, utterance in generate(count, seed):
+        yield (rng.choice(WAKE_PREFIXES) + utterance) if rng.random() < wake_ratio else utterance
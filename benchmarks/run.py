@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Iterable
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.corpus import generate, generate_transcripts  # noqa: E402
+from jane.actions import ActionExecutor, ActionResult  # noqa: E402
+from jane.commands import enable_parse_cache, extract_wake_word_command, parse_command  # noqa: E402
+from jane.gateway import ChatGateway  # noqa: E402
+
+PERCENTILES = (50, 90, 99)
+
+
+class _FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeGeminiModel:
+    """Echoes the prompt; with ``stream=True`` it yields the echo in ``chunk_size`` pieces."""
+
+    def __init__(self, chunk_size: int = 8) -> None:
+        self.chunk_size = chunk_size
+
+    def generate_content(self, contents, stream: bool = False):
+        prompt = contents[-1]["parts"][0] if isinstance(contents, list) else contents
+        text = f"Echo: {prompt}"
+        if not stream:
+            return _FakeResponse(text)
+        return (_FakeResponse(text[i : i + self.chunk_size]) for i in range(0, len(text), self.chunk_size))
+
+
+def _percentile(sorted_ns: list[int], pct: int) -> float:
+    index = min(len(sorted_ns) - 1, max(0, round(pct / 100 * len(sorted_ns)) - 1))
+    return sorted_ns[index] / 1000
+
+
+def measure(fn: Callable[[str], object], inputs: Iterable[str], warmup: int = 200) -> dict[str, float]:
+    items = list(inputs)
+    for item in items[:warmup]:
+        fn(item)
+    samples: list[int] = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for item in items:
+        t0 = clock()
+        fn(item)
+        samples.append(clock() - t0)
+    elapsed = clock() - started
+    samples.sort()
+    report = {f"p{pct}_us": round(_percentile(samples, pct), 3) for pct in PERCENTILES}
+    report["mean_us"] = round(sum(samples) / len(samples) / 1000, 3)
+    report["max_us"] = round(samples[-1] / 1000, 3)
+    report["calls"] = len(samples)
+    report["throughput_per_s"] = round(len(samples) / (elapsed / 1e9), 1)
+    return report
+
+
+def _stubbed_executor(stack: ExitStack, workdir: Path) -> ActionExecutor:
+    """An ActionExecutor whose OS, browser, sleep and network effects are all no-ops."""
+    stack.enter_context(mock.patch("jane.handlers.web.webbrowser.open", return_value=True))
+    stack.enter_context(mock.patch("jane.handlers.system.subprocess.Popen"))
+    stack.enter_context(mock.patch("jane.launchers.subprocess.Popen"))
+    stack.enter_context(mock.patch("jane.jobs.subprocess.Popen"))
+    stack.enter_context(
+        mock.patch("jane.handlers.system.run_with_admin", side_effect=lambda *_a, **_k: ActionResult(True, "stubbed"))
+    )
+    stack.enter_context(mock.patch("jane.actions.time.sleep"))
+    executor = ActionExecutor(lambda _text: None)
+    # Closed while the stubs are still active, so no scheduled shutdown outlives the run.
+    stack.callback(executor.close)
+    executor.notes_file = workdir / "jane_notes.txt"
+    executor.gemini_model = FakeGeminiModel()
+    executor.chat_cache = None
+    executor.chat_gateway = ChatGateway(rate_per_minute=None)
+    stack.enter_context(mock.patch.object(executor, "_ensure_gemini_ready", return_value=True))
+    return executor
+
+
+def run(count: int, seed: int) -> dict:
+    corpus = list(generate(count, seed))
+    utterances = [text for _action, text in corpus]
+    transcripts = list(generate_transcripts(count, seed))
+    mismatches = sum(1 for action, text in corpus if parse_command(text).action != action)
+
+    results = {
+        "parse_command": measure(parse_command, utterances),
+        "extract_wake_word_command": measure(extract_wake_word_command, transcripts),
+    }
+    results["parse_command"]["route_mismatches"] = mismatches
+
+    parsed = [parse_command(text) for text in utterances]
+    with ExitStack() as stack, tempfile.TemporaryDirectory() as tmp:
+        executor = _stubbed_executor(stack, Path(tmp))
+        by_index = iter(parsed)
+        results["ActionExecutor.execute"] = measure(lambda _text: executor.execute(next(by_index)), utterances, warmup=0)
+
+    return {
+        "meta": {"count": count, "seed": seed, "python": platform.python_version(), "platform": platform.platform()},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return one message per p50/p99 latency that grew more than ``tolerance`` over the baseline."""
+    regressions = []
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for key in ("p50_us", "p99_us"):
+            old, new = base.get(key), stats.get(key)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append(f"{name} {key}: {old:.2f} -> {new:.2f} (+{(new / old - 1):.0%})")
+    return regressions
+
+
+def _print_report(report: dict) -> None:
+    header = f"{'benchmark':<28}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'mean us':>10}{'ops/s':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in report["results"].items():
+        print(
+            f"{name:<28}{stats['p50_us']:>10.2f}{stats['p90_us']:>10.2f}{stats['p99_us']:>10.2f}"
+            f"{stats['mean_us']:>10.2f}{stats['throughput_per_s']:>14,.0f}"
+        )
+    mismatches = report["results"]["parse_command"].get("route_mismatches", 0)
+    print(f"\nparse_command routed {mismatches} of {report['meta']['count']} corpus utterances off their template intent.")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmark JANE's parser and dispatcher.")
+    parser.add_argument("-n", "--count", type=int, default=20000, help="Corpus size (default: 20000).")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus seed (default: 1234).")
+    parser.add_argument("--save", metavar="PATH", help="Write this run's report as JSON.")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a saved report and fail on regressions.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed p50/p99 slowdown vs baseline, as a fraction (default: 0.2)."
+    )
+    parser.add_argument("--parse-cache", type=int, default=0, metavar="SIZE", help="Enable the parse LRU cache.")
+    args = parser.parse_args(argv)
+
+    if args.parse_cache > 0:
+        enable_parse_cache(args.parse_cache)
+    report = run(args.count, args.seed)
+    _print_report(report)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Saved report to {args.save}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
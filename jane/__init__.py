@@ -2,8 +2,27 @@
 
 __all__ = [
     "app",
+    "audio",
     "actions",
+    "chat_cache",
     "commands",
+    "config",
+    "elevation",
+    "fuzzy",
+    "gateway",
+    "handlers",
+    "jobs",
+    "launchers",
+    "memory",
+    "notes",
+    "profiling",
+    "recognizers",
+    "registry",
+    "replay",
+    "scheduler",
     "speech",
+    "streaming",
+    "tts",
     "vision",
+    "wakeword",
 ]
@@ -1,34 +1,118 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
 import os
-import platform
-import shutil
-import shlex
-import subprocess
+import threading
 import time
-import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-from jane.commands import ParsedCommand
+from jane.commands import Action, ParsedCommand
+from jane.config import env_int
+from jane.gateway import PRIORITY_INTERACTIVE, ChatGateway, GatewayBusy, chat_gateway_from_env
+from jane.memory import ConversationMemory
+from jane.registry import DEFAULT_ACTION_TIMEOUT, ActionRegistry, ActionSpec
+from jane.scheduler import ScheduledJob, Scheduler
+from jane.streaming import SentenceSplitter, split_sentences
+
+if TYPE_CHECKING:
+    # Launchers, elevation, jobs, notes and the chat cache pull in platform, shlex, subprocess
+    # and sqlite3; they are imported where first used so ``import jane.actions`` stays cheap.
+    from jane.chat_cache import ChatResponseCache
+    from jane.elevation import ElevatedCommand
+    from jane.jobs import Job, JobManager
+    from jane.launchers import LauncherResolver
+    from jane.notes import NotesIndex, NoteWriter
 
 
 @dataclass
 class ActionResult:
     ok: bool
     message: str
+    # True when the message already went out sentence by sentence through the executor's
+    # ``sentence_sink``, so callers should display it but not speak it a second time.
+    streamed: bool = False
+
+
+BUILTIN_ACTIONS: tuple[ActionSpec, ...] = (
+    ActionSpec(Action.OPEN_WHATSAPP_WEB, "jane.handlers.web:open_whatsapp_web"),
+    ActionSpec(Action.OPEN_APP_OR_SITE, "jane.handlers.web:open_app_or_site"),
+    ActionSpec(Action.CHANGE_THEME, "jane.handlers.system:change_theme", high_risk=True),
+    ActionSpec(
+        Action.INSTALL_LIBRARY,
+        "jane.handlers.system:install_library",
+        high_risk=True,
+        elevated="jane.handlers.system:plan_install_library",
+    ),
+    ActionSpec(Action.SHUTDOWN_SYSTEM, "jane.handlers.system:shutdown_system", kind="cpu", high_risk=True),
+    ActionSpec(Action.OPEN_CALCULATOR, "jane.handlers.system:open_calculator"),
+    ActionSpec(Action.OPEN_NOTEPAD, "jane.handlers.system:open_notepad"),
+    ActionSpec(Action.TELL_TIME, "jane.handlers.clock:tell_time", kind="cpu"),
+    ActionSpec(Action.TELL_DATE, "jane.handlers.clock:tell_date", kind="cpu"),
+    ActionSpec(Action.SAVE_NOTE, "jane.handlers.notes:save_note", shares="notes"),
+    ActionSpec(Action.FIND_NOTES, "jane.handlers.notes:find_notes", shares="notes"),
+    ActionSpec(Action.LIST_NOTES, "jane.handlers.notes:list_notes", shares="notes"),
+    ActionSpec(Action.CHAT, "jane.handlers.chat:chat", kind="network", timeout=45.0),
+    ActionSpec(Action.SET_REMINDER, "jane.handlers.schedule:set_reminder", kind="cpu", shares="scheduler"),
+    ActionSpec(Action.SCHEDULE_COMMAND, "jane.handlers.schedule:schedule_command", kind="cpu", shares="scheduler"),
+    ActionSpec(Action.CANCEL_SCHEDULED, "jane.handlers.schedule:cancel_scheduled", kind="cpu", shares="scheduler"),
+)
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+GEMINI_RETRY_SECONDS = 30.0
+POOL_LIMITS: dict[str, int] = {"cpu": 2, "io": 4, "network": 8}
+_DEFAULT = object()
+
+
+def default_registry() -> ActionRegistry:
+    """Built-in actions plus any published under the ``jane.actions`` entry-point group."""
+    registry = ActionRegistry(BUILTIN_ACTIONS)
+    registry.discover()
+    return registry
 
 
 class ActionExecutor:
-    def __init__(self, speaker: Callable[[str], None]) -> None:
+    def __init__(
+        self,
+        speaker: Callable[[str], None],
+        registry: ActionRegistry | None = None,
+        model_factory: Callable[[str], Any] | None = None,
+    ) -> None:
         self.speaker = speaker
+        # When set, chat replies are requested with ``stream=True`` and each sentence is handed
+        # to the sink as soon as it is complete instead of waiting for the whole answer. A
+        # ``sink`` passed to ``submit`` and friends overrides it for that request only.
+        self.sentence_sink: Callable[[str], None] | None = None
+        # Time-critical announcements (reminders, shutdown countdowns) go here when set, so a
+        # front end with a speech queue can put them ahead of ordinary replies. It also gets the
+        # alert's key (or None): a newer alert with the same key replaces one not yet spoken.
+        self.urgent_speaker: Callable[[str, str | None], None] | None = None
+        self.registry = registry if registry is not None else default_registry()
         self._gemini_key_loaded: str | None = None
+        self.gemini_model_name = GEMINI_MODEL_NAME
+        # Builds the chat model from an API key (None when it cannot); google-generativeai by default.
+        self.gemini_model_factory: Callable[[str], Any] = model_factory or self._genai_model
         self.notes_file = Path("jane_notes.txt")
-        self.gemini_model = self._init_gemini_model()
+        self._notes_index: NotesIndex | None = None
+        self._note_writer: NoteWriter | None = None
+        self._launchers: LauncherResolver | None = None
+        self.scheduler = Scheduler()
+        self._jobs: JobManager | None = None
+        # Built on first use or by warm_up(), so startup never pays for importing the SDK.
+        self.gemini_model = None
+        self._gemini_failed: tuple[str, float] | None = None
+        self._gemini_lock = threading.Lock()
+        self.conversation = ConversationMemory(token_budget=self._chat_token_budget())
+        self._chat_cache: ChatResponseCache | None | object = _DEFAULT
+        self.chat_gateway: ChatGateway = chat_gateway_from_env()
+        self.pool_limits = dict(POOL_LIMITS)
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._local = threading.local()
 
     def _resolve_gemini_key(self) -> str | None:
         candidates = [
@@ -45,10 +129,22 @@ class ActionExecutor:
                 return cleaned
         return None
 
+    def _chat_token_budget(self) -> int:
+        return max(1000, env_int("JANE_CHAT_TOKEN_BUDGET", 2000))
+
     def _init_gemini_model(self):
         key = self._resolve_gemini_key()
         if not key:
             return None
+        try:
+            model = self.gemini_model_factory(key)
+        except Exception:
+            return None
+        if model is not None:
+            self._gemini_key_loaded = key
+        return model
+
+    def _genai_model(self, key: str):
         try:
             if importlib.util.find_spec("google.generativeai") is None:
                 return None
@@ -60,141 +156,409 @@ class ActionExecutor:
         except ModuleNotFoundError:
             return None
 
-        try:
-            genai.configure(api_key=key)
-            self._gemini_key_loaded = key
-            return genai.GenerativeModel("gemini-1.5-flash")
-        except Exception:
-            return None
+        genai.configure(api_key=key)
+        return genai.GenerativeModel(self.gemini_model_name)
 
     def _ensure_gemini_ready(self) -> bool:
+        # The key is re-read on every call and the client rebuilt when it changes. A failed build
+        # is retried with the same key only after GEMINI_RETRY_SECONDS, not on every message.
         key = self._resolve_gemini_key()
         if not key:
             self.gemini_model = None
+            self._gemini_key_loaded = None
             return False
         if self.gemini_model is not None and self._gemini_key_loaded == key:
             return True
-        self.gemini_model = self._init_gemini_model()
+        with self._gemini_lock:
+            if self.gemini_model is not None and self._gemini_key_loaded == key:
+                return True
+            failed = self._gemini_failed
+            if failed is not None and failed[0] == key and time.monotonic() - failed[1] < GEMINI_RETRY_SECONDS:
+                return False
+            self.gemini_model = self._init_gemini_model()
+            self._gemini_failed = None if self.gemini_model is not None else (key, time.monotonic())
         return self.gemini_model is not None
 
+    def warm_up(self) -> threading.Thread:
+        """Build the Gemini client and probe app launchers on a background thread."""
+
+        def _warm() -> None:
+            self.launchers.warm()
+            self._ensure_gemini_ready()
+
+        thread = threading.Thread(target=_warm, name="jane-warmup", daemon=True)
+        thread.start()
+        return thread
+
     def execute(self, cmd: ParsedCommand) -> ActionResult:
-        action = cmd.action
-        if action == "open_whatsapp_web":
-            webbrowser.open("https://web.whatsapp.com")
-            return ActionResult(True, "Opening WhatsApp Web in browser.")
-        if action == "change_theme":
-            return self._open_settings_for_theme()
-        if action == "install_library":
-            return self._install_library(cmd.params.get("library", ""))
-        if action == "shutdown_system":
-            return self._shutdown_with_countdown(int(cmd.params.get("countdown", 10)))
-        if action == "open_app_or_site":
-            return self._open_target(cmd.params.get("target", ""))
-        if action == "tell_time":
-            return ActionResult(True, f"Current time is {datetime.now().strftime('%I:%M %p')}.")
-        if action == "tell_date":
-            return ActionResult(True, f"Today is {datetime.now().strftime('%A, %d %B %Y')}.")
-        if action == "save_note":
-            return self._save_note(cmd.params.get("note", ""))
-        if action == "open_calculator":
-            return self._open_system_app(["calc", "gnome-calculator", "open -a Calculator"])
-        if action == "open_notepad":
-            return self._open_system_app(["notepad", "gedit", "open -a TextEdit"])
-        if action == "chat":
-            return self._chat(cmd.params.get("prompt", ""))
-        return ActionResult(False, "I could not understand that command.")
-
-    def _open_settings_for_theme(self) -> ActionResult:
-        system = platform.system().lower()
+        handler = self.registry.handler(cmd.action)
+        if handler is None:
+            return ActionResult(False, "I could not understand that command.")
+        return handler(self, cmd)
+
+    def requires_approval(self, cmd: ParsedCommand) -> bool:
+        spec = self.registry.spec(cmd.action)
+        return cmd.high_risk or (spec is not None and spec.high_risk)
+
+    def execute_many(self, commands: list[ParsedCommand], sink: Callable[[str], None] | None = None) -> ActionResult:
+        """Run a planned list of commands and merge their results in order.
+
+        Commands with different actions run concurrently; repeats of the same action (two notes,
+        say) run one after another so their side effects keep the spoken order.
+        """
+        if len(commands) == 1 and sink is None:
+            return self._execute_guarded(commands[0])
+        return self.submit_many(commands, sink).result()
+
+    async def execute_async(
+        self, cmd: ParsedCommand, timeout: float | None | object = _DEFAULT, sink: Callable[[str], None] | None = None
+    ) -> ActionResult:
+        """Run ``cmd`` on the worker pool for its kind of action.
+
+        ``timeout`` defaults to the action's ``ActionSpec.timeout``; ``None`` waits
+        forever. On timeout or cancellation the action is asked to stop (countdowns honour
+        this), although a blocking call already in progress runs to completion in its worker.
+        """
+        spec = self.registry.spec(cmd.action)
+        if timeout is _DEFAULT:
+            timeout = spec.timeout if spec is not None else DEFAULT_ACTION_TIMEOUT
+        cancel = threading.Event()
+        loop = asyncio.get_running_loop()
+        pool = self._pool_for(spec.kind if spec is not None else "io")
+        work = loop.run_in_executor(pool, self._execute_cancellable, cmd, cancel, sink)
         try:
-            if "windows" in system:
-                return self._run_with_admin(
-                    ["start", "ms-settings:colors"],
-                    "Open Windows color settings",
-                    shell=True,
-                )
-            elif "darwin" in system:
-                subprocess.Popen(["open", "x-apple.systempreferences:"])
+            return await asyncio.wait_for(work, timeout)
+        except asyncio.TimeoutError:
+            cancel.set()
+            return ActionResult(False, f"{cmd.action} timed out after {timeout:g} seconds.")
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+
+    async def execute_many_async(
+        self, commands: list[ParsedCommand], sink: Callable[[str], None] | None = None
+    ) -> ActionResult:
+        if not commands:
+            return ActionResult(True, "Nothing to run.")
+
+        # Commands touching the same state ("note X then find notes about X") keep their order;
+        # everything else runs concurrently.
+        batches: dict[str, list[int]] = {}
+        for index, cmd in enumerate(commands):
+            spec = self.registry.spec(cmd.action)
+            batches.setdefault(spec.shares if spec is not None and spec.shares else cmd.action, []).append(index)
+
+        results: list[ActionResult] = [ActionResult(False, "")] * len(commands)
+
+        async def _run_batch(indices: list[int]) -> None:
+            for index in indices:
+                results[index] = await self.execute_async(commands[index], sink=sink)
+
+        await asyncio.gather(*(_run_batch(indices) for indices in batches.values()))
+        ok = all(result.ok for result in results)
+        unspoken = [result.message for result in results if not result.streamed]
+        if not unspoken:
+            return ActionResult(ok, " ".join(result.message for result in results), streamed=True)
+        return ActionResult(ok, " ".join(unspoken))
+
+    def run_approved(
+        self, commands: list[ParsedCommand], sink: Callable[[str], None] | None = None
+    ) -> list[ActionResult]:
+        """Run a batch of approved commands, returning one result per command in order.
+
+        Commands whose action has an elevated planner share a single elevated helper session
+        (one prompt for the whole batch, run in order); the rest go through the async engine.
+        """
+        from jane.elevation import run_elevated_batch
+
+        results: list[ActionResult | None] = [None] * len(commands)
+        plans: list[tuple[int, ElevatedCommand]] = []
+        for index, cmd in enumerate(commands):
+            planner = self.registry.elevated_planner(cmd.action)
+            plan = planner(self, cmd) if planner is not None else None
+            if plan is not None:
+                plans.append((index, plan))
+
+        planned = {index for index, _plan in plans}
+        pending = [(index, self.submit(cmd, sink=sink)) for index, cmd in enumerate(commands) if index not in planned]
+        for (index, plan), outcome in zip(plans, run_elevated_batch([plan for _index, plan in plans])):
+            detail = outcome.last_line()
+            if outcome.ok:
+                results[index] = ActionResult(True, f"Done: {plan.reason}.")
             else:
-                subprocess.Popen(["gnome-control-center", "appearance"])
-            return ActionResult(True, "Opened settings. Please apply your theme preference.")
-        except Exception as exc:
-            return ActionResult(False, f"Unable to open settings: {exc}")
+                results[index] = ActionResult(
+                    False, f"Failed: {plan.reason} (exit {outcome.returncode}){': ' + detail if detail else '.'}"
+                )
+        for index, future in pending:
+            results[index] = future.result()
+        return [result for result in results if result is not None]
 
-    def _install_library(self, library: str) -> ActionResult:
-        if not library:
-            return ActionResult(False, "No library name was provided.")
-        try:
-            return self._run_with_admin(
-                ["python", "-m", "pip", "install", library],
-                f"Install library: {library}",
-                wait=True,
+    def submit_approved(
+        self, commands: list[ParsedCommand], sink: Callable[[str], None] | None = None
+    ) -> Future[list[ActionResult]]:
+        return self._pool_for("io").submit(self.run_approved, commands, sink)
+
+    def submit(
+        self, cmd: ParsedCommand, timeout: float | None | object = _DEFAULT, sink: Callable[[str], None] | None = None
+    ) -> Future[ActionResult]:
+        """Schedule ``cmd`` on the background event loop; cancelling the future cancels the action."""
+        return asyncio.run_coroutine_threadsafe(self.execute_async(cmd, timeout, sink), self._event_loop())
+
+    def submit_many(
+        self, commands: list[ParsedCommand], sink: Callable[[str], None] | None = None
+    ) -> Future[ActionResult]:
+        return asyncio.run_coroutine_threadsafe(self.execute_many_async(commands, sink), self._event_loop())
+
+    def schedule_command(self, delay: float, cmd: ParsedCommand, label: str | None = None) -> ScheduledJob:
+        """Run ``cmd`` after ``delay`` seconds and speak its result."""
+
+        def _fire(_job: ScheduledJob) -> None:
+            def _done(future: Future[ActionResult]) -> None:
+                if not future.cancelled() and not future.result().streamed:
+                    self.speaker(future.result().message)
+
+            self.submit(cmd).add_done_callback(_done)
+
+        return self.scheduler.schedule(delay, _fire, label or cmd.raw, kind="action")
+
+    def remind(self, delay: float, message: str) -> ScheduledJob:
+        def _fire(_job: ScheduledJob) -> None:
+            self.alert(f"Reminder: {message}")
+
+        return self.scheduler.schedule(delay, _fire, message, kind="reminder")
+
+    def alert(self, text: str, key: str | None = None) -> None:
+        if self.urgent_speaker is not None:
+            self.urgent_speaker(text, key)
+        else:
+            self.speaker(text)
+
+    def countdown(
+        self,
+        seconds: int,
+        label: str,
+        on_tick: Callable[[int], None],
+        on_done: Callable[[], None],
+        on_cancel: Callable[[], None] | None = None,
+    ) -> ScheduledJob:
+        """Call ``on_tick(n)`` once a second from ``seconds`` down to 1, then ``on_done`` on the io pool.
+
+        The whole countdown is one scheduler entry, so it holds no thread while it waits and
+        cancelling it by id stops it before the next tick.
+        """
+        remaining = [seconds]
+
+        def _tick(_job: ScheduledJob) -> float | None:
+            if remaining[0] <= 0:
+                self._pool_for("io").submit(on_done)
+                return None
+            on_tick(remaining[0])
+            remaining[0] -= 1
+            return 1.0
+
+        return self.scheduler.schedule(
+            0, _tick, label, kind="countdown", on_cancel=(lambda _job: on_cancel()) if on_cancel else None
+        )
+
+    def scheduled(self) -> list[dict]:
+        return [job.to_dict() for job in self.scheduler.pending()]
+
+    def cancel_scheduled(self, job_id: int | None = None, kind: str | None = None) -> int:
+        """Cancel one scheduled item by id, or every item (of ``kind``, if given); returns how many."""
+        if job_id is not None:
+            return int(self.scheduler.cancel(job_id))
+        return self.scheduler.cancel_all(kind)
+
+    def start_job(
+        self,
+        argv: list[str],
+        label: str,
+        progress_parser: Callable[[str], float | None] | None = None,
+        announce: bool = True,
+    ) -> Job:
+        """Run ``argv`` as a background job; with ``announce`` its outcome is spoken when it ends."""
+
+        def _finished(job: Job) -> None:
+            if job.status == "succeeded":
+                self.speaker(f"Done: {job.label}.")
+            elif job.status == "failed":
+                detail = job.last_line()
+                self.speaker(f"Failed: {job.label} (exit {job.returncode}){': ' + detail if detail else '.'}")
+
+        return self.jobs.start(argv, label, progress_parser, _finished if announce else None)
+
+    def job_status(self, job_id: int | None = None, since: int | None = None) -> list[dict]:
+        jobs = self.jobs_if_started
+        if jobs is None:
+            return []
+        if job_id is not None:
+            job = jobs.get(job_id)
+            return [job.to_dict(since)] if job is not None else []
+        return [job.to_dict(since) for job in jobs.jobs()]
+
+    def cancel_job(self, job_id: int | None = None) -> int:
+        """Cancel one background job by id, or every unfinished job; returns how many."""
+        jobs = self.jobs_if_started
+        if jobs is None:
+            return 0
+        if job_id is not None:
+            return int(jobs.cancel(job_id))
+        return jobs.cancel_all()
+
+    def close(self) -> None:
+        self.scheduler.close()
+        if self._jobs is not None:
+            self._jobs.cancel_all()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
+        if self._note_writer is not None:
+            self._note_writer.close()
+            self._note_writer = None
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="jane-actions", daemon=True).start()
+            return self._loop
+
+    def _pool_for(self, kind: str) -> ThreadPoolExecutor:
+        pool = self._pools.get(kind)
+        if pool is None:
+            pool = self._pools.setdefault(
+                kind,
+                ThreadPoolExecutor(max_workers=self.pool_limits.get(kind, 4), thread_name_prefix=f"jane-{kind}"),
             )
-        except Exception as exc:
-            return ActionResult(False, f"Failed to install {library}: {exc}")
-
-    def _shutdown_with_countdown(self, seconds: int) -> ActionResult:
-        for sec in range(seconds, 0, -1):
-            self.speaker(f"Shutdown in {sec}")
-            time.sleep(1)
-        self.speaker("System Black Out")
-
-        system = platform.system().lower()
-        if "windows" in system:
-            return self._run_with_admin(["shutdown", "/s", "/t", "0"], "Shutdown system")
-        if "darwin" in system:
-            return self._run_with_admin(["shutdown", "-h", "now"], "Shutdown system")
-        return self._run_with_admin(["shutdown", "now"], "Shutdown system")
-
-    def _open_target(self, target: str) -> ActionResult:
-        if not target:
-            return ActionResult(False, "Nothing to open.")
-        known_sites = {
-            "whatsapp": "https://web.whatsapp.com",
-            "youtube": "https://youtube.com",
-            "gmail": "https://mail.google.com",
-            "chrome": "https://www.google.com",
-        }
-        key = target.strip().lower()
-        if key in known_sites:
-            webbrowser.open(known_sites[key])
-            return ActionResult(True, f"Opening {key}.")
+        return pool
+
+    def _execute_cancellable(
+        self, cmd: ParsedCommand, cancel: threading.Event, sink: Callable[[str], None] | None = None
+    ) -> ActionResult:
+        self._local.cancel = cancel
+        self._local.sink = sink
+        try:
+            return self._execute_guarded(cmd)
+        finally:
+            self._local.cancel = None
+            self._local.sink = None
+
+    def _execute_guarded(self, cmd: ParsedCommand) -> ActionResult:
         try:
-            webbrowser.open(target)
-            return ActionResult(True, f"Attempting to open {target}.")
+            return self.execute(cmd)
         except Exception as exc:
-            return ActionResult(False, f"Open failed: {exc}")
-
-    def _save_note(self, note: str) -> ActionResult:
-        if not note:
-            return ActionResult(False, "Note text was empty.")
-        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with self.notes_file.open("a", encoding="utf-8") as fh:
-            fh.write(f"[{stamp}] {note}\n")
-        return ActionResult(True, "Note saved to jane_notes.txt")
-
-    def _open_system_app(self, candidates: list[str]) -> ActionResult:
-        system = platform.system().lower()
-        for cmd in candidates:
-            try:
-                if "windows" in system and cmd == "open -a Calculator":
-                    continue
-                if "windows" in system and cmd == "open -a TextEdit":
-                    continue
-                if "darwin" in system and cmd in {"calc", "gnome-calculator", "notepad", "gedit"}:
-                    continue
-                if " " in cmd:
-                    subprocess.Popen(cmd, shell=True)
-                else:
-                    subprocess.Popen([cmd])
-                return ActionResult(True, f"Launching app via: {cmd}")
-            except Exception:
-                continue
-        return ActionResult(False, "Unable to open requested app on this system.")
+            return ActionResult(False, f"{cmd.action} failed: {exc}")
+
+    def wait_or_cancelled(self, seconds: float) -> bool:
+        """Sleep for ``seconds``; return True early if the running async action was cancelled."""
+        cancel: threading.Event | None = getattr(self._local, "cancel", None)
+        if cancel is None:
+            time.sleep(seconds)
+            return False
+        return cancel.wait(seconds)
+
+    def cancelled(self) -> bool:
+        cancel: threading.Event | None = getattr(self._local, "cancel", None)
+        return cancel is not None and cancel.is_set()
+
+    @property
+    def chat_cache(self) -> ChatResponseCache | None:
+        # Opened on first use so constructing an executor never touches the disk.
+        if self._chat_cache is _DEFAULT:
+            from jane.chat_cache import chat_cache_from_env
+
+            self._chat_cache = chat_cache_from_env()
+        return self._chat_cache
+
+    @chat_cache.setter
+    def chat_cache(self, cache: ChatResponseCache | None) -> None:
+        self._chat_cache = cache
 
-    def _chat(self, prompt: str) -> ActionResult:
+    @property
+    def launchers(self) -> LauncherResolver:
+        # Built on first use: reading jane_apps.json is not free and most sessions never need it.
+        if self._launchers is None:
+            with self._loop_lock:
+                if self._launchers is None:
+                    from jane.launchers import LauncherResolver
+
+                    self._launchers = LauncherResolver.from_env()
+        return self._launchers
+
+    @launchers.setter
+    def launchers(self, launchers: LauncherResolver) -> None:
+        self._launchers = launchers
+
+    @property
+    def jobs(self) -> JobManager:
+        if self._jobs is None:
+            with self._loop_lock:
+                if self._jobs is None:
+                    from jane.jobs import job_manager_from_env
+
+                    self._jobs = job_manager_from_env()
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs: JobManager) -> None:
+        self._jobs = jobs
+
+    @property
+    def jobs_if_started(self) -> JobManager | None:
+        """The job manager, or None while no job has been started; never builds one (for pollers)."""
+        return self._jobs
+
+    @property
+    def notes_index(self) -> NotesIndex:
+        # Lives next to the notes file and follows it if ``notes_file`` is reassigned.
+        index = self._notes_index
+        if index is None or index.journal != self.notes_file:
+            with self._loop_lock:
+                from jane.notes import NotesIndex
+
+                index = self._notes_index
+                if index is None or index.journal != self.notes_file:
+                    index = self._notes_index = NotesIndex(self.notes_file, self.notes_file.with_suffix(".sqlite3"))
+        return index
+
+    @property
+    def note_writer(self) -> NoteWriter:
+        writer = self._note_writer
+        if writer is None or writer.path != self.notes_file:
+            with self._loop_lock:
+                writer = self._note_writer
+                if writer is None or writer.path != self.notes_file:
+                    from jane.notes import note_writer_from_env
+
+                    if writer is not None:
+                        writer.close()
+                    writer = self._note_writer = note_writer_from_env(self.notes_file)
+        return writer
+
+    def chat_cache_stats(self) -> dict:
+        cache = self.chat_cache
+        return cache.stats() if cache is not None else {"enabled": False}
+
+    def chat(self, prompt: str, priority: int = PRIORITY_INTERACTIVE) -> ActionResult:
         if not prompt:
             return ActionResult(True, "How can I assist you?")
+        from jane.chat_cache import cache_key, is_standalone_prompt
+
+        sink = getattr(self._local, "sink", None) or self.sentence_sink
+        cache = self.chat_cache if is_standalone_prompt(prompt) else None
+        if cache is not None:
+            cached = cache.get(self.gemini_model_name, prompt)
+            if cached is not None:
+                self.conversation.record(prompt, cached)
+                if sink is None:
+                    return ActionResult(True, cached)
+                for sentence in split_sentences(cached):
+                    sink(sentence)
+                return ActionResult(True, cached, streamed=True)
         if not self._ensure_gemini_ready():
             return ActionResult(
                 True,
@@ -202,53 +566,67 @@ class ActionExecutor:
             )
         if self.gemini_model is None:
             return ActionResult(True, "Gemini is not configured. Set GEMINI_API_KEY to enable AI chat.")
+        leader: list[bool] = []
+
+        def _generate() -> ActionResult:
+            leader.append(True)
+            return self._generate_reply(prompt, cache, sink)
+
         try:
-            response = self.gemini_model.generate_content(prompt)
-            text = getattr(response, "text", None) or "I could not generate a response."
-            return ActionResult(True, text)
+            key = cache_key(self.gemini_model_name, prompt)
+            result = self.chat_gateway.call(key, _generate, priority, self.cancelled)
+        except GatewayBusy:
+            return ActionResult(False, "I am handling too many questions right now. Please ask again in a moment.")
+        if leader or not result.streamed:
+            return result
+        # Coalesced onto another caller's request: its sentences went to that caller's sink.
+        if sink is None:
+            return ActionResult(result.ok, result.message)
+        for sentence in split_sentences(result.message):
+            sink(sentence)
+        return result
+
+    def _generate_reply(
+        self, prompt: str, cache: ChatResponseCache | None, sink: Callable[[str], None] | None
+    ) -> ActionResult:
+        try:
+            contents = self.conversation.build_contents(prompt)
+            if sink is None:
+                text = getattr(self.gemini_model.generate_content(contents), "text", None)
+            else:
+                text, complete = self._stream_reply(contents, sink)
+                if text and not complete:
+                    return ActionResult(False, text, streamed=True)
+            if not text:
+                return ActionResult(True, "I could not generate a response.")
+            self.conversation.record(prompt, text)
+            if cache is not None:
+                cache.put(self.gemini_model_name, prompt, text)
+            return ActionResult(True, text, streamed=sink is not None)
         except Exception as exc:
             return ActionResult(False, f"AI request failed: {exc}")
 
-    def _run_with_admin(self, command: list[str], reason: str, shell: bool = False, wait: bool = False) -> ActionResult:
-        system = platform.system().lower()
+    def _stream_reply(self, contents: list[dict], sink: Callable[[str], None]) -> tuple[str, bool]:
+        """Feed complete sentences to ``sink`` as chunks arrive; returns ``(text, complete)``.
 
-        try:
-            if "windows" in system:
-                cmdline = " ".join(shlex.quote(part) for part in command)
-                elevate = [
-                    "powershell",
-                    "-Command",
-                    f"Start-Process cmd -Verb RunAs -ArgumentList '/c {cmdline}'",
-                ]
-                proc = subprocess.Popen(elevate)
-                if wait:
-                    proc.wait()
-                return ActionResult(True, f"Admin request launched for: {reason}")
-
-            if "darwin" in system:
-                cmdline = " ".join(shlex.quote(part) for part in command)
-                osa = [
-                    "osascript",
-                    "-e",
-                    f'do shell script "{cmdline}" with administrator privileges',
-                ]
-                proc = subprocess.Popen(osa)
-                if wait:
-                    proc.wait()
-                return ActionResult(True, f"Admin request launched for: {reason}")
-
-            if shutil.which("pkexec"):
-                proc = subprocess.Popen(["pkexec", *command], shell=shell)
-                if wait:
-                    proc.wait()
-                return ActionResult(True, f"Admin request launched for: {reason}")
-
-            if shutil.which("sudo"):
-                proc = subprocess.Popen(["sudo", *command], shell=shell)
-                if wait:
-                    proc.wait()
-                return ActionResult(True, f"Admin request launched for: {reason}")
-
-            return ActionResult(False, f"Admin tools unavailable for: {reason}")
-        except Exception as exc:
-            return ActionResult(False, f"Admin execution failed for {reason}: {exc}")
+        Stops early, with ``complete`` False, once the running action is cancelled.
+        """
+        splitter = SentenceSplitter()
+        parts: list[str] = []
+        for chunk in self.gemini_model.generate_content(contents, stream=True):
+            if self.cancelled():
+                return "".join(parts), False
+            try:
+                piece = chunk.text
+            except ValueError:
+                # Chunks that only carry safety ratings or a finish reason have no text.
+                continue
+            if not piece:
+                continue
+            parts.append(piece)
+            for sentence in splitter.feed(piece):
+                sink(sentence)
+        tail = splitter.flush()
+        if tail:
+            sink(tail)
+        return "".join(parts), True
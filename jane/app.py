@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import threading
 from collections import deque
 from datetime import datetime
@@ -15,326 +16,20 @@ from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 
 from jane.actions import ActionExecutor
-from jane.commands import ParsedCommand, extract_wake_word_command, parse_command
+from jane.commands import (
+    ParsedCommand,
+    configure_parse_cache_from_env,
+    extract_wake_word_command,
+    parse_cache_stats,
+    plan_commands,
+)
 from jane.speech import SpeechEngine
+from jane.tts import PRIORITY_NORMAL, PRIORITY_URGENT, SpeechQueue
+from jane.wakeword import TemplateWakeWord, WakeWordListener, wake_word_file
 from jane.vision import capture_frame
 
 WAKE_WORD = "hey jane"
 KV_PATH = Path(__file__).with_name("ui.kv")
-from kivy.uix.button import Button
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
-from kivy.uix.popup import Popup
-from kivy.properties import BooleanProperty, StringProperty
-from kivy.uix.boxlayout import BoxLayout
-
-from jane.actions import ActionExecutor
-from jane.commands import ParsedCommand, parse_command
-from jane.speech import SpeechEngine
-from jane.vision import capture_frame
-
-KV = '''
-#:import dp kivy.metrics.dp
-
-<AssistantRoot>:
-    orientation: 'vertical'
-    padding: dp(16)
-    spacing: dp(12)
-    canvas.before:
-        Color:
-            rgba: 0.03, 0.04, 0.09, 1
-<AssistantRoot>:
-    orientation: 'vertical'
-    spacing: dp(10)
-    padding: dp(12)
-    canvas.before:
-        Color:
-            rgba: 0.07, 0.08, 0.1, 1
-        Rectangle:
-            pos: self.pos
-            size: self.size
-
-    BoxLayout:
-        size_hint_y: None
-        height: dp(92)
-        spacing: dp(12)
-        padding: dp(14)
-        canvas.before:
-            Color:
-                rgba: 0.08, 0.12, 0.22, 1
-            RoundedRectangle:
-                pos: self.pos
-                size: self.size
-                radius: [18, 18, 18, 18]
-
-        BoxLayout:
-            orientation: 'vertical'
-            Label:
-                text: root.title_text
-                color: 0.34, 0.90, 1, 1
-                font_size: '31sp'
-                bold: True
-                halign: 'left'
-                text_size: self.size
-            Label:
-                text: root.subtitle_text
-                color: 0.76, 0.83, 0.97, 1
-                font_size: '14sp'
-                halign: 'left'
-                text_size: self.size
-
-        BoxLayout:
-            orientation: 'vertical'
-            size_hint_x: None
-            width: dp(310)
-            Label:
-                text: 'Operational Status'
-                color: 0.66, 0.79, 1, 1
-                font_size: '13sp'
-                halign: 'right'
-                text_size: self.size
-            Label:
-                text: root.status_text
-                color: 0.97, 0.98, 1, 1
-                bold: True
-                font_size: '15sp'
-                halign: 'right'
-                text_size: self.size
-
-    BoxLayout:
-        spacing: dp(12)
-
-        BoxLayout:
-            orientation: 'vertical'
-            spacing: dp(10)
-
-            BoxLayout:
-                size_hint_y: None
-                height: dp(52)
-                spacing: dp(8)
-                TextInput:
-                    id: user_input
-                    multiline: False
-                    hint_text: 'Type command for JANE...'
-                    background_color: 0.1, 0.13, 0.21, 1
-                    foreground_color: 0.94, 0.98, 1, 1
-                    cursor_color: 0.33, 0.93, 1, 1
-                    padding: dp(12), dp(14)
-                    on_text_validate: root.submit_text_command()
-                Button:
-                    text: 'Execute'
-                    size_hint_x: None
-                    width: dp(120)
-                    background_normal: ''
-                    background_color: 0.26, 0.87, 1, 1
-                    color: 0.03, 0.08, 0.13, 1
-                    bold: True
-                    on_release: root.submit_text_command()
-
-            BoxLayout:
-                size_hint_y: None
-                height: dp(40)
-                spacing: dp(8)
-                Button:
-                    text: 'What Time'
-                    background_normal: ''
-                    background_color: 0.18, 0.65, 1, 1
-                    on_release: root.run_quick('what time is it')
-                Button:
-                    text: 'Open WhatsApp'
-                    background_normal: ''
-                    background_color: 0.27, 0.77, 0.62, 1
-                    on_release: root.run_quick('open chrome and open whatsapp')
-                Button:
-                    text: 'Open Calculator'
-                    background_normal: ''
-                    background_color: 0.60, 0.67, 1, 1
-                    on_release: root.run_quick('open calculator')
-
-            TextInput:
-                id: log_view
-                text: root.log_text
-                readonly: True
-                background_color: 0.06, 0.08, 0.14, 1
-                foreground_color: 0.89, 0.94, 1, 1
-
-            BoxLayout:
-                size_hint_y: None
-                height: dp(40)
-                spacing: dp(8)
-                Button:
-                    text: 'Export Logs'
-                    background_normal: ''
-                    background_color: 0.83, 0.74, 0.34, 1
-                    color: 0.14, 0.10, 0.02, 1
-                    on_release: root.export_logs()
-                Button:
-                    text: 'Clear Console'
-                    background_normal: ''
-                    background_color: 0.94, 0.45, 0.50, 1
-                    color: 0.14, 0.03, 0.05, 1
-                    on_release: root.clear_logs()
-
-        BoxLayout:
-            orientation: 'vertical'
-            size_hint_x: None
-            width: dp(292)
-            spacing: dp(10)
-
-            BoxLayout:
-                orientation: 'vertical'
-                size_hint_y: None
-                height: dp(178)
-                padding: dp(12)
-                spacing: dp(8)
-                canvas.before:
-                    Color:
-                        rgba: 0.09, 0.13, 0.21, 1
-                    RoundedRectangle:
-                        pos: self.pos
-                        size: self.size
-                        radius: [16, 16, 16, 16]
-                Label:
-                    text: 'Core Controls'
-                    color: 0.65, 0.84, 1, 1
-                    bold: True
-                Button:
-                    text: '🎤 Voice Listen'
-                    background_normal: ''
-                    background_color: 0.35, 0.86, 0.72, 1
-                    color: 0.03, 0.10, 0.08, 1
-                    on_release: root.listen_voice()
-                Button:
-                    text: '📷 Vision Capture'
-                    background_normal: ''
-                    background_color: 0.57, 0.75, 1, 1
-                    color: 0.03, 0.07, 0.12, 1
-                    on_release: root.capture_vision()
-                Label:
-                    text: 'Queued High-Risk: ' + str(root.pending_count)
-                    color: 0.95, 0.83, 0.50, 1
-
-            BoxLayout:
-                orientation: 'vertical'
-                size_hint_y: None
-                height: dp(170)
-                padding: dp(12)
-                spacing: dp(8)
-                canvas.before:
-                    Color:
-                        rgba: 0.16, 0.12, 0.12, 1
-                    RoundedRectangle:
-                        pos: self.pos
-                        size: self.size
-                        radius: [16, 16, 16, 16]
-
-                Label:
-                    text: 'High Risk Command Gate'
-                    color: 1, 0.86, 0.75, 1
-                    bold: True
-                Button:
-                    text: '✅ Grant Approval'
-                    disabled: not root.has_pending_risk
-                    background_normal: ''
-                    background_color: 0.97, 0.80, 0.36, 1
-                    color: 0.16, 0.10, 0.02, 1
-                    on_release: root.approve_pending()
-                Button:
-                    text: '❌ Deny Approval'
-                    disabled: not root.has_pending_risk
-                    background_normal: ''
-                    background_color: 0.97, 0.48, 0.56, 1
-                    color: 0.17, 0.03, 0.06, 1
-                    on_release: root.deny_pending()
-
-            BoxLayout:
-                orientation: 'vertical'
-                padding: dp(12)
-                spacing: dp(6)
-                canvas.before:
-                    Color:
-                        rgba: 0.08, 0.10, 0.17, 1
-                    RoundedRectangle:
-                        pos: self.pos
-                        size: self.size
-                        radius: [16, 16, 16, 16]
-                Label:
-                    text: 'Quick Notes'
-                    color: 0.72, 0.86, 1, 1
-                    bold: True
-                TextInput:
-                    id: note_input
-                    hint_text: 'Type note and click Save Note'
-                    multiline: True
-                    background_color: 0.1, 0.13, 0.2, 1
-                    foreground_color: 0.95, 0.98, 1, 1
-                Button:
-                    text: 'Save Note'
-                    background_normal: ''
-                    background_color: 0.40, 0.78, 1, 1
-                    color: 0.03, 0.08, 0.12, 1
-                    on_release: root.save_note_from_ui()
-    Label:
-        text: root.title_text
-        font_size: '26sp'
-        bold: True
-        color: 0.3, 0.85, 1, 1
-        size_hint_y: None
-        height: dp(44)
-
-    Label:
-        text: root.subtitle_text
-        color: 0.75, 0.78, 0.82, 1
-        size_hint_y: None
-        height: dp(28)
-
-    TextInput:
-        id: log_view
-        text: root.log_text
-        readonly: True
-        background_color: 0.12, 0.13, 0.16, 1
-        foreground_color: 0.9, 0.92, 0.97, 1
-
-    BoxLayout:
-        size_hint_y: None
-        height: dp(46)
-        spacing: dp(8)
-        TextInput:
-            id: user_input
-            multiline: False
-            hint_text: 'Type a command for JANE...'
-            background_color: 0.14, 0.15, 0.2, 1
-            foreground_color: 1, 1, 1, 1
-            on_text_validate: root.submit_text_command()
-        Button:
-            text: 'Send'
-            on_release: root.submit_text_command()
-
-    BoxLayout:
-        size_hint_y: None
-        height: dp(46)
-        spacing: dp(8)
-        Button:
-            text: '🎤 Listen'
-            on_release: root.listen_voice()
-        Button:
-            text: '📷 Capture Vision Frame'
-            on_release: root.capture_vision()
-
-    BoxLayout:
-        size_hint_y: None
-        height: dp(46)
-        spacing: dp(8)
-        opacity: 1 if root.has_pending_risk else 0.2
-        Button:
-            text: '✅ Grant Selected'
-            disabled: not root.has_pending_risk
-            on_release: root.approve_pending()
-        Button:
-            text: '❌ Deny Selected'
-            disabled: not root.has_pending_risk
-            on_release: root.deny_pending()
-'''
 
 
 class AssistantRoot(BoxLayout):
@@ -345,44 +40,94 @@ class AssistantRoot(BoxLayout):
     log_text = StringProperty("[BOOT] JANE core is online.\n")
     has_pending_risk = BooleanProperty(False)
     pending_count = NumericProperty(0)
-    log_text = StringProperty("[BOOT] JANE core is online.\n")
-    has_pending_risk = BooleanProperty(False)
-    pending_count = NumericProperty(0)
-    log_text = StringProperty("[BOOT] JANE is online.\n")
-    has_pending_risk = BooleanProperty(False)
+    scheduled_count = NumericProperty(0)
+    active_jobs = NumericProperty(0)
+    always_listening = BooleanProperty(False)
+    jobs_text = StringProperty("Jobs: idle")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.speech = SpeechEngine()
-        self.executor = ActionExecutor(self.safe_speak)
+        self.voice = SpeechQueue(
+            self.speech.speak,
+            interrupt=self.speech.stop_speaking,
+            on_error=lambda exc: Clock.schedule_once(lambda *_: self.append_log(f"[WARN] TTS failed: {exc}"), 0),
+        )
+        self.executor = ActionExecutor(self.speak_soon)
+        self.executor.sentence_sink = self.speak_streamed
+        self.executor.urgent_speaker = lambda text, key: self.speak_soon(text, PRIORITY_URGENT, key)
         self.pending: deque[ParsedCommand] = deque()
         self.risk_popup: Popup | None = None
+        # Last output line already copied into the console, per background job.
+        self._job_cursors: dict[int, int] = {}
+        self.wake_detector = TemplateWakeWord.load(wake_word_file())
+        self.wake_listener: WakeWordListener | None = None
+        configure_parse_cache_from_env()
+        Clock.schedule_interval(self._refresh_scheduled, 1)
+        Clock.schedule_interval(self._refresh_jobs, 0.5)
         self.safe_speak("Hello, I am JANE. Say 'Hey Jane' before voice commands.")
-        self.safe_speak("Hello, I am JANE. Premium desktop interface initialized.")
-        self.safe_speak("Hello, I am JANE. How can I assist you today?")
 
     def append_log(self, line: str) -> None:
         self.log_text += line + "\n"
 
-    def safe_speak(self, text: str) -> None:
+    def safe_speak(self, text: str, priority: int = PRIORITY_NORMAL, key: str | None = None) -> None:
         self.append_log(f"JANE: {text}")
+        self.voice.say(text, priority, key=key)
 
-        def _speak() -> None:
-            try:
-                self.speech.speak(text)
-            except Exception as exc:  # noqa: BLE001
-        def _speak():
-            try:
-                self.speech.speak(text)
-            except Exception as exc:
-                Clock.schedule_once(lambda *_: self.append_log(f"[WARN] TTS failed: {exc}"), 0)
+    def speak_soon(self, text: str, priority: int = PRIORITY_NORMAL, key: str | None = None) -> None:
+        # The executor speaks from scheduler, job and worker threads; log_text may only change on
+        # the Kivy main thread, so hop there first.
+        Clock.schedule_once(lambda *_: self.safe_speak(text, priority, key), 0)
 
-        threading.Thread(target=_speak, daemon=True).start()
+    def speak_streamed(self, sentence: str) -> None:
+        # Called from the chat worker for each sentence as it arrives. The queue keeps them in
+        # order; they never go stale or supersede each other, since each one is part of the answer.
+        Clock.schedule_once(lambda *_: self.append_log(f"JANE: {sentence}"), 0)
+        self.voice.say(sentence, PRIORITY_NORMAL, max_age=None, coalesce=False)
 
     def _refresh_pending_flags(self) -> None:
         self.pending_count = len(self.pending)
         self.has_pending_risk = self.pending_count > 0
 
+    def _refresh_scheduled(self, *_args) -> None:
+        self.scheduled_count = len(self.executor.scheduler.pending())
+
+    def cancel_scheduled(self) -> None:
+        items = self.executor.scheduled()
+        cancelled = self.executor.cancel_scheduled()
+        for item in items:
+            self.append_log(f"[CANCELLED] {item['kind']}: {item['label']}")
+        self._refresh_scheduled()
+        self.safe_speak(f"Cancelled {cancelled} scheduled item(s)." if cancelled else "Nothing is scheduled.")
+
+    def _refresh_jobs(self, *_args) -> None:
+        summary = []
+        # Polled twice a second from startup: must not build the job manager before it is needed.
+        manager = self.executor.jobs_if_started
+        for job in manager.jobs() if manager is not None else ():
+            cursor = self._job_cursors.get(job.id)
+            if cursor is None and job.done:
+                continue
+            for line in job.output(cursor or 0):
+                self.append_log(f"[JOB {job.id}] {line['text']}")
+                cursor = line["n"]
+            if job.done:
+                self._job_cursors.pop(job.id, None)
+                self.append_log(f"[JOB {job.id}] {job.label}: {job.status}")
+                continue
+            self._job_cursors[job.id] = cursor or 0
+            progress = f" {job.progress:.0%}" if job.progress is not None else ""
+            summary.append(f"#{job.id} {job.status}{progress}")
+        self.active_jobs = len(summary)
+        self.jobs_text = "Jobs: " + (", ".join(summary) if summary else "idle")
+
+    def cancel_jobs(self) -> None:
+        cancelled = self.executor.cancel_job()
+        if not cancelled:
+            self.safe_speak("No background jobs could be cancelled.")
+            return
+        self.safe_speak(f"Cancelling {cancelled} background job(s).")
+
     def run_quick(self, command: str) -> None:
         self.process_command(command)
 
@@ -402,6 +147,66 @@ class AssistantRoot(BoxLayout):
         path.write_text(self.log_text, encoding="utf-8")
         self.append_log(f"[INFO] Logs exported to {path}")
 
+    def show_stats(self) -> None:
+        stats = parse_cache_stats()
+        if not stats["enabled"]:
+            self.append_log("[STATS] Parse cache: disabled")
+        else:
+            self.append_log(
+                "[STATS] Parse cache: "
+                f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions, "
+                f"{stats['size']}/{stats['maxsize']} entries, hit rate {stats['hit_rate']:.1%}"
+            )
+
+        stats = self.executor.chat_cache_stats()
+        if not stats["enabled"]:
+            self.append_log("[STATS] Chat cache: disabled")
+        else:
+            self.append_log(
+                "[STATS] Chat cache: "
+                f"{stats['hits']} hits, {stats['misses']} misses, {stats['expired']} expired, "
+                f"{stats['evictions']} evictions, {stats['entries']} entries, hit rate {stats['hit_rate']:.1%}"
+            )
+
+        for job in self.executor.job_status():
+            progress = f", {job['progress']:.0%}" if job["progress"] is not None else ""
+            self.append_log(f"[JOB] #{job['id']} {job['label']}: {job['status']}{progress}, {job['elapsed']}s")
+
+        stats = self.voice.stats()
+        self.append_log(
+            "[STATS] Speech queue: "
+            f"{stats['depth']} queued, {stats['spoken']} spoken, {stats['coalesced']} coalesced, "
+            f"{stats['duplicates']} duplicates, {stats['stale']} stale, {stats['overflow']} overflow, "
+            f"{stats['interrupted']} interrupted, wait p50 {stats['wait']['p50_ms']:.0f} ms / "
+            f"p99 {stats['wait']['p99_ms']:.0f} ms"
+        )
+
+        stats = self.speech.recognizer.stats()
+        for backend in stats.get("backends", [stats]):
+            load = f", model load {backend['load_ms']} ms" if backend["load_ms"] is not None else ""
+            self.append_log(
+                f"[STATS] Speech recognition ({backend['backend']}): {backend['calls']} calls, "
+                f"p50 {backend['p50_ms']:.0f} ms, p99 {backend['p99_ms']:.0f} ms, {backend['errors']} errors{load}"
+            )
+
+        if self.wake_listener is not None:
+            stats = self.wake_listener.stats()
+            self.append_log(
+                "[STATS] Wake word: "
+                f"{stats['gated_seconds']}s heard, {stats['segments']} speech segments, {stats['wakes']} wakes, "
+                f"{stats['recognizer_calls']} recognizer calls"
+            )
+
+        for item in self.executor.scheduled():
+            self.append_log(f"[SCHEDULED] #{item['id']} {item['kind']}: {item['label']} at {item['due_at']}")
+
+        stats = self.executor.chat_gateway.stats()
+        self.append_log(
+            "[STATS] Chat gateway: "
+            f"{stats['calls']} calls, {stats['coalesced']} coalesced, {stats['throttled']} throttled, "
+            f"{stats['rejected']} rejected, {stats['active']} active, {stats['waiting']} waiting"
+        )
+
     def submit_text_command(self) -> None:
         user_input = self.ids.user_input
         text = user_input.text.strip()
@@ -417,18 +222,79 @@ class AssistantRoot(BoxLayout):
                 transcript = self.speech.listen_once()
                 Clock.schedule_once(lambda *_: self._handle_voice_transcript(transcript), 0)
             except Exception as exc:  # noqa: BLE001
-        self.append_log("[VOICE] Listening...")
-
-        def _listen():
-            try:
-                recognized = self.speech.listen_once()
-                Clock.schedule_once(lambda *_: self.process_command(recognized), 0)
-            except Exception as exc:
                 Clock.schedule_once(lambda *_: self.append_log(f"[WARN] STT failed: {exc}"), 0)
 
         threading.Thread(target=_listen, daemon=True).start()
 
+    def toggle_always_listen(self) -> None:
+        if self.wake_listener is not None and self.wake_listener.running:
+            self.wake_listener.stop()
+            self.always_listening = False
+            self.append_log("[VOICE] Always-on listening stopped.")
+            return
+        if not self.wake_detector.ready:
+            self.safe_speak("Train the wake word first, then turn always-on listening on.")
+            return
+        try:
+            if self.wake_listener is None:
+
+                def _log(line: str) -> None:
+                    Clock.schedule_once(lambda *_: self.append_log(line), 0)
+
+                self.wake_listener = WakeWordListener(
+                    self.speech.capture,
+                    self.wake_detector,
+                    self.speech.recognize,
+                    on_command=lambda text: Clock.schedule_once(lambda *_: self._handle_wake_command(text), 0),
+                    on_wake=lambda: _log("[VOICE] Wake word heard."),
+                    on_error=lambda exc: _log(f"[WARN] Voice input failed: {exc}"),
+                    on_stopped=lambda exc: Clock.schedule_once(lambda *_: self._wake_listener_stopped(exc), 0),
+                )
+            self.wake_listener.start()
+        except Exception as exc:  # noqa: BLE001
+            self.append_log(f"[WARN] Microphone unavailable: {exc}")
+            return
+        self.always_listening = True
+        self.append_log("[VOICE] Always-on listening: say 'Hey Jane' and then your command.")
+
+    def train_wake_word(self, samples: int = 3) -> None:
+        """Record the user saying the wake word a few times and save them as matching templates."""
+        detector = TemplateWakeWord()
+
+        def _train() -> None:
+            try:
+                for index in range(1, samples + 1):
+                    prompt = f"[VOICE] Say 'Hey Jane' ({index}/{samples})"
+                    Clock.schedule_once(lambda *_, line=prompt: self.append_log(line), 0)
+                    detector.enroll(self.speech.capture.listen(timeout=8, phrase_time_limit=2.5))
+                detector.save(wake_word_file())
+            except Exception as exc:  # noqa: BLE001
+                Clock.schedule_once(lambda *_: self.append_log(f"[WARN] Wake word training failed: {exc}"), 0)
+                return
+            Clock.schedule_once(lambda *_: self._wake_word_trained(detector), 0)
+
+        threading.Thread(target=_train, daemon=True).start()
+
+    def _wake_word_trained(self, detector: TemplateWakeWord) -> None:
+        self.wake_detector = detector
+        if self.wake_listener is not None:
+            self.wake_listener.detector = detector
+        self.safe_speak("Wake word saved.")
+
+    def _wake_listener_stopped(self, exc: Exception) -> None:
+        self.always_listening = False
+        self.append_log(f"[WARN] Always-on listening stopped, microphone unavailable: {exc}")
+
+    def _handle_wake_command(self, transcript: str) -> None:
+        self.append_log(f"Heard: {transcript}")
+        # The recognizer sometimes still hears the tail of the wake word.
+        command = extract_wake_word_command(transcript, WAKE_WORD)
+        self.process_command(transcript if command is None else command)
+
     def _handle_voice_transcript(self, transcript: str) -> None:
+        if not transcript:
+            self.safe_speak("Sorry, I did not catch that.")
+            return
         self.append_log(f"Heard: {transcript}")
         command = extract_wake_word_command(transcript, WAKE_WORD)
         if command is None:
@@ -439,31 +305,34 @@ class AssistantRoot(BoxLayout):
             return
         self.process_command(command)
 
-
     def process_command(self, text: str) -> None:
         self.append_log(f"You: {text}")
-        parsed = parse_command(text)
-        if parsed.action == "empty":
-            return
-
-        if parsed.high_risk:
-            self.pending.append(parsed)
-            self._refresh_pending_flags()
-            self.safe_speak(f"High-risk command queued for approval: {parsed.raw}")
-            self.show_risk_popup(parsed)
-            self.has_pending_risk = True
-            self.safe_speak(f"High-risk command queued for approval: {parsed.raw}")
-            return
-
-        self.run_command(parsed)
+        runnable: list[ParsedCommand] = []
+        for parsed in plan_commands(text):
+            if self.executor.requires_approval(parsed):
+                self.pending.append(parsed)
+                self._refresh_pending_flags()
+                self.safe_speak(f"High-risk command queued for approval: {parsed.raw}")
+                self.show_risk_popup(parsed)
+            else:
+                runnable.append(parsed)
+
+        if runnable:
+            self.run_commands(runnable)
 
     def run_command(self, parsed: ParsedCommand) -> None:
-        def _run() -> None:
-        def _run():
-            result = self.executor.execute(parsed)
-            Clock.schedule_once(lambda *_: self.safe_speak(result.message), 0)
+        self.run_commands([parsed])
+
+    def run_commands(self, commands: list[ParsedCommand]) -> None:
+        def _done(future) -> None:
+            if future.cancelled():
+                Clock.schedule_once(lambda *_: self.append_log("[INFO] Command cancelled."), 0)
+                return
+            result = future.result()
+            if not result.streamed:
+                Clock.schedule_once(lambda *_: self.safe_speak(result.message), 0)
 
-        threading.Thread(target=_run, daemon=True).start()
+        self.executor.submit_many(commands).add_done_callback(_done)
 
     def approve_pending(self) -> None:
         if not self.pending:
@@ -474,13 +343,26 @@ class AssistantRoot(BoxLayout):
         self._refresh_pending_flags()
         self.append_log(f"[APPROVED] {command.raw}")
         self.dismiss_risk_popup()
-            self.has_pending_risk = False
-            return
-        command = self.pending.popleft()
-        self.has_pending_risk = bool(self.pending)
-        self.append_log(f"[APPROVED] {command.raw}")
         self.run_command(command)
 
+    def approve_all_pending(self) -> None:
+        commands = list(self.pending)
+        self.pending.clear()
+        self._refresh_pending_flags()
+        self.dismiss_risk_popup()
+        if not commands:
+            return
+        for command in commands:
+            self.append_log(f"[APPROVED] {command.raw}")
+
+        def _done(future) -> None:
+            if future.cancelled():
+                return
+            for command, result in zip(commands, future.result()):
+                Clock.schedule_once(lambda *_, c=command, r=result: self.safe_speak(f"{c.raw}: {r.message}"), 0)
+
+        self.executor.submit_approved(commands).add_done_callback(_done)
+
     def deny_pending(self) -> None:
         if not self.pending:
             self._refresh_pending_flags()
@@ -513,8 +395,6 @@ class AssistantRoot(BoxLayout):
         )
 
         action_row = BoxLayout(size_hint_y=None, height=46, spacing=10)
-        grant_btn = Button(text="✅ Grant Once")
-        deny_btn = Button(text="❌ Deny")
         grant_btn = Button(
             text="✅ Grant Once",
             background_normal="",
@@ -537,7 +417,6 @@ class AssistantRoot(BoxLayout):
             title="JANE Security Approval",
             content=content,
             size_hint=(0.66, 0.42),
-            size_hint=(0.65, 0.42),
             auto_dismiss=False,
         )
         self.risk_popup.open()
@@ -548,18 +427,6 @@ class AssistantRoot(BoxLayout):
                 path = capture_frame()
                 Clock.schedule_once(lambda *_: self.safe_speak(f"Vision frame saved: {path}"), 0)
             except Exception as exc:  # noqa: BLE001
-            self.has_pending_risk = False
-            return
-        command = self.pending.popleft()
-        self.has_pending_risk = bool(self.pending)
-        self.safe_speak(f"Denied: {command.raw}")
-
-    def capture_vision(self) -> None:
-        def _capture():
-            try:
-                path = capture_frame()
-                Clock.schedule_once(lambda *_: self.safe_speak(f"Vision frame saved: {path}"), 0)
-            except Exception as exc:
                 Clock.schedule_once(lambda *_: self.append_log(f"[WARN] Vision capture failed: {exc}"), 0)
 
         threading.Thread(target=_capture, daemon=True).start()
@@ -568,5 +435,18 @@ class AssistantRoot(BoxLayout):
 class JaneApp(App):
     def build(self):
         Builder.load_file(str(KV_PATH))
-        Builder.load_string(KV)
         return AssistantRoot()
+
+    def on_start(self):
+        # Warm the Gemini client once the window is up instead of on the startup path.
+        Clock.schedule_once(lambda *_: self.root.executor.warm_up(), 0)
+        Clock.schedule_once(lambda *_: self.root.speech.warm_up(), 0)
+        if os.getenv("JANE_ALWAYS_LISTEN", "").strip() == "1":
+            Clock.schedule_once(lambda *_: self.root.toggle_always_listen(), 0)
+
+    def on_stop(self):
+        self.root.executor.close()
+        if self.root.wake_listener is not None:
+            self.root.wake_listener.close()
+        self.root.voice.close()
+        self.root.speech.close()
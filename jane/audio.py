@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import math
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Protocol
+
+from jane.config import env_float
+
+_TYPECODES = {1: "b", 2: "h", 4: "i"}
+
+
+def rms(data: bytes, sample_width: int = 2) -> float:
+    """Root-mean-square energy of little-endian signed PCM, on the same scale SpeechRecognition uses."""
+    samples = array(_TYPECODES[sample_width])
+    samples.frombytes(data[: len(data) - len(data) % sample_width])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+
+@dataclass(frozen=True)
+class AudioClip:
+    data: bytes
+    sample_rate: int
+    sample_width: int
+
+    @property
+    def duration(self) -> float:
+        return len(self.data) / (self.sample_rate * self.sample_width)
+
+    def to_audio_data(self):
+        import speech_recognition as sr
+
+        return sr.AudioData(self.data, self.sample_rate, self.sample_width)
+
+
+class ListenTimeout(TimeoutError):
+    """Nobody started speaking before the listen timeout."""
+
+
+class AudioSource(Protocol):
+    sample_rate: int
+    sample_width: int
+    chunk: int
+
+    def open(self) -> None: ...
+
+    def read(self) -> bytes: ...
+
+    def close(self) -> None: ...
+
+
+class MicrophoneSource:
+    """The default input device through SpeechRecognition's PyAudio wrapper, opened once."""
+
+    def __init__(self, device_index: int | None = None, sample_rate: int | None = None, chunk: int = 1024) -> None:
+        import speech_recognition as sr
+
+        self._mic = sr.Microphone(device_index=device_index, sample_rate=sample_rate, chunk_size=chunk)
+        self.sample_rate = self._mic.SAMPLE_RATE
+        self.sample_width = self._mic.SAMPLE_WIDTH
+        self.chunk = self._mic.CHUNK
+
+    def open(self) -> None:
+        self._mic.__enter__()
+
+    def read(self) -> bytes:
+        return self._mic.stream.read(self.chunk)
+
+    def close(self) -> None:
+        self._mic.__exit__(None, None, None)
+
+
+class CaptureSession:
+    """Keeps one audio device open and listens on it without per-call calibration.
+
+    A reader thread pulls chunks continuously. It tracks the noise floor (a low percentile of
+    recent chunk energies) and recalibrates the speech threshold from it every
+    ``recalibrate_every`` seconds, or straight away when the floor drifts by ``drift_ratio``.
+    ``listen`` attaches to the running stream, so it starts capturing immediately and includes a
+    short pre-roll from just before speech began.
+
+    If the device fails, the reader stops and keeps the exception in ``error``; ``listen`` raises
+    it, and the next ``start`` (which ``listen`` and ``subscribe`` call) reopens the device.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        recalibrate_every: float = 30.0,
+        drift_ratio: float = 2.0,
+        window: float = 3.0,
+        multiplier: float = 2.0,
+        min_threshold: float = 50.0,
+        pause: float = 0.8,
+        pre_roll: float = 0.3,
+    ) -> None:
+        self.source = source
+        self.recalibrate_every = recalibrate_every
+        self.drift_ratio = drift_ratio
+        self.multiplier = multiplier
+        self.min_threshold = min_threshold
+        self.pause = pause
+        self.energy_threshold = 300.0
+        self.ambient: float | None = None
+        self.calibrations = 0
+        self.drift_calibrations = 0
+        self.listens = 0
+        self.chunks = 0
+        self._seconds_per_chunk = source.chunk / source.sample_rate
+        self._energies: deque[float] = deque(maxlen=max(4, int(window / self._seconds_per_chunk)))
+        self._recent: deque[bytes] = deque(maxlen=max(1, int(pre_roll / self._seconds_per_chunk)))
+        self._calibrated_at = 0.0
+        self._listeners: list[queue.Queue] = []
+        self._capturing = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.error: Exception | None = None
+
+    def start(self) -> CaptureSession:
+        with self._lock:
+            if self._thread is None:
+                self.source.open()
+                self.error = None
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="jane-capture", daemon=True)
+                self._thread.start()
+        return self
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+            self.source.close()
+
+    def listen(self, timeout: float | None = 5, phrase_time_limit: float | None = 8) -> AudioClip:
+        """Wait for speech and return it up to the first ``pause`` seconds of silence.
+
+        Raises ``ListenTimeout`` if nobody speaks in time, or the device's own error if reading fails.
+        """
+        with self._lock:
+            pre_roll = list(self._recent)
+        chunks = self.subscribe()
+        self.listens += 1
+        try:
+            frames = self._capture(chunks, pre_roll, timeout, phrase_time_limit)
+        finally:
+            self.unsubscribe(chunks)
+        return AudioClip(b"".join(frames), self.source.sample_rate, self.source.sample_width)
+
+    def subscribe(self, maxsize: int = 1024) -> queue.Queue[bytes]:
+        """A queue that receives every chunk read from now on; chunks are dropped while it is full."""
+        self.start()
+        chunks: queue.Queue[bytes] = queue.Queue(maxsize=maxsize)
+        with self._lock:
+            self._listeners.append(chunks)
+        return chunks
+
+    def unsubscribe(self, chunks: queue.Queue[bytes]) -> None:
+        with self._lock:
+            if chunks in self._listeners:
+                self._listeners.remove(chunks)
+
+    def hold_calibration(self, hold: bool) -> None:
+        """Pause (or resume) recalibration while a consumer is inside an utterance."""
+        with self._lock:
+            self._capturing += 1 if hold else -1
+
+    def stats(self) -> dict[str, float | int | None]:
+        return {
+            "threshold": round(self.energy_threshold, 1),
+            "ambient": round(self.ambient, 1) if self.ambient is not None else None,
+            "calibrations": self.calibrations,
+            "drift_calibrations": self.drift_calibrations,
+            "listens": self.listens,
+            "chunks": self.chunks,
+        }
+
+    def process(self, chunk: bytes) -> float:
+        """Account for one chunk from the device; the reader thread calls this for every read."""
+        energy = rms(chunk, self.source.sample_width)
+        self.chunks += 1
+        with self._lock:
+            self._recent.append(chunk)
+            listeners = list(self._listeners)
+            capturing = self._capturing
+        for listener in listeners:
+            try:
+                listener.put_nowait(chunk)
+            except queue.Full:
+                pass
+        self._energies.append(energy)
+        # Sampling the floor mid-phrase would calibrate against the user's own voice.
+        if not capturing and self.chunks % 8 == 0 and len(self._energies) == self._energies.maxlen:
+            self._maybe_recalibrate()
+        return energy
+
+    def recalibrate(self) -> float:
+        """Set the speech threshold from the current noise floor; returns the new threshold."""
+        floor = self._floor()
+        self.ambient = floor
+        self.energy_threshold = max(self.min_threshold, floor * self.multiplier)
+        self.calibrations += 1
+        self._calibrated_at = time.monotonic()
+        return self.energy_threshold
+
+    def _maybe_recalibrate(self) -> None:
+        if self.ambient is None or time.monotonic() - self._calibrated_at >= self.recalibrate_every:
+            self.recalibrate()
+            return
+        floor = self._floor()
+        low, high = sorted((max(floor, 1.0), max(self.ambient, 1.0)))
+        if high / low >= self.drift_ratio:
+            self.drift_calibrations += 1
+            self.recalibrate()
+
+    def _floor(self) -> float:
+        ordered = sorted(self._energies)
+        return ordered[len(ordered) // 5] if ordered else 0.0
+
+    def _capture(
+        self, chunks: queue.Queue[bytes], pre_roll: list[bytes], timeout: float | None, phrase_time_limit: float | None
+    ) -> list[bytes]:
+        width = self.source.sample_width
+        started = time.monotonic()
+        frames = deque(pre_roll, maxlen=len(pre_roll) + 1)
+        while True:
+            wait = None if timeout is None else timeout - (time.monotonic() - started)
+            if wait is not None and wait <= 0:
+                raise ListenTimeout("Listening timed out while waiting for phrase to start.")
+            try:
+                chunk = chunks.get(timeout=0.25 if wait is None else min(wait, 0.25))
+            except queue.Empty:
+                self.raise_error()
+                continue
+            frames.append(chunk)
+            if rms(chunk, width) > self.energy_threshold:
+                break
+
+        self.hold_calibration(True)
+        try:
+            captured = list(frames)
+            spoken = quiet = 0.0
+            while quiet < self.pause and (phrase_time_limit is None or spoken < phrase_time_limit):
+                chunk = chunks.get(timeout=max(1.0, 10 * self._seconds_per_chunk))
+                captured.append(chunk)
+                spoken += self._seconds_per_chunk
+                quiet = 0.0 if rms(chunk, width) > self.energy_threshold else quiet + self._seconds_per_chunk
+        except queue.Empty:
+            self.raise_error()
+        finally:
+            self.hold_calibration(False)
+        return captured
+
+    def raise_error(self) -> None:
+        """Re-raise the device error that stopped the reader, if there is one."""
+        error = self.error
+        if error is not None:
+            raise error
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                chunk = self.source.read()
+            except Exception as exc:  # noqa: BLE001
+                self.error = exc
+                self._abandon()
+                return
+            self.process(chunk)
+
+    def _abandon(self) -> None:
+        # The device failed: release it so the next start() reopens it, unless close() already has.
+        with self._lock:
+            owned = self._thread is threading.current_thread()
+            if owned:
+                self._thread = None
+        if owned:
+            self.source.close()
+
+
+def capture_session_from_env(source: AudioSource) -> CaptureSession:
+    """Calibration schedule from ``JANE_MIC_RECALIBRATE`` (seconds) and ``JANE_MIC_DRIFT`` (ratio)."""
+    return CaptureSession(
+        source,
+        recalibrate_every=max(1.0, env_float("JANE_MIC_RECALIBRATE", 30.0)),
+        drift_ratio=max(1.1, env_float("JANE_MIC_DRIFT", 2.0)),
+    )
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from jane.config import env_float, env_int
+
+# Prompts containing these words usually lean on earlier turns ("why?", "tell me more about
+# it"), so their answers are not reusable outside the conversation they came from.
+_CONTEXT_WORDS = frozenset(
+    "it its that this these those they them their he him his she her why more again previous "
+    "above earlier last same also".split()
+)
+_WORDS = re.compile(r"[\w']+")
+_TRAILING = re.compile(r"[\s?!.]+$")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing ``?!.``; operators and any script are kept."""
+    return _TRAILING.sub("", " ".join(prompt.casefold().split()))
+
+
+def is_standalone_prompt(prompt: str) -> bool:
+    words = _WORDS.findall(prompt.casefold())
+    return bool(words) and _CONTEXT_WORDS.isdisjoint(words)
+
+
+def cache_key(model: str, prompt: str) -> str:
+    # "v2": keys from the old word-only normalization must not match prompts they never answered.
+    return hashlib.sha256(f"v2\x00{model}\x00{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+
+class ChatResponseCache:
+    """SQLite-backed cache of chat replies with a TTL and LRU eviction by count and bytes.
+
+    Entries survive restarts. ``path=":memory:"`` keeps everything in process, which is handy
+    with a fake model.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "jane_chat_cache.sqlite3",
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 5000,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT NOT NULL, prompt TEXT NOT NULL, response TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._entries, self._bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    def get(self, model: str, prompt: str) -> str | None:
+        key = cache_key(model, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT response, created, size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            response, created, size = row
+            if now - created > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._entries -= 1
+                self._bytes -= size
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return response
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        key = cache_key(model, prompt)
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, prompt, response, created, accessed, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, normalize_prompt(prompt), response, now, now, size),
+            )
+            if old is None:
+                self._entries += 1
+            else:
+                self._bytes -= old[0]
+            self._bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._entries = 0
+            self._bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "entries": self._entries,
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _evict(self) -> None:
+        while self._entries > self.max_entries or self._bytes > self.max_bytes:
+            excess = max(1, self._entries - self.max_entries)
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT ?", (excess,)
+            ).fetchall()
+            if not rows:
+                self._entries = 0
+                self._bytes = 0
+                return
+            self._db.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key, _size in rows])
+            self._entries -= len(rows)
+            self._bytes -= sum(size for _key, size in rows)
+            self.evictions += len(rows)
+
+
+def chat_cache_from_env() -> ChatResponseCache | None:
+    """Build the cache from ``JANE_CHAT_CACHE`` (path, or ``off``), ``..._TTL`` and ``..._MAX``."""
+    path = os.getenv("JANE_CHAT_CACHE", "jane_chat_cache.sqlite3").strip()
+    if path.lower() in {"", "0", "off", "false", "no"}:
+        return None
+
+    try:
+        return ChatResponseCache(
+            path,
+            ttl=env_float("JANE_CHAT_CACHE_TTL", 7 * 24 * 3600),
+            max_entries=env_int("JANE_CHAT_CACHE_MAX", 5000),
+        )
+    except sqlite3.Error:
+        return None
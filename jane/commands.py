@@ -1,74 +1,576 @@
 from __future__ import annotations
 
 import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from enum import Enum
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
 
+from jane.config import env_int
+from jane.fuzzy import FuzzyVocabulary, respell
 
-@dataclass
+
+class Action(str, Enum):
+    EMPTY = "empty"
+    CHAT = "chat"
+    OPEN_WHATSAPP_WEB = "open_whatsapp_web"
+    CHANGE_THEME = "change_theme"
+    INSTALL_LIBRARY = "install_library"
+    SHUTDOWN_SYSTEM = "shutdown_system"
+    TELL_TIME = "tell_time"
+    TELL_DATE = "tell_date"
+    SAVE_NOTE = "save_note"
+    FIND_NOTES = "find_notes"
+    LIST_NOTES = "list_notes"
+    OPEN_CALCULATOR = "open_calculator"
+    OPEN_NOTEPAD = "open_notepad"
+    OPEN_APP_OR_SITE = "open_app_or_site"
+    SET_REMINDER = "set_reminder"
+    SCHEDULE_COMMAND = "schedule_command"
+    CANCEL_SCHEDULED = "cancel_scheduled"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+_ACTIONS: dict[str, Action] = {action.value: action for action in Action}
+_NO_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+def freeze_params(params: Mapping[str, Any] | None) -> Mapping[str, Any]:
+    if not params:
+        return _NO_PARAMS
+    if type(params) is MappingProxyType:
+        return params
+    return MappingProxyType(dict(params))
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedCommand:
+    """One routed utterance.
+
+    Instances are immutable: ``params`` is a read-only mapping (shared between commands that
+    carry no per-utterance values) and ``action`` is an :class:`Action` member, or an interned
+    string for actions outside the built-in set.
+    """
+
     raw: str
-    action: str
-    params: dict[str, Any] = field(default_factory=dict)
+    action: Action | str
+    params: Mapping[str, Any] = field(default_factory=lambda: _NO_PARAMS)
     high_risk: bool = False
 
+    def __post_init__(self) -> None:
+        action = self.action
+        if type(action) is not Action:
+            object.__setattr__(self, "action", _ACTIONS.get(action) or sys.intern(action))
+        params = self.params
+        if type(params) is not MappingProxyType:
+            object.__setattr__(self, "params", freeze_params(params))
+
+    def __reduce__(self):
+        return ParsedCommand, (self.raw, str(self.action), dict(self.params), self.high_risk)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "raw": self.raw,
+            "action": str(self.action),
+            "params": dict(self.params),
+            "high_risk": self.high_risk,
+        }
+
+
+@dataclass(frozen=True)
+class Intent:
+    action: Action
+    all_of: tuple[str, ...] = ()
+    any_of: tuple[str, ...] = ()
+    prefix: str = ""
+    pattern: re.Pattern[str] | None = None
+    match_raw: bool = False
+    capture: str = ""
+    params: Mapping[str, Any] = field(default_factory=lambda: _NO_PARAMS)
+    high_risk: bool = False
+    catch_all: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "params", freeze_params(self.params))
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return self.all_of + self.any_of
+
+
+# Polite openings allowed before a command that must otherwise start the utterance.
+_LEAD_IN = r"\A(?:(?:please|ok(?:ay)?|now|hey|jane|(?:can|could|would)\s+you)[\s,]+)*"
+
+# Rules are listed in priority order: the first intent whose conditions all hold wins.
+# Keywords are matched against the lowercased utterance; `pattern` runs on the same text
+# unless `match_raw` is set, and its first group is stored under `capture`. A `catch_all`
+# intent still lets misspelling recovery look for a more specific rule.
+INTENTS: tuple[Intent, ...] = (
+    # "note: ..." / "remember: ..." is an explicit request to store the text, whatever it says.
+    Intent(
+        Action.SAVE_NOTE,
+        any_of=("note", "remember"),
+        pattern=re.compile(r"\A(?:note|remember)s?\s*[:\-]\s*(.+)$", re.IGNORECASE),
+        match_raw=True,
+        capture="note",
+    ),
+    # Cancelling a pending shutdown must never wait for approval; bulk cancels of everything
+    # else are confirmed first, like any other command that is hard to undo.
+    Intent(
+        Action.CANCEL_SCHEDULED,
+        any_of=("cancel", "abort"),
+        pattern=re.compile(_LEAD_IN + r"(?:cancel|abort)\s+(?:the\s+|my\s+|all\s+)*(shut\s*down|countdowns?)\b"),
+        capture="target",
+    ),
+    Intent(
+        Action.CANCEL_SCHEDULED,
+        any_of=("cancel", "abort"),
+        pattern=re.compile(
+            _LEAD_IN + r"(?:cancel|abort)\s+(?:the\s+|my\s+|all\s+)*"
+            r"(reminders?|timers?|installs?|installations?|jobs?"
+            r"|scheduled(?:\s+(?:actions?|commands?|items?))?)\b"
+        ),
+        capture="target",
+        high_risk=True,
+    ),
+    Intent(
+        Action.SCHEDULE_COMMAND,
+        prefix="in ",
+        pattern=re.compile(r"\A(in\s+(?:\d+|an?|one)\s*(?:seconds?|secs?|minutes?|mins?|hours?|hrs?)\b,?\s+\S.*)$", re.IGNORECASE),
+        match_raw=True,
+        capture="request",
+    ),
+    Intent(
+        Action.SET_REMINDER,
+        all_of=("remind me",),
+        pattern=re.compile(_LEAD_IN + r"remind me\s+(.+)$", re.IGNORECASE),
+        match_raw=True,
+        capture="request",
+    ),
+    Intent(Action.OPEN_WHATSAPP_WEB, all_of=("open chrome", "whatsapp"), params={"browser": "chrome"}),
+    Intent(Action.CHANGE_THEME, all_of=("settings", "theme"), prefix="open ", high_risk=True),
+    Intent(
+        Action.INSTALL_LIBRARY,
+        all_of=("open terminal", "download"),
+        pattern=re.compile(r"download\s+(?:this\s+library\s+)?([a-z0-9_\-.\[\],=<>!~*+]+)"),
+        capture="library",
+        high_risk=True,
+    ),
+    Intent(Action.SHUTDOWN_SYSTEM, any_of=("shut down", "shutdown"), params={"countdown": 10}, high_risk=True),
+    # Whole words only: "what times does the store open" and "what dates work" are questions.
+    Intent(Action.TELL_TIME, any_of=("what time", "current time"), pattern=re.compile(r"\b(?:what|current) time\b")),
+    Intent(Action.TELL_DATE, any_of=("what date", "today date"), pattern=re.compile(r"\b(?:what|today) date\b")),
+    Intent(
+        Action.FIND_NOTES,
+        any_of=("find note", "find my note", "search note", "search my note"),
+        pattern=re.compile(r"\b(?:find|search)\s+(?:my\s+)?notes?\s+(?:about|for|on|mentioning|containing|with)\s+(.+)$"),
+        capture="query",
+    ),
+    Intent(
+        Action.LIST_NOTES,
+        any_of=("list note", "list my note", "show note", "show my note"),
+        pattern=re.compile(r"\b(?:list|show)\s+(?:my\s+)?notes?\b\s*(?:from|for|of|on)?\s*(.*)$"),
+        capture="period",
+    ),
+    Intent(
+        Action.SAVE_NOTE,
+        all_of=("note",),
+        pattern=re.compile(r"note\s*[:\-]?\s*(.+)$", re.IGNORECASE),
+        match_raw=True,
+        capture="note",
+    ),
+    Intent(Action.OPEN_CALCULATOR, all_of=("open calculator",)),
+    Intent(Action.OPEN_NOTEPAD, any_of=("open notepad", "open editor")),
+    Intent(
+        Action.OPEN_APP_OR_SITE,
+        prefix="open",
+        pattern=re.compile(r"\Aopen\s+(.+)"),
+        capture="target",
+        catch_all=True,
+    ),
+)
+
+
+def _trie_pattern(literals: Iterable[str]) -> str:
+    root: dict[str, dict] = {}
+    for literal in literals:
+        node = root
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + _emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A literal ending here is optional so the engine still prefers the longer one.
+        return f"(?:{body})?" if "" in node else body
+
+    return _emit(root)
+
+
+class _LiteralSet:
+    """Finds every literal of a fixed set occurring in a string with one regex scan."""
+
+    def __init__(self, literals: Iterable[str], anchored: bool = False) -> None:
+        unique = set(literals)
+        self._anchored = anchored
+        self._pattern: re.Pattern[str] | None = None
+        if unique:
+            trie = _trie_pattern(unique)
+            self._pattern = re.compile(f"({trie})" if anchored else f"(?=({trie}))")
+        # The scan reports the longest literal at each position; any shorter literal
+        # starting at the same position is necessarily a prefix of it.
+        self._implied = {
+            literal: frozenset(other for other in unique if literal.startswith(other)) for literal in unique
+        }
+        self._has_nested = any(len(implied) > 1 for implied in self._implied.values())
+
+    def find(self, text: str) -> frozenset[str]:
+        if self._pattern is None:
+            return frozenset()
+        if self._anchored:
+            match = self._pattern.match(text)
+            return self._implied[match.group(1)] if match else frozenset()
+        found = self._pattern.findall(text)
+        if not self._has_nested:
+            return frozenset(found)
+        return frozenset().union(*(self._implied[literal] for literal in found))
+
+
+class IntentMatcher:
+    def __init__(self, intents: Iterable[Intent]) -> None:
+        self.intents = tuple(intents)
+        self._by_keyword: dict[str, list[int]] = {}
+        self._by_prefix: dict[str, list[int]] = {}
+        self._conditions = [(frozenset(intent.all_of), frozenset(intent.any_of)) for intent in self.intents]
+        for index, intent in enumerate(self.intents):
+            if not intent.keywords and not intent.prefix:
+                raise ValueError(f"Intent {intent.action!r} needs at least one keyword or prefix.")
+            for keyword in set(intent.keywords):
+                self._by_keyword.setdefault(keyword, []).append(index)
+            if intent.prefix:
+                self._by_prefix.setdefault(intent.prefix, []).append(index)
+        self._keywords = _LiteralSet(self._by_keyword)
+        self._prefixes = _LiteralSet(self._by_prefix, anchored=True)
+
+    def match(self, text: str) -> ParsedCommand | None:
+        resolved = self.resolve(text)
+        return resolved[1] if resolved is not None else None
+
+    def vocabulary(self) -> set[str]:
+        phrases = [*self._by_keyword, *self._by_prefix]
+        return {word for phrase in phrases for word in phrase.split()}
+
+    def resolve(self, text: str, raw: str | None = None, source: str | None = None) -> tuple[int, ParsedCommand] | None:
+        """First intent matching ``text``; patterns run on ``source`` instead when given and it matches."""
+        stripped = text.strip()
+        normalized = stripped.lower()
+        keywords = self._keywords.find(normalized)
+        prefixes = self._prefixes.find(normalized)
+
+        candidates: set[int] = set()
+        for keyword in keywords:
+            candidates.update(self._by_keyword[keyword])
+        for prefix in prefixes:
+            candidates.update(self._by_prefix[prefix])
+
+        for index in sorted(candidates):
+            intent = self.intents[index]
+            all_of, any_of = self._conditions[index]
+            if intent.prefix and intent.prefix not in prefixes:
+                continue
+            if not all_of <= keywords or (any_of and any_of.isdisjoint(keywords)):
+                continue
+            parsed = None
+            if source is not None:
+                parsed = self.build(index, text if raw is None else raw, source.strip(), source.strip().lower())
+            if parsed is None:
+                parsed = self.build(index, text if raw is None else raw, stripped, normalized)
+            if parsed is not None:
+                return index, parsed
+        return None
+
+    def build(self, index: int, text: str, stripped: str, normalized: str) -> ParsedCommand | None:
+        intent = self.intents[index]
+        params = intent.params
+        if intent.pattern is not None:
+            found = intent.pattern.search(stripped if intent.match_raw else normalized)
+            if found is None:
+                return None
+            if intent.capture:
+                params = MappingProxyType({**params, intent.capture: found.group(1).strip()})
+        return ParsedCommand(raw=text, action=intent.action, params=params, high_risk=intent.high_risk)
+
+
+_MATCHER = IntentMatcher(INTENTS)
+_FUZZY = FuzzyVocabulary(_MATCHER.vocabulary())
+_CHAT = -1
+# Recovered intents that need approval only accept near-misses at least this similar.
+STRICT_SIMILARITY = 0.85
+
+
+@dataclass(frozen=True, slots=True)
+class _Recovery:
+    """How a misspelled utterance was matched: the corrected keyword text and the word swaps."""
+
+    corrected: str
+    replacements: tuple[tuple[str, str], ...]
+
+    def source(self, text: str) -> str:
+        # Captures come from the caller's own text with only the misspelled words fixed.
+        return respell(text, dict(self.replacements))
+
+
+# A routing decision: the intent index (or _CHAT) and, for fuzzy recoveries, how it was recovered.
+_Route = tuple[int, _Recovery | None]
+
+
+def _chat(text: str) -> ParsedCommand:
+    return ParsedCommand(raw=text, action=Action.CHAT, params=MappingProxyType({"prompt": text}))
+
+
+def _recover(text: str) -> tuple[_Route, ParsedCommand] | None:
+    """Retry the matcher on ``text`` with punctuation dropped and near-miss words corrected."""
+    corrections = _FUZZY.corrections(text)
+    corrected = _FUZZY.correct(text, corrections)
+    if not corrected or corrected == text.strip().lower():
+        return None
+    recovery = _Recovery(corrected, tuple((word, fixed) for word, (fixed, _score) in corrections.items()))
+    resolved = _MATCHER.resolve(corrected, raw=text, source=recovery.source(text))
+    if resolved is None:
+        return None
+    index, parsed = resolved
+    intent = _MATCHER.intents[index]
+    # "Opens a file ..." is a question, not "open <target>"; catch-all rules need their exact prefix.
+    if intent.catch_all:
+        return None
+    if intent.high_risk and any(score < STRICT_SIMILARITY for _fixed, score in corrections.values()):
+        return None
+    return (index, recovery), parsed
+
+
+def _route(text: str, fuzzy: bool) -> tuple[_Route, ParsedCommand]:
+    resolved = _MATCHER.resolve(text)
+    if resolved is not None and not (fuzzy and _MATCHER.intents[resolved[0]].catch_all):
+        return (resolved[0], None), resolved[1]
+    if fuzzy:
+        recovered = _recover(text)
+        if recovered is not None and (resolved is None or recovered[0][0] < resolved[0]):
+            return recovered
+    if resolved is not None:
+        return (resolved[0], None), resolved[1]
+    return (_CHAT, None), _chat(text)
+
+
+class ParseCache:
+    """Bounded LRU of normalized utterance -> routing decision.
+
+    Only the routing decision is cached. Params are rebuilt from the caller's text on every
+    hit, so raw-text captures (note text, chat prompt) and anything computed per call never
+    leak from one utterance to the next.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, _Route] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _Route | None:
+        with self._lock:
+            route = self._entries.get(key)
+            if route is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return route
+
+    def put(self, key: str, route: _Route) -> None:
+        with self._lock:
+            self._entries[key] = route
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: ParseCache | None = None
+
+
+def enable_parse_cache(maxsize: int = 256) -> ParseCache:
+    global _cache
+    _cache = ParseCache(maxsize)
+    return _cache
+
+
+def disable_parse_cache() -> None:
+    global _cache
+    _cache = None
+
+
+def configure_parse_cache_from_env(default: int = 0) -> ParseCache | None:
+    """Enable the parse cache sized by ``JANE_PARSE_CACHE_SIZE``; unset or ``0`` leaves it off."""
+    size = env_int("JANE_PARSE_CACHE_SIZE", default)
+    if size <= 0:
+        disable_parse_cache()
+        return None
+    return enable_parse_cache(size)
+
+
+def parse_cache_stats() -> dict[str, Any]:
+    cache = _cache
+    if cache is None:
+        return {"enabled": False}
+    return cache.stats()
+
+
+def _parse_cached(cache: ParseCache, text: str) -> ParsedCommand:
+    stripped = text.strip()
+    normalized = stripped.lower()
+    route = cache.get(normalized)
+    if route is not None:
+        index, recovery = route
+        if index == _CHAT:
+            return _chat(text)
+        if recovery is None:
+            parsed = _MATCHER.build(index, text, stripped, normalized)
+        else:
+            source = recovery.source(text).strip()
+            parsed = _MATCHER.build(index, text, source, source.lower()) or _MATCHER.build(
+                index, text, recovery.corrected, recovery.corrected
+            )
+        if parsed is not None:
+            return parsed
+
+    route, parsed = _route(text, fuzzy=True)
+    cache.put(normalized, route)
+    return parsed
+
+
+def parse_command(text: str, fuzzy: bool = True) -> ParsedCommand:
+    """Route an utterance to an intent.
+
+    Utterances that match no rule get one more attempt with near-miss words corrected
+    (e.g. "open calculater", "shut-down") before falling back to ``chat``; pass
+    ``fuzzy=False`` to skip that stage.
+    """
+    if not text.strip():
+        return ParsedCommand(raw=text, action=Action.EMPTY)
+
+    cache = _cache
+    if cache is not None and fuzzy:
+        return _parse_cached(cache, text)
+
+    return _route(text, fuzzy)[1]
+
+
+_SEPARATOR = re.compile(r"\s*(?:,\s*)?\b(?:and\s+then|and|then)\b\s*|\s*;\s*", re.IGNORECASE)
+_CAPTURING = frozenset(intent.action for intent in INTENTS if intent.capture)
+_CATCH_ALL = frozenset(intent.action for intent in INTENTS if intent.catch_all)
 
-def parse_command(text: str) -> ParsedCommand:
-    normalized = text.strip().lower()
 
-    if not normalized:
-        return ParsedCommand(raw=text, action="empty")
+def _joins(current: ParsedCommand, piece: ParsedCommand, merged: ParsedCommand) -> bool:
+    if piece.action is Action.CHAT:
+        # Free text after a note, an app name or a chat prompt belongs to it.
+        return current.action is Action.CHAT or current.action in _CAPTURING
+    # Neighbours that only form an intent together, e.g. "open chrome and open whatsapp".
+    return merged.action not in (current.action, piece.action, Action.CHAT) and merged.action not in _CATCH_ALL
 
-    if "open chrome" in normalized and "whatsapp" in normalized:
-        return ParsedCommand(
-            raw=text,
-            action="open_whatsapp_web",
-            params={"browser": "chrome"},
-            high_risk=False,
-        )
 
-    if normalized.startswith("open ") and "settings" in normalized and "theme" in normalized:
-        return ParsedCommand(raw=text, action="change_theme", params={}, high_risk=True)
-        return ParsedCommand(
-            raw=text,
-            action="change_theme",
-            params={},
-            high_risk=True,
-        )
+def plan_commands(text: str) -> list[ParsedCommand]:
+    """Split a compound utterance such as "what time is it and open calculator" into commands.
 
-    download_match = re.search(r"download\s+(?:this\s+library\s+)?([a-z0-9_\-.]+)", normalized)
-    if "open terminal" in normalized and download_match:
-        return ParsedCommand(
-            raw=text,
-            action="install_library",
-            params={"library": download_match.group(1)},
-            high_risk=True,
-        )
+    The utterance is cut at "and" / "then" / ";" and neighbouring pieces are re-joined wherever
+    splitting would change what they mean, so single commands parse exactly as before.
+    """
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for separator in _SEPARATOR.finditer(text):
+        spans.append((start, separator.start()))
+        start = separator.end()
+    spans.append((start, len(text)))
+    spans = [(begin, end) for begin, end in spans if text[begin:end].strip()]
 
-    if "shut down" in normalized or "shutdown" in normalized:
-        return ParsedCommand(raw=text, action="shutdown_system", params={"countdown": 10}, high_risk=True)
+    if len(spans) <= 1:
+        parsed = parse_command(text)
+        return [] if parsed.action is Action.EMPTY else [parsed]
 
-    if "what time" in normalized or "current time" in normalized:
-        return ParsedCommand(raw=text, action="tell_time")
+    groups: list[tuple[int, int, ParsedCommand]] = []
+    for begin, end in spans:
+        piece = parse_command(text[begin:end])
+        if groups:
+            group_begin, _group_end, current = groups[-1]
+            merged = parse_command(text[group_begin:end])
+            if _joins(current, piece, merged):
+                groups[-1] = (group_begin, end, merged)
+                continue
+        groups.append((begin, end, piece))
+    return [parsed for _begin, _end, parsed in groups]
 
-    if "what date" in normalized or "today date" in normalized:
-        return ParsedCommand(raw=text, action="tell_date")
 
-    note_match = re.search(r"note\s*[:\-]?\s*(.+)$", text.strip(), re.IGNORECASE)
-    if note_match:
-        return ParsedCommand(raw=text, action="save_note", params={"note": note_match.group(1).strip()})
+def _parse_chunk(chunk: list[str], fuzzy: bool = True) -> list[ParsedCommand]:
+    return [parse_command(text, fuzzy) for text in chunk]
 
-    if "open calculator" in normalized:
-        return ParsedCommand(raw=text, action="open_calculator")
 
-    if "open notepad" in normalized or "open editor" in normalized:
-        return ParsedCommand(raw=text, action="open_notepad")
+def parse_commands(
+    texts: Iterable[str],
+    workers: int = 1,
+    chunk_size: int = 1000,
+    fuzzy: bool = True,
+) -> Iterator[ParsedCommand]:
+    """Parse utterances lazily, in input order.
 
-    open_match = re.match(r"open\s+(.+)", normalized)
-    if open_match:
-        return ParsedCommand(raw=text, action="open_app_or_site", params={"target": open_match.group(1).strip()})
+    With ``workers > 1`` the input is cut into chunks that are parsed in a process pool.
+    At most ``2 * workers`` chunks are in flight, so memory stays bounded for any input size.
+    """
+    if workers <= 1:
+        for text in texts:
+            yield parse_command(text, fuzzy)
+        return
 
-    return ParsedCommand(raw=text, action="chat", params={"prompt": text}, high_risk=False)
+    source = iter(texts)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque[Future[list[ParsedCommand]]] = deque()
+        while True:
+            while len(in_flight) < workers * 2:
+                chunk = list(islice(source, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(pool.submit(_parse_chunk, chunk, fuzzy))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
 
 
 def extract_wake_word_command(transcript: str, wake_word: str = "hey jane") -> str | None:
@@ -79,20 +581,3 @@ def extract_wake_word_command(transcript: str, wake_word: str = "hey jane") -> s
         return None
     command = raw[len(normalized_wake) :].lstrip(" ,.!?:;-\t")
     return command.strip()
-        return ParsedCommand(
-            raw=text,
-            action="shutdown_system",
-            params={"countdown": 10},
-            high_risk=True,
-        )
-
-    open_match = re.match(r"open\s+(.+)", normalized)
-    if open_match:
-        return ParsedCommand(
-            raw=text,
-            action="open_app_or_site",
-            params={"target": open_match.group(1).strip()},
-            high_risk=False,
-        )
-
-    return ParsedCommand(raw=text, action="chat", params={"prompt": text}, high_risk=False)
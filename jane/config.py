@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import os
+
+
+def env_float(name: str, default: float) -> float:
+    """``name`` from the environment as a number; unset, blank or malformed values give ``default``."""
+    try:
+        return float(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    return int(env_float(name, default))
@@ -0,0 +1,128 @@
+"""Run several privileged commands behind a single elevation prompt.
+
+The parent writes nothing privileged itself: it starts this file as a script under pkexec, sudo,
+osascript or PowerShell RunAs, passing the commands as base64 JSON. The elevated helper runs
+them in order and appends one JSON line per command to a results file the parent then reads.
+This module only uses the standard library so the helper runs without the package on the
+elevated interpreter's path.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+HELPER = Path(__file__).resolve()
+OUTPUT_TAIL = 2000
+
+
+@dataclass(frozen=True)
+class ElevatedCommand:
+    argv: tuple[str, ...]
+    reason: str
+
+
+@dataclass(frozen=True)
+class ElevatedOutcome:
+    returncode: int
+    output: str
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    def last_line(self) -> str:
+        lines = [line for line in self.output.splitlines() if line.strip()]
+        return lines[-1].strip() if lines else ""
+
+
+def elevation_prefix(system: str | None = None) -> list[str] | None:
+    """Command prefix that elevates on POSIX; ``JANE_ELEVATOR`` overrides it (e.g. a test shim)."""
+    override = os.getenv("JANE_ELEVATOR", "").strip()
+    if override:
+        return shlex.split(override)
+    system = (system or platform.system()).lower()
+    if "windows" in system or "darwin" in system:
+        return None
+    for tool in ("pkexec", "sudo"):
+        found = shutil.which(tool)
+        if found:
+            return [found]
+    return None
+
+
+def run_elevated_batch(commands: list[ElevatedCommand], timeout: float | None = None) -> list[ElevatedOutcome]:
+    """Run ``commands`` in order inside one elevated helper; one outcome per command."""
+    if not commands:
+        return []
+    payload = base64.urlsafe_b64encode(json.dumps([list(cmd.argv) for cmd in commands]).encode()).decode()
+    fd, results_path = tempfile.mkstemp(prefix="jane-elevated-", suffix=".jsonl")
+    os.close(fd)
+    helper = [sys.executable, str(HELPER), results_path, payload]
+    system = platform.system().lower()
+    try:
+        prefix = elevation_prefix(system)
+        if prefix is not None:
+            launch = [*prefix, *helper]
+        elif "windows" in system:
+            args = ",".join(f"'{part}'" for part in helper[1:])
+            launch = [
+                "powershell",
+                "-Command",
+                f"Start-Process -FilePath '{helper[0]}' -ArgumentList {args} -Verb RunAs -Wait -WindowStyle Hidden",
+            ]
+        elif "darwin" in system:
+            cmdline = " ".join(shlex.quote(part) for part in helper)
+            launch = ["osascript", "-e", f'do shell script "{cmdline}" with administrator privileges']
+        else:
+            return [ElevatedOutcome(126, "Admin tools unavailable.")] * len(commands)
+
+        try:
+            subprocess.run(launch, timeout=timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            return [ElevatedOutcome(126, f"Elevation failed: {exc}")] * len(commands)
+
+        outcomes: dict[int, ElevatedOutcome] = {}
+        with open(results_path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    outcomes[int(record["index"])] = ElevatedOutcome(int(record["returncode"]), record["output"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+        missing = ElevatedOutcome(126, "Not run: elevation was refused or the helper stopped early.")
+        return [outcomes.get(index, missing) for index in range(len(commands))]
+    finally:
+        try:
+            os.unlink(results_path)
+        except OSError:
+            pass
+
+
+def _helper_main(argv: list[str]) -> int:
+    results_path, payload = argv
+    commands = json.loads(base64.urlsafe_b64decode(payload.encode()).decode())
+    failures = 0
+    for index, command in enumerate(commands):
+        try:
+            proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            returncode, output = proc.returncode, proc.stdout or ""
+        except OSError as exc:
+            returncode, output = 127, str(exc)
+        failures += returncode != 0
+        with open(results_path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"index": index, "returncode": returncode, "output": output[-OUTPUT_TAIL:]}) + "\n")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_helper_main(sys.argv[1:]))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+_NON_WORD = re.compile(r"[^\w']+")
+_WORD = re.compile(r"[\w']+")
+
+
+def normalize_words(text: str) -> list[str]:
+    return [word for word in _NON_WORD.split(text.lower()) if word]
+
+
+def _trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, giving up early once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def is_inflection(a: str, b: str) -> bool:
+    """True when ``a`` and ``b`` differ only by a plural ending ("times"/"time", "boxes"/"box")."""
+    short, long = sorted((a, b), key=len)
+    return long in (short + "s", short + "es")
+
+
+class FuzzyVocabulary:
+    """Trigram index over a fixed word list for cheap nearest-word lookups.
+
+    A plural is never "corrected" to its singular or back: "what times does the store open" is
+    a question, not a misheard "what time".
+    """
+
+    def __init__(self, words: Iterable[str], threshold: float = 0.8, min_length: int = 4) -> None:
+        self.words = frozenset(words)
+        self.threshold = threshold
+        self.min_length = min_length
+        self._postings: dict[str, list[str]] = {}
+        for word in sorted(self.words):
+            for gram in _trigrams(word):
+                self._postings.setdefault(gram, []).append(word)
+
+    def similarity(self, a: str, b: str) -> float:
+        longest = max(len(a), len(b))
+        limit = int(longest * (1 - self.threshold) + 1e-9)
+        distance = edit_distance(a, b, limit)
+        if distance > limit:
+            return 0.0
+        return 1 - distance / longest
+
+    def closest(self, word: str) -> tuple[str, float] | None:
+        if word in self.words:
+            return word, 1.0
+        if len(word) < self.min_length:
+            return None
+        shared: dict[str, int] = {}
+        for gram in _trigrams(word):
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        best: tuple[str, float] | None = None
+        for candidate in sorted(shared, key=shared.__getitem__, reverse=True)[:5]:
+            if is_inflection(word, candidate):
+                continue
+            score = self.similarity(word, candidate)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
+
+    def corrections(self, text: str) -> dict[str, tuple[str, float]]:
+        """Misspelled lowercase words of ``text`` mapped to their replacement and its similarity."""
+        found: dict[str, tuple[str, float]] = {}
+        for word in normalize_words(text):
+            if word not in found:
+                match = self.closest(word)
+                if match is not None and match[0] != word:
+                    found[word] = match
+        return found
+
+    def correct(self, text: str, corrections: dict[str, tuple[str, float]] | None = None) -> str:
+        """Return ``text`` as lowercase words with misspellings scoring >= ``threshold`` replaced."""
+        if corrections is None:
+            corrections = self.corrections(text)
+        return " ".join(corrections[word][0] if word in corrections else word for word in normalize_words(text))
+
+
+def respell(text: str, replacements: dict[str, str]) -> str:
+    """``text`` with only the listed words swapped; case, punctuation and every other word are kept."""
+    if not replacements:
+        return text
+    return _WORD.sub(lambda match: replacements.get(match.group(0).lower(), match.group(0)), text)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, TypeVar
+
+from jane.config import env_float, env_int
+
+T = TypeVar("T")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+
+class GatewayBusy(RuntimeError):
+    """Raised when the gateway's wait queue is full or a waiting call was cancelled."""
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, holding at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._stamp = clock()
+
+    def take(self) -> float:
+        """Take a token and return 0, or return the seconds until one will be available."""
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class ChatGateway:
+    """Admission control for model calls.
+
+    Identical keys already in flight share one call (single-flight). A call that finds a free
+    slot and nobody queued is admitted at once; otherwise it waits in a priority queue of at
+    most ``max_waiting`` entries (``0`` means never wait), then needs both a free slot among
+    ``max_concurrent`` and a token from the rate limiter. ``rate_per_minute=None`` disables
+    the limiter.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float | None = 60.0,
+        burst: int = 5,
+        max_concurrent: int = 4,
+        max_waiting: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst, clock) if rate_per_minute else None
+        self.max_concurrent = max_concurrent
+        self.max_waiting = max_waiting
+        self.calls = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.throttled = 0
+        self._active = 0
+        self._waiting: list[tuple[int, int]] = []
+        self._order = itertools.count()
+        self._inflight: dict[Hashable, Future] = {}
+        self._cond = threading.Condition()
+
+    def call(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        priority: int = PRIORITY_INTERACTIVE,
+        cancelled: Callable[[], bool] = lambda: False,
+    ) -> T:
+        with self._cond:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+
+        try:
+            self._acquire(priority, cancelled)
+            try:
+                result = fn()
+            finally:
+                self._release()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._cond:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "rejected": self.rejected,
+                "throttled": self.throttled,
+                "active": self._active,
+                "waiting": len(self._waiting),
+                "max_concurrent": self.max_concurrent,
+                "rate_per_minute": round(self.bucket.rate * 60, 2) if self.bucket is not None else None,
+            }
+
+    def _acquire(self, priority: int, cancelled: Callable[[], bool]) -> None:
+        with self._cond:
+            idle = not self._waiting and self._active < self.max_concurrent
+            if not idle and len(self._waiting) >= self.max_waiting:
+                self.rejected += 1
+                raise GatewayBusy("Too many chat requests are already waiting.")
+            ticket = (priority, next(self._order))
+            heapq.heappush(self._waiting, ticket)
+            throttled = False
+            try:
+                while True:
+                    delay = 0.25
+                    if self._waiting[0] == ticket and self._active < self.max_concurrent:
+                        wait = self.bucket.take() if self.bucket is not None else 0.0
+                        if not wait:
+                            break
+                        throttled = True
+                        delay = min(delay, wait)
+                    if cancelled():
+                        raise GatewayBusy("Chat request was cancelled while waiting.")
+                    self._cond.wait(delay)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self.calls += 1
+            self.throttled += throttled
+            self._cond.notify_all()
+
+    def _release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
+def chat_gateway_from_env() -> ChatGateway:
+    """Limits from ``JANE_CHAT_RPM`` (``0`` disables), ``JANE_CHAT_CONCURRENCY`` and ``JANE_CHAT_QUEUE``."""
+    return ChatGateway(
+        rate_per_minute=env_float("JANE_CHAT_RPM", 60) or None,
+        max_concurrent=max(1, env_int("JANE_CHAT_CONCURRENCY", 4)),
+        max_waiting=max(0, env_int("JANE_CHAT_QUEUE", 16)),
+    )
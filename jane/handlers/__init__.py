@@ -0,0 +1,5 @@
+"""Built-in action handlers.
+
+Each module is imported by the action registry the first time one of its actions runs, so
+platform, subprocess and browser helpers stay off the startup path.
+"""
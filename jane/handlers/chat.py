@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import ParsedCommand
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+
+def chat(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return executor.chat(cmd.params.get("prompt", ""))
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import ParsedCommand
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+
+def tell_time(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return ActionResult(True, f"Current time is {datetime.now().strftime('%I:%M %p')}.")
+
+
+def tell_date(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return ActionResult(True, f"Today is {datetime.now().strftime('%A, %d %B %Y')}.")
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import ParsedCommand
+from jane.notes import STAMP_FORMAT, period_range
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+
+def save_note(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    note = cmd.params.get("note", "")
+    if not note:
+        return ActionResult(False, "Note text was empty.")
+    stamp = datetime.now().strftime(STAMP_FORMAT)
+    writer = executor.note_writer
+    committed = writer.append(f"[{stamp}] {' '.join(note.splitlines())}")
+    if writer.durability != "none":
+        committed.result(timeout=10)
+    return ActionResult(True, "Note saved to jane_notes.txt")
+
+
+def find_notes(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    query = cmd.params.get("query", "")
+    if not query:
+        return ActionResult(False, "What should I look for in your notes?")
+    executor.note_writer.flush()
+    notes = executor.notes_index.search(query, limit=5)
+    if not notes:
+        return ActionResult(True, f"I found no notes about {query}.")
+    found = "; ".join(note.describe() for note in notes)
+    return ActionResult(True, f"Found {len(notes)} note{'s' if len(notes) > 1 else ''} about {query}: {found}")
+
+
+def list_notes(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    period = cmd.params.get("period", "")
+    executor.note_writer.flush()
+    if not period:
+        notes = executor.notes_index.recent(limit=5)
+        if not notes:
+            return ActionResult(True, "You have no notes yet.")
+        return ActionResult(True, f"Your latest notes: {'; '.join(note.describe() for note in notes)}")
+    window = period_range(period)
+    if window is None:
+        return ActionResult(False, f"I do not know which days '{period}' means.")
+    notes = executor.notes_index.between(*window, limit=10)
+    if not notes:
+        return ActionResult(True, f"There are no notes from {period}.")
+    listed = "; ".join(note.describe() for note in notes)
+    return ActionResult(True, f"{len(notes)} note{'s' if len(notes) > 1 else ''} from {period}: {listed}")
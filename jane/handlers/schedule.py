@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import Action, ParsedCommand, parse_command
+from jane.scheduler import parse_delay
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+# Scheduler kinds each spoken target covers: timers are delayed commands and countdowns, never reminders.
+_KINDS = {
+    "shutdown": ("countdown",),
+    "countdown": ("countdown",),
+    "reminder": ("reminder",),
+    "timer": ("action", "countdown"),
+    "scheduled": ("action",),
+}
+
+
+def _describe(seconds: float) -> str:
+    if seconds >= 3600 and seconds % 3600 == 0:
+        count, unit = int(seconds // 3600), "hour"
+    elif seconds >= 60 and seconds % 60 == 0:
+        count, unit = int(seconds // 60), "minute"
+    else:
+        count, unit = int(round(seconds)), "second"
+    return f"{count} {unit}{'' if count == 1 else 's'}"
+
+
+def set_reminder(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    parsed = parse_delay(cmd.params.get("request", ""))
+    if parsed is None:
+        return ActionResult(False, "When should I remind you? Try: remind me in 20 minutes to stretch.")
+    delay, message = parsed
+    message = message or "this is your reminder"
+    job = executor.remind(delay, message)
+    return ActionResult(True, f"Okay, I will remind you in {_describe(delay)}: {message}. (reminder {job.id})")
+
+
+def schedule_command(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    parsed = parse_delay(cmd.params.get("request", ""))
+    if parsed is None or not parsed[1]:
+        return ActionResult(False, "I could not tell what to run or when.")
+    delay, text = parsed
+    inner = parse_command(text)
+    if inner.action in (Action.EMPTY, Action.SCHEDULE_COMMAND):
+        return ActionResult(False, "I could not tell what to run later.")
+    if executor.requires_approval(inner):
+        # Approval is granted for "now"; a delayed high-risk command would skip the gate.
+        return ActionResult(False, "High-risk commands cannot be scheduled. Run them directly to approve them.")
+    job = executor.schedule_command(delay, inner)
+    return ActionResult(True, f"Scheduled '{inner.raw}' in {_describe(delay)}. (item {job.id})")
+
+
+def cancel_scheduled(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    target = cmd.params.get("target", "").lower().replace(" ", "")
+    if target.startswith(("install", "job")):
+        cancelled = executor.cancel_job()
+        if not cancelled:
+            return ActionResult(True, "There are no installs I can cancel.")
+        return ActionResult(True, f"Cancelling {cancelled} background job{'s' if cancelled > 1 else ''}.")
+    kinds = next((kinds for prefix, kinds in _KINDS.items() if target.startswith(prefix)), ("action",))
+    cancelled = sum(executor.cancel_scheduled(kind=kind) for kind in kinds)
+    if not cancelled:
+        return ActionResult(True, "There was nothing scheduled to cancel.")
+    if kinds == ("countdown",):
+        return ActionResult(True, "Shutdown cancelled.")
+    return ActionResult(True, f"Cancelled {cancelled} scheduled item{'s' if cancelled > 1 else ''}.")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import ParsedCommand
+from jane.elevation import ElevatedCommand, elevation_prefix
+from jane.jobs import pip_progress
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+
+def change_theme(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return open_settings_for_theme()
+
+
+def install_library(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    library = cmd.params.get("library", "")
+    if not library:
+        return ActionResult(False, "No library name was provided.")
+    job = executor.start_job(install_argv(library), f"Install library: {library}", pip_progress)
+    return ActionResult(True, f"Installing {library} in the background (job {job.id}).")
+
+
+def install_argv(library: str) -> list[str]:
+    """pip for the running interpreter, behind pkexec/sudo where that keeps output streamable.
+
+    Windows RunAs and osascript do not hand back the child's output, so there the install runs
+    unelevated into the current environment.
+    """
+    return [*(elevation_prefix() or []), sys.executable, "-m", "pip", "install", library]
+
+
+def plan_install_library(executor: ActionExecutor, cmd: ParsedCommand) -> ElevatedCommand | None:
+    library = cmd.params.get("library", "")
+    if not library:
+        return None
+    return ElevatedCommand((sys.executable, "-m", "pip", "install", library), f"Install library: {library}")
+
+
+def shutdown_system(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return shutdown_with_countdown(executor, int(cmd.params.get("countdown", 10)))
+
+
+def open_calculator(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return open_system_app(executor, "calculator")
+
+
+def open_notepad(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return open_system_app(executor, "notepad")
+
+
+def open_settings_for_theme() -> ActionResult:
+    system = platform.system().lower()
+    try:
+        if "windows" in system:
+            return run_with_admin(
+                ["start", "ms-settings:colors"],
+                "Open Windows color settings",
+                shell=True,
+            )
+        elif "darwin" in system:
+            subprocess.Popen(["open", "x-apple.systempreferences:"])
+        else:
+            subprocess.Popen(["gnome-control-center", "appearance"])
+        return ActionResult(True, "Opened settings. Please apply your theme preference.")
+    except Exception as exc:
+        return ActionResult(False, f"Unable to open settings: {exc}")
+
+
+def shutdown_with_countdown(executor: ActionExecutor, seconds: int) -> ActionResult:
+    """Announce a countdown once a second and shut down at zero, without holding a worker.
+
+    The countdown lives on the executor's scheduler, so "cancel shutdown" or the UI cancel
+    buttons can stop it at any point.
+    """
+
+    def _shutdown() -> None:
+        executor.alert("System Black Out", key="shutdown")
+        result = shutdown_now()
+        if not result.ok:
+            executor.speaker(result.message)
+
+    executor.countdown(seconds, "Shutdown", lambda sec: executor.alert(f"Shutdown in {sec}", key="shutdown"), _shutdown)
+    return ActionResult(True, f"Shutdown scheduled in {seconds} seconds. Say 'cancel shutdown' to stop it.")
+
+
+def shutdown_now() -> ActionResult:
+    system = platform.system().lower()
+    if "windows" in system:
+        return run_with_admin(["shutdown", "/s", "/t", "0"], "Shutdown system")
+    if "darwin" in system:
+        return run_with_admin(["shutdown", "-h", "now"], "Shutdown system")
+    return run_with_admin(["shutdown", "now"], "Shutdown system")
+
+
+def open_system_app(executor: ActionExecutor, name: str) -> ActionResult:
+    try:
+        argv = executor.launchers.launch(name)
+    except LookupError:
+        return ActionResult(False, "Unable to open requested app on this system.")
+    except OSError as exc:
+        return ActionResult(False, f"Unable to open {name}: {exc}")
+    return ActionResult(True, f"Launching app via: {Path(argv[0]).name}")
+
+
+def run_with_admin(command: list[str], reason: str, shell: bool = False, wait: bool = False) -> ActionResult:
+    system = platform.system().lower()
+
+    try:
+        if "windows" in system:
+            cmdline = " ".join(shlex.quote(part) for part in command)
+            elevate = [
+                "powershell",
+                "-Command",
+                f"Start-Process cmd -Verb RunAs -ArgumentList '/c {cmdline}'",
+            ]
+            proc = subprocess.Popen(elevate)
+            if wait:
+                proc.wait()
+            return ActionResult(True, f"Admin request launched for: {reason}")
+
+        if "darwin" in system:
+            cmdline = " ".join(shlex.quote(part) for part in command)
+            osa = [
+                "osascript",
+                "-e",
+                f'do shell script "{cmdline}" with administrator privileges',
+            ]
+            proc = subprocess.Popen(osa)
+            if wait:
+                proc.wait()
+            return ActionResult(True, f"Admin request launched for: {reason}")
+
+        if shutil.which("pkexec"):
+            proc = subprocess.Popen(["pkexec", *command], shell=shell)
+            if wait:
+                proc.wait()
+            return ActionResult(True, f"Admin request launched for: {reason}")
+
+        if shutil.which("sudo"):
+            proc = subprocess.Popen(["sudo", *command], shell=shell)
+            if wait:
+                proc.wait()
+            return ActionResult(True, f"Admin request launched for: {reason}")
+
+        return ActionResult(False, f"Admin tools unavailable for: {reason}")
+    except Exception as exc:
+        return ActionResult(False, f"Admin execution failed for {reason}: {exc}")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import webbrowser
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from jane.actions import ActionResult
+from jane.commands import ParsedCommand
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor
+
+KNOWN_SITES = {
+    "whatsapp": "https://web.whatsapp.com",
+    "youtube": "https://youtube.com",
+    "gmail": "https://mail.google.com",
+    "chrome": "https://www.google.com",
+}
+
+
+def open_whatsapp_web(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    webbrowser.open("https://web.whatsapp.com")
+    return ActionResult(True, "Opening WhatsApp Web in browser.")
+
+
+def open_app_or_site(executor: ActionExecutor, cmd: ParsedCommand) -> ActionResult:
+    return open_target(cmd.params.get("target", ""), executor)
+
+
+def open_target(target: str, executor: ActionExecutor | None = None) -> ActionResult:
+    if not target:
+        return ActionResult(False, "Nothing to open.")
+    key = target.strip().lower()
+    if executor is not None and executor.launchers.knows(key):
+        # Apps from the built-in or user app table win over guessing a URL.
+        try:
+            argv = executor.launchers.launch(key)
+            return ActionResult(True, f"Opening {key} via: {Path(argv[0]).name}")
+        except (LookupError, OSError):
+            pass
+    if key in KNOWN_SITES:
+        webbrowser.open(KNOWN_SITES[key])
+        return ActionResult(True, f"Opening {key}.")
+    try:
+        webbrowser.open(target)
+        return ActionResult(True, f"Attempting to open {target}.")
+    except Exception as exc:
+        return ActionResult(False, f"Open failed: {exc}")
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import itertools
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from jane.config import env_int
+
+MAX_LINE = 500
+
+_PIP_PHASES = (
+    (re.compile(r"^\s*(?:Collecting|Requirement already satisfied)\b"), 0.15),
+    (re.compile(r"^\s*(?:Downloading|Using cached)\b"), 0.4),
+    (re.compile(r"^\s*Building wheels?\b"), 0.6),
+    (re.compile(r"^\s*Installing collected packages\b"), 0.8),
+    (re.compile(r"^\s*Successfully installed\b"), 1.0),
+)
+
+
+def pip_progress(line: str) -> float | None:
+    """Rough install progress from pip's phase lines; None for lines that say nothing new."""
+    for pattern, progress in _PIP_PHASES:
+        if pattern.search(line):
+            return progress
+    return None
+
+
+@dataclass(eq=False)
+class Job:
+    id: int
+    label: str
+    argv: tuple[str, ...]
+    max_lines: int = 200
+    status: str = "queued"
+    returncode: int | None = None
+    progress: float | None = None
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    lines_seen: int = 0
+    progress_parser: Callable[[str], float | None] | None = field(default=None, repr=False)
+    on_finish: Callable[[Job], None] | None = field(default=None, repr=False)
+    _output: deque = field(init=False, repr=False)
+    _process: subprocess.Popen | None = field(default=None, init=False, repr=False)
+    _cancelled: bool = field(default=False, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._output = deque(maxlen=self.max_lines)
+
+    @property
+    def done(self) -> bool:
+        return self.status in {"succeeded", "failed", "cancelled"}
+
+    def append(self, stream: str, line: str) -> None:
+        line = line.rstrip("\r\n")
+        if len(line) > MAX_LINE:
+            line = line[: MAX_LINE - 3] + "..."
+        with self._lock:
+            self.lines_seen += 1
+            self._output.append((self.lines_seen, stream, line))
+            if self.progress_parser is not None:
+                progress = self.progress_parser(line)
+                if progress is not None:
+                    self.progress = max(self.progress or 0.0, progress)
+
+    def output(self, since: int = 0) -> list[dict[str, Any]]:
+        """Buffered lines numbered after ``since``; older lines may already have been dropped."""
+        with self._lock:
+            return [{"n": n, "stream": stream, "text": text} for n, stream, text in self._output if n > since]
+
+    def last_line(self) -> str:
+        with self._lock:
+            return self._output[-1][2] if self._output else ""
+
+    def to_dict(self, since: int | None = None) -> dict[str, Any]:
+        info = {
+            "id": self.id,
+            "label": self.label,
+            "status": self.status,
+            "progress": self.progress,
+            "returncode": self.returncode,
+            "lines": self.lines_seen,
+            "last_line": self.last_line(),
+            "elapsed": round((self.finished or time.time()) - self.started, 1) if self.started else 0.0,
+        }
+        if since is not None:
+            info["output"] = self.output(since)
+        return info
+
+
+class JobManager:
+    """Runs subprocess-backed jobs in the background, at most ``max_concurrent`` at a time.
+
+    stdout and stderr are read line by line into a bounded per-job buffer, so a chatty install
+    never grows memory and clients can poll for new lines with a ``since`` cursor. Jobs beyond
+    the limit wait in FIFO order.
+    """
+
+    def __init__(self, max_concurrent: int = 2, max_lines: int = 200, keep_finished: int = 50) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_lines = max_lines
+        self.keep_finished = keep_finished
+        self._jobs: dict[int, Job] = {}
+        self._queue: deque[Job] = deque()
+        self._running = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        argv: list[str] | tuple[str, ...],
+        label: str,
+        progress_parser: Callable[[str], float | None] | None = None,
+        on_finish: Callable[[Job], None] | None = None,
+    ) -> Job:
+        job = Job(next(self._ids), label, tuple(argv), self.max_lines, progress_parser=progress_parser)
+        job.on_finish = on_finish
+        with self._lock:
+            self._jobs[job.id] = job
+            self._queue.append(job)
+        self._dispatch()
+        return job
+
+    def get(self, job_id: int) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> list[Job]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.id)
+
+    def active(self) -> list[Job]:
+        return [job for job in self.jobs() if not job.done]
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued or running job; False if it is finished, unknown or cannot be signalled."""
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+        with self._lock:
+            job._cancelled = True
+            if job in self._queue:
+                self._queue.remove(job)
+                self._finish_locked(job, "cancelled")
+                queued = True
+            else:
+                queued = False
+        if queued:
+            self._notify(job)
+            return True
+        process = job._process
+        if process is not None and process.poll() is None:
+            try:
+                process.terminate()
+            except OSError as exc:
+                # An elevated child (pip under pkexec) runs as root and ignores our signals.
+                job._cancelled = False
+                job.append("stderr", f"Cannot cancel: {exc}")
+                return False
+            threading.Timer(5.0, self._kill, args=(process,)).start()
+        return True
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        if process.poll() is None:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+    def cancel_all(self) -> int:
+        return sum(self.cancel(job.id) for job in self.active())
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            ready = []
+            while self._queue and self._running < self.max_concurrent:
+                job = self._queue.popleft()
+                job.status = "running"
+                job.started = time.time()
+                self._running += 1
+                ready.append(job)
+        for job in ready:
+            threading.Thread(target=self._run, args=(job,), name=f"jane-job-{job.id}", daemon=True).start()
+
+    def _run(self, job: Job) -> None:
+        try:
+            process = subprocess.Popen(
+                list(job.argv),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            )
+        except OSError as exc:
+            job.append("stderr", str(exc))
+            with self._lock:
+                self._finish_locked(job, "failed", running=True)
+            self._notify(job)
+            self._dispatch()
+            return
+
+        job._process = process
+        if job._cancelled:
+            # Cancelled between dispatch and Popen, before there was a process to signal.
+            self._kill(process)
+        readers = [
+            threading.Thread(target=self._pump, args=(job, process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._pump, args=(job, process.stderr, "stderr"), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        returncode = process.wait()
+        for reader in readers:
+            reader.join()
+        job.returncode = returncode
+        with self._lock:
+            status = "cancelled" if job._cancelled else ("succeeded" if returncode == 0 else "failed")
+            self._finish_locked(job, status, running=True)
+        self._notify(job)
+        self._dispatch()
+
+    @staticmethod
+    def _pump(job: Job, stream, name: str) -> None:
+        for line in stream:
+            job.append(name, line)
+        stream.close()
+
+    def _finish_locked(self, job: Job, status: str, running: bool = False) -> None:
+        job.status = status
+        job.finished = time.time()
+        if status == "succeeded":
+            job.progress = 1.0
+        if running:
+            self._running -= 1
+        finished = [other for other in self._jobs.values() if other.done]
+        for old in finished[: max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[old.id]
+
+    @staticmethod
+    def _notify(job: Job) -> None:
+        if job.on_finish is not None:
+            try:
+                job.on_finish(job)
+            except Exception:
+                pass
+
+
+def job_manager_from_env() -> JobManager:
+    """Limits from ``JANE_JOB_LIMIT`` (concurrent jobs, default 2) and ``JANE_JOB_LINES`` (buffer per job)."""
+    return JobManager(
+        max_concurrent=max(1, env_int("JANE_JOB_LIMIT", 2)),
+        max_lines=max(10, env_int("JANE_JOB_LINES", 200)),
+    )
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+
+@dataclass(frozen=True)
+class Launcher:
+    """One way to start an app: an argv plus the platforms it applies to (empty means any)."""
+
+    argv: tuple[str, ...]
+    platforms: frozenset[str] = frozenset()
+
+    @classmethod
+    def parse(cls, entry: str | Mapping[str, Any]) -> Launcher:
+        if isinstance(entry, str):
+            return cls(tuple(shlex.split(entry)))
+        return cls(tuple(shlex.split(entry["command"])), frozenset(p.lower() for p in entry.get("platforms", ())))
+
+
+def _launchers(*entries: str | Mapping[str, Any]) -> tuple[Launcher, ...]:
+    return tuple(Launcher.parse(entry) for entry in entries)
+
+
+DEFAULT_APPS: dict[str, tuple[Launcher, ...]] = {
+    "calculator": _launchers(
+        {"command": "calc", "platforms": ["windows"]},
+        {"command": "open -a Calculator", "platforms": ["darwin"]},
+        "gnome-calculator",
+        "kcalc",
+        "galculator",
+        "xcalc",
+    ),
+    "notepad": _launchers(
+        {"command": "notepad", "platforms": ["windows"]},
+        {"command": "open -a TextEdit", "platforms": ["darwin"]},
+        "gedit",
+        "gnome-text-editor",
+        "kate",
+        "mousepad",
+    ),
+}
+
+
+def load_app_table(path: str | Path) -> dict[str, tuple[Launcher, ...]]:
+    """Read a user app table: ``{"spotify": ["spotify", {"command": "open -a Spotify", "platforms": ["darwin"]}]}``."""
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    table: dict[str, tuple[Launcher, ...]] = {}
+    for name, entries in raw.items():
+        if isinstance(entries, (str, dict)):
+            entries = [entries]
+        try:
+            table[name.strip().lower()] = _launchers(*entries)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return table
+
+
+class LauncherResolver:
+    """Finds the first launcher of each app that exists on this machine and remembers it.
+
+    Candidates are probed with ``shutil.which`` once per app, so launching is a single
+    ``Popen`` of an absolute path. The cache is dropped whenever ``PATH`` changes.
+    """
+
+    def __init__(self, apps: Mapping[str, Iterable[Launcher]] | None = None, system: str | None = None) -> None:
+        self.system = (system or platform.system()).lower()
+        self._apps: dict[str, tuple[Launcher, ...]] = {
+            name: tuple(launchers) for name, launchers in (DEFAULT_APPS if apps is None else apps).items()
+        }
+        self._resolved: dict[str, tuple[str, ...] | None] = {}
+        self._path = os.environ.get("PATH", "")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> LauncherResolver:
+        """Built-in apps plus the user table named by ``JANE_APPS_FILE`` (default ``jane_apps.json``)."""
+        resolver = cls()
+        for name, launchers in load_app_table(os.getenv("JANE_APPS_FILE", "jane_apps.json")).items():
+            resolver.register(name, launchers)
+        return resolver
+
+    def register(self, name: str, launchers: Iterable[Launcher | str]) -> None:
+        """Add or replace an app; user entries take priority over the built-in candidates."""
+        parsed = tuple(item if isinstance(item, Launcher) else Launcher.parse(item) for item in launchers)
+        with self._lock:
+            self._apps[name.strip().lower()] = parsed
+            self._resolved.pop(name.strip().lower(), None)
+
+    def apps(self) -> list[str]:
+        return list(self._apps)
+
+    def knows(self, name: str) -> bool:
+        return name.strip().lower() in self._apps
+
+    def resolve(self, name: str) -> tuple[str, ...] | None:
+        key = name.strip().lower()
+        path = os.environ.get("PATH", "")
+        with self._lock:
+            if path != self._path:
+                self._resolved.clear()
+                self._path = path
+            if key in self._resolved:
+                return self._resolved[key]
+            argv = self._probe(self._apps.get(key, ()))
+            self._resolved[key] = argv
+            return argv
+
+    def warm(self) -> None:
+        for name in self.apps():
+            self.resolve(name)
+
+    def launch(self, name: str) -> tuple[str, ...]:
+        """Start ``name`` and return the argv used; raises ``LookupError`` if nothing was found."""
+        argv = self.resolve(name)
+        if argv is None:
+            raise LookupError(name)
+        try:
+            subprocess.Popen(list(argv))
+        except OSError:
+            # The binary vanished since it was probed; look again next time.
+            with self._lock:
+                self._resolved.pop(name.strip().lower(), None)
+            raise
+        return argv
+
+    def _probe(self, launchers: Iterable[Launcher]) -> tuple[str, ...] | None:
+        for launcher in launchers:
+            if not launcher.argv or (launcher.platforms and self.system not in launcher.platforms):
+                continue
+            found = shutil.which(launcher.argv[0])
+            if found:
+                return (found, *launcher.argv[1:])
+        return None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+_SUMMARY_HEADER = "Summary of our earlier conversation:"
+_SUMMARY_ACK = "Understood, I will keep that context in mind."
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text; close enough for budgeting
+    # without a tokenizer round-trip.
+    return max(1, (len(text) + 3) // 4)
+
+
+@dataclass(frozen=True)
+class Turn:
+    role: str
+    text: str
+    tokens: int
+
+
+def summarize_turn(turn: Turn, limit: int = 160) -> str:
+    """Extractive one-line digest of a turn: its first sentence, clipped to ``limit`` chars."""
+    first = _SENTENCE_END.split(turn.text.strip(), maxsplit=1)[0]
+    if len(first) > limit:
+        first = first[: limit - 3].rstrip() + "..."
+    speaker = "User" if turn.role == "user" else "JANE"
+    return f"{speaker}: {first}"
+
+
+def clip_turn(turn: Turn, tokens: int, estimator: Callable[[str], int] = estimate_tokens) -> Turn | None:
+    """``turn`` cut down to at most ``tokens`` tokens, or None when too little of it would be left."""
+    if tokens < 8:
+        return None
+    keep = len(turn.text) * tokens // max(1, turn.tokens)
+    while keep > 0:
+        text = turn.text[:keep].rstrip() + " ..."
+        used = estimator(text)
+        if used <= tokens:
+            return Turn(turn.role, text, used)
+        keep -= max(1, keep // 10)
+    return None
+
+
+class ConversationMemory:
+    """Rolling chat history that keeps every request under a fixed token budget.
+
+    Recent turns are sent verbatim. When they no longer fit, the oldest ones are folded into a
+    running summary of one line per turn, itself capped at ``summary_budget`` tokens. If the
+    ``min_recent_turns`` that are always kept are still too long, the longest is clipped. The
+    rendered summary prefix is cached and only rebuilt after a compaction, so steady-state
+    requests only pay for appending the new turn.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        summary_budget: int = 400,
+        min_recent_turns: int = 2,
+        summarizer: Callable[[Turn], str] = summarize_turn,
+        estimator: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        if summary_budget >= token_budget:
+            raise ValueError("summary_budget must be smaller than token_budget.")
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.min_recent_turns = min_recent_turns
+        self.summarizer = summarizer
+        self.estimator = estimator
+        self.compactions = 0
+        self._turns: deque[Turn] = deque()
+        self._turn_tokens = 0
+        self._summary: deque[tuple[str, int]] = deque()
+        self._summary_tokens = 0
+        self._prefix: list[dict[str, Any]] | None = None
+        self._prefix_tokens = estimator(_SUMMARY_HEADER) + estimator(_SUMMARY_ACK) + 1
+        self._lock = threading.Lock()
+
+    def build_contents(self, prompt: str) -> list[dict[str, Any]]:
+        """Return Gemini ``contents`` for ``prompt``: summary prefix, recent turns, then the prompt."""
+        prompt_tokens = self.estimator(prompt)
+        with self._lock:
+            self._compact(reserve=prompt_tokens)
+            contents = list(self._summary_prefix())
+            contents.extend({"role": turn.role, "parts": [turn.text]} for turn in self._turns)
+        contents.append({"role": "user", "parts": [prompt]})
+        return contents
+
+    def record(self, prompt: str, reply: str) -> None:
+        with self._lock:
+            for role, text in (("user", prompt), ("model", reply)):
+                turn = Turn(role, text, self.estimator(text))
+                self._turns.append(turn)
+                self._turn_tokens += turn.tokens
+            self._compact(reserve=0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._turns.clear()
+            self._summary.clear()
+            self._turn_tokens = 0
+            self._summary_tokens = 0
+            self._prefix = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "turns": len(self._turns),
+                "turn_tokens": self._turn_tokens,
+                "summary_lines": len(self._summary),
+                "summary_tokens": self._summary_tokens,
+                "compactions": self.compactions,
+                "token_budget": self.token_budget,
+            }
+
+    def _compact(self, reserve: int) -> None:
+        budget = self.token_budget - reserve
+        compacted = False
+        while self._turns and len(self._turns) > self.min_recent_turns:
+            if self._used() <= budget:
+                break
+            turn = self._turns.popleft()
+            self._turn_tokens -= turn.tokens
+            line = self.summarizer(turn)
+            line_tokens = self.estimator(line)
+            self._summary.append((line, line_tokens))
+            self._summary_tokens += line_tokens
+            while self._summary_tokens > self.summary_budget and self._summary:
+                _old, old_tokens = self._summary.popleft()
+                self._summary_tokens -= old_tokens
+            compacted = True
+        # The turns that are always kept can still be too long on their own (a huge reply).
+        while self._turns and self._used() > budget:
+            index = max(range(len(self._turns)), key=lambda position: self._turns[position].tokens)
+            turn = self._turns[index]
+            excess = self._used() - budget
+            clipped = clip_turn(turn, turn.tokens - excess, self.estimator)
+            if clipped is None:
+                del self._turns[index]
+                self._turn_tokens -= turn.tokens
+            else:
+                self._turns[index] = clipped
+                self._turn_tokens += clipped.tokens - turn.tokens
+            compacted = True
+        while self._summary and self._used() > budget:
+            _old, old_tokens = self._summary.popleft()
+            self._summary_tokens -= old_tokens
+            compacted = True
+        if compacted:
+            self.compactions += 1
+            self._prefix = None
+
+    def _used(self) -> int:
+        prefix = self._summary_tokens + self._prefix_tokens if self._summary else 0
+        return prefix + self._turn_tokens
+
+    def _summary_prefix(self) -> list[dict[str, Any]]:
+        if self._prefix is None:
+            if not self._summary:
+                self._prefix = []
+            else:
+                digest = "\n".join(line for line, _tokens in self._summary)
+                self._prefix = [
+                    {"role": "user", "parts": [f"{_SUMMARY_HEADER}\n{digest}"]},
+                    {"role": "model", "parts": [_SUMMARY_ACK]},
+                ]
+        return self._prefix
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+DURABILITY_LEVELS = ("none", "flush", "fsync")
+_LINE = re.compile(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]\s?(.*)")
+_QUERY_WORDS = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class Note:
+    id: int
+    created: str | None
+    text: str
+
+    def describe(self) -> str:
+        return f"[{self.created[:16]}] {self.text}" if self.created else self.text
+
+
+def parse_note_line(line: str) -> tuple[str | None, str]:
+    found = _LINE.match(line)
+    if found is None:
+        return None, line.strip()
+    return found.group(1), found.group(2).strip()
+
+
+def period_range(period: str, now: datetime | None = None) -> tuple[datetime, datetime] | None:
+    """Map "today", "yesterday", "this week", "last 3 days", "2024-05-01", ... to ``[start, end)``."""
+    now = now or datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    period = " ".join(period.lower().split())
+    if period in {"today", "this day"}:
+        return today, today + timedelta(days=1)
+    if period == "yesterday":
+        return today - timedelta(days=1), today
+    if period == "this week":
+        start = today - timedelta(days=today.weekday())
+        return start, start + timedelta(days=7)
+    if period == "last week":
+        start = today - timedelta(days=today.weekday() + 7)
+        return start, start + timedelta(days=7)
+    if period == "this month":
+        start = today.replace(day=1)
+        return start, (start + timedelta(days=32)).replace(day=1)
+    if period == "last month":
+        end = today.replace(day=1)
+        return (end - timedelta(days=1)).replace(day=1), end
+    found = re.fullmatch(r"(?:the\s+)?(?:last|past)\s+(\d+)\s+days?", period)
+    if found:
+        return today - timedelta(days=int(found.group(1)) - 1), today + timedelta(days=1)
+    try:
+        day = datetime.strptime(period, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return day, day + timedelta(days=1)
+
+
+class NotesIndex:
+    """Searchable SQLite index over the notes journal (``jane_notes.txt``).
+
+    The text file stays the source of truth. The index remembers how many bytes of it were
+    imported, so the first ``sync`` imports the whole file and later ones only read what was
+    appended since. Full-text search uses FTS5 when the SQLite build has it, ``LIKE`` otherwise.
+    """
+
+    def __init__(self, journal: str | Path, path: str | Path = "jane_notes.sqlite3") -> None:
+        self.journal = Path(journal)
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY, created TEXT, text TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS notes_created ON notes (created)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        try:
+            self._db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(text, content='notes', content_rowid='id')")
+            self.full_text = True
+        except sqlite3.OperationalError:
+            self.full_text = False
+
+    def sync(self, block_size: int = 4 * 1024 * 1024) -> int:
+        """Index whatever was appended to the journal since the last call; returns the new note count."""
+        with self._lock:
+            offset = int(self._meta("offset") or 0)
+            try:
+                size = self.journal.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size < offset:
+                # The journal was truncated or replaced; start over.
+                self._db.execute("DELETE FROM notes")
+                if self.full_text:
+                    self._db.execute("INSERT INTO notes_fts (notes_fts) VALUES ('delete-all')")
+                offset = 0
+                self._set_meta("offset", "0")
+            added = 0
+            if size == offset:
+                return added
+            with self.journal.open("rb") as fh:
+                fh.seek(offset)
+                while offset < size:
+                    data = fh.read(min(block_size, size - offset))
+                    complete = data.rfind(b"\n") + 1
+                    if not complete:
+                        if len(data) < block_size:
+                            break  # an unfinished last line; pick it up next time
+                        complete = len(data)
+                    fh.seek(offset + complete)
+                    added += self._import(data[:complete], offset + complete)
+                    offset += complete
+            return added
+
+    def _import(self, data: bytes, offset: int) -> int:
+        rows = [parse_note_line(line) for line in data.decode("utf-8", "replace").splitlines()]
+        rows = [(created, text) for created, text in rows if text]
+        self._db.execute("BEGIN")
+        try:
+            for created, text in rows:
+                rowid = self._db.execute("INSERT INTO notes (created, text) VALUES (?, ?)", (created, text)).lastrowid
+                if self.full_text:
+                    self._db.execute("INSERT INTO notes_fts (rowid, text) VALUES (?, ?)", (rowid, text))
+            self._set_meta("offset", str(offset))
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def search(self, query: str, limit: int = 10) -> list[Note]:
+        words = _QUERY_WORDS.findall(query.lower())
+        if not words:
+            return []
+        self.sync()
+        with self._lock:
+            if self.full_text:
+                match = " ".join(f'"{word}"*' for word in words)
+                rows = self._db.execute(
+                    "SELECT notes.id, notes.created, notes.text FROM notes_fts JOIN notes ON notes.id = notes_fts.rowid"
+                    " WHERE notes_fts MATCH ? ORDER BY rank, notes.id DESC LIMIT ?",
+                    (match, limit),
+                ).fetchall()
+            else:
+                clauses = " AND ".join("text LIKE ?" for _word in words)
+                rows = self._db.execute(
+                    f"SELECT id, created, text FROM notes WHERE {clauses} ORDER BY id DESC LIMIT ?",
+                    (*(f"%{word}%" for word in words), limit),
+                ).fetchall()
+        return [Note(*row) for row in rows]
+
+    def between(self, start: datetime, end: datetime, limit: int = 20) -> list[Note]:
+        self.sync()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, created, text FROM notes WHERE created >= ? AND created < ? ORDER BY created LIMIT ?",
+                (start.strftime(STAMP_FORMAT), end.strftime(STAMP_FORMAT), limit),
+            ).fetchall()
+        return [Note(*row) for row in rows]
+
+    def recent(self, limit: int = 10) -> list[Note]:
+        self.sync()
+        with self._lock:
+            rows = self._db.execute("SELECT id, created, text FROM notes ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [Note(*row) for row in reversed(rows)]
+
+    def count(self) -> int:
+        self.sync()
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+class NoteWriter:
+    """Single background writer that appends notes to the journal in batches (group commit).
+
+    Every ``append`` is queued. The writer takes whatever has queued up, up to ``max_batch``
+    lines, writes it in one go and then commits according to ``durability``:
+
+    - ``"none"``: leave the batch in the file buffer; callers do not wait. The writer lingers
+      up to ``max_delay`` seconds so bursts go out in one write.
+    - ``"flush"``: flush each batch to the OS before resolving its futures.
+    - ``"fsync"``: flush and ``os.fsync`` each batch.
+
+    The file is opened once. All lines go through one thread, so concurrent callers never
+    interleave partial lines. ``close`` runs at interpreter exit so queued notes are not lost.
+    """
+
+    def __init__(
+        self, path: str | Path, durability: str = "flush", max_batch: int = 256, max_delay: float = 0.05
+    ) -> None:
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY_LEVELS)}.")
+        self.path = Path(path)
+        self.durability = durability
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.lines = 0
+        self._queue: queue.Queue[tuple[str | None, Future]] = queue.Queue()
+        # "replace" keeps text that cannot be encoded (a lone surrogate from the web UI) from failing its batch.
+        self._fh = self.path.open("a", encoding="utf-8", errors="replace")
+        self._closed = False
+        self._stop: Future | None = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="jane-notes-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append(self, line: str) -> Future:
+        """Queue one journal line; the future resolves once its batch is committed."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed or not self._thread.is_alive():
+                raise RuntimeError("Note writer is closed.")
+            self._queue.put((line.rstrip("\n") + "\n", future))
+        return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Write and flush everything queued so far, whatever the durability level."""
+        barrier: Future = Future()
+        with self._lock:
+            if self._closed:
+                return
+            self._queue.put((None, barrier))
+        barrier.result(timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._stop = Future()
+            self._queue.put((None, self._stop))
+        self._thread.join()
+        atexit.unregister(self.close)
+        if not self._stop.done():
+            # The writer thread is gone without reaching the stop marker; nothing will resolve it.
+            self._fh.close()
+            return
+        self._stop.result()
+
+    def stats(self) -> dict[str, int | str]:
+        return {"durability": self.durability, "batches": self.batches, "lines": self.lines, "queued": self._queue.qsize()}
+
+    def _run(self) -> None:
+        fh = self._fh
+        while True:
+            batch = [self._queue.get()]
+            linger = self.durability == "none" and batch[0][0] is not None
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch and batch[-1][0] is not None:
+                try:
+                    if linger:
+                        batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line, _future in batch if line is not None]
+            barrier = batch[-1][0] is None
+            try:
+                if lines:
+                    fh.write("".join(lines))
+                    self.batches += 1
+                    self.lines += len(lines)
+                if barrier or self.durability != "none":
+                    fh.flush()
+                if self.durability == "fsync" and lines:
+                    os.fsync(fh.fileno())
+            except Exception as exc:  # noqa: BLE001
+                # Fail this batch only; the writer has to outlive one bad write.
+                for _line, future in batch:
+                    future.set_exception(exc)
+            else:
+                for _line, future in batch:
+                    future.set_result(None)
+            if barrier and batch[-1][1] is self._stop:
+                fh.close()
+                return
+
+
+def note_writer_from_env(path: str | Path) -> NoteWriter:
+    """Writer for ``path`` with durability from ``JANE_NOTES_DURABILITY`` (none, flush or fsync)."""
+    durability = os.getenv("JANE_NOTES_DURABILITY", "flush").strip().lower()
+    return NoteWriter(path, durability if durability in DURABILITY_LEVELS else "flush")
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_PROFILE_DIR = "jane_profile"
+# Leaf frames in these files are threads parked on a lock, queue or socket rather than working.
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py", "socketserver.py", "base_events.py", "thread.py")
+
+
+def profile_dir_from_env() -> Path | None:
+    """``JANE_PROFILE``: unset/``0`` disables, ``1`` writes to ``jane_profile/``, anything else is the directory."""
+    value = os.getenv("JANE_PROFILE", "").strip()
+    if value.lower() in {"", "0", "false", "no", "off"}:
+        return None
+    if value.lower() in {"1", "true", "yes", "on"}:
+        return Path(DEFAULT_PROFILE_DIR)
+    return Path(value)
+
+
+@dataclass
+class HotPathStats:
+    samples: deque = field(default_factory=lambda: deque(maxlen=10000))
+    calls: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.slowest = max(self.slowest, seconds)
+        self.samples.append(seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def _pct(pct: float) -> float:
+            return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] * 1000 if ordered else 0.0
+
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(_pct(50), 3),
+            "p99_ms": round(_pct(99), 3),
+            "max_ms": round(self.slowest * 1000, 3),
+        }
+
+
+class SamplingProfiler:
+    """Samples every thread's Python stack from a background thread.
+
+    Sampling walks ``sys._current_frames()`` every ``interval`` seconds, so the profiled code
+    runs unmodified and the cost does not grow with how many calls it makes.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="jane-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        labels: dict[Any, str] = {}
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self, busy_only: bool = False) -> list[str]:
+        """Lines in the ``frame;frame;frame count`` format read by flamegraph.pl and speedscope."""
+        lines = []
+        for stack, count in self.stacks.most_common():
+            if busy_only and len(stack) > 1 and stack[-1].rsplit("(", 1)[-1].startswith(_IDLE_FILES):
+                continue
+            lines.append(f"{';'.join(stack)} {count}")
+        return lines
+
+
+class Profiler:
+    """One profiling session: stack sampling, ``tracemalloc`` and wall-clock timings of hot paths.
+
+    ``instrument`` wraps a function or method in place and ``stop`` puts the originals back, so
+    none of this costs anything unless a session was started with ``--profile``/``JANE_PROFILE``.
+    """
+
+    def __init__(self, output_dir: str | Path = DEFAULT_PROFILE_DIR, interval: float = 0.005, frames: int = 25) -> None:
+        self.output_dir = Path(output_dir)
+        self.frames = frames
+        self.sampler = SamplingProfiler(interval)
+        self.hot_paths: dict[str, HotPathStats] = {}
+        self.started = 0.0
+        self._patched: list[tuple[Any, str, Any]] = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self) -> Profiler:
+        self.started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.sampler.start()
+        self._running = True
+        return self
+
+    def instrument(self, owner: Any, attr: str, label: str | None = None) -> None:
+        original = getattr(owner, attr)
+        label = label or f"{getattr(owner, '__name__', owner)}.{attr}"
+        stats = self.hot_paths.setdefault(label, HotPathStats())
+        lock = self._lock
+
+        @functools.wraps(original)
+        def _timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with lock:
+                    stats.add(elapsed)
+
+        self._patched.append((owner, attr, original))
+        setattr(owner, attr, _timed)
+
+    def instrument_function(self, module: Any, name: str, label: str | None = None) -> None:
+        """Wrap ``module.name`` and every already-imported ``jane`` module that imported it by name."""
+        original = getattr(module, name)
+        self.instrument(module, name, label or name)
+        wrapped = getattr(module, name)
+        for other in list(sys.modules.values()):
+            if other is not module and (getattr(other, "__name__", "") or "").startswith(("jane", "benchmarks")):
+                if getattr(other, name, None) is original:
+                    self._patched.append((other, name, original))
+                    setattr(other, name, wrapped)
+
+    def stop(self) -> Path | None:
+        """Stop sampling, restore instrumented callables and write the reports; returns the run directory."""
+        if not self._running:
+            return None
+        self._running = False
+        self.sampler.stop()
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched.clear()
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        current, peak = tracemalloc.get_traced_memory() if snapshot is not None else (0, 0)
+        tracemalloc.stop()
+
+        run_dir = self.output_dir / datetime.now().strftime("%Y%m%d-%H%M%S")
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "wall.collapsed").write_text("\n".join(self.sampler.collapsed()) + "\n", encoding="utf-8")
+        (run_dir / "busy.collapsed").write_text(
+            "\n".join(self.sampler.collapsed(busy_only=True)) + "\n", encoding="utf-8"
+        )
+        (run_dir / "hot_paths.txt").write_text(self.hot_path_report(), encoding="utf-8")
+        if snapshot is not None:
+            (run_dir / "allocations.txt").write_text(self.allocation_report(snapshot, current, peak), encoding="utf-8")
+        return run_dir
+
+    def hot_path_report(self) -> str:
+        lines = [
+            f"Session: {time.perf_counter() - self.started:.1f}s, {self.sampler.samples} stack samples",
+            "",
+            f"{'hot path':<36}{'calls':>9}{'total ms':>12}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        with self._lock:
+            rows = {label: stats.to_dict() for label, stats in self.hot_paths.items()}
+        for label, row in sorted(rows.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(
+                f"{label:<36}{row['calls']:>9}{row['total_ms']:>12.1f}{row['mean_ms']:>10.3f}"
+                f"{row['p50_ms']:>10.3f}{row['p99_ms']:>10.3f}{row['max_ms']:>10.3f}"
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def allocation_report(snapshot: tracemalloc.Snapshot, current: int, peak: int, limit: int = 30) -> str:
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            )
+        )
+        lines = [f"Traced memory: {current / 1024:.1f} KiB live, {peak / 1024:.1f} KiB peak", ""]
+        lines.append(f"Top {limit} allocation sites by live size:")
+        for stat in snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+        lines.append("")
+        lines.append("Largest allocation tracebacks:")
+        for stat in snapshot.statistics("traceback")[:5]:
+            lines.append(f"{stat.size / 1024:.1f} KiB in {stat.count} blocks")
+            lines.extend(f"    {line}" for line in stat.traceback.format(most_recent_first=True)[:12])
+        return "\n".join(lines) + "\n"
+
+
+def start_profiling(output_dir: str | Path, extra: Callable[[Profiler], None] | None = None) -> Profiler:
+    """Start a session with JANE's hot paths instrumented; ``extra`` can wrap entry-point specific ones."""
+    from jane import commands
+    from jane.actions import ActionExecutor
+
+    profiler = Profiler(output_dir).start()
+    profiler.instrument_function(commands, "parse_command")
+    profiler.instrument(ActionExecutor, "execute", "ActionExecutor.execute")
+    try:
+        from jane.speech import SpeechEngine
+    except ImportError:
+        # The web server runs without the desktop audio stack installed.
+        pass
+    else:
+        profiler.instrument(SpeechEngine, "listen_once", "SpeechEngine.listen_once")
+        profiler.instrument(SpeechEngine, "speak", "SpeechEngine.speak")
+    if extra is not None:
+        extra(profiler)
+    return profiler
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Protocol
+
+from jane.audio import AudioClip
+from jane.profiling import HotPathStats
+
+TARGET_RATE = 16000
+
+
+class RecognitionError(RuntimeError):
+    """The backend could not run (missing package or model, network down), as opposed to hearing nothing."""
+
+
+class RecognizerBackend(Protocol):
+    name: str
+
+    def warm(self) -> None: ...
+
+    def transcribe(self, clip: AudioClip) -> str: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+
+def _pcm16(clip: AudioClip, rate: int = TARGET_RATE) -> bytes:
+    """16-bit mono PCM at ``rate``, which is what every offline engine here expects."""
+    if clip.sample_rate == rate and clip.sample_width == 2:
+        return clip.data
+    return clip.to_audio_data().get_raw_data(convert_rate=rate, convert_width=2)
+
+
+class _Backend:
+    """Shared bookkeeping: a one-time ``_load`` under a lock, and latency per transcription."""
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.latency = HotPathStats()
+        self.errors = 0
+        self.load_seconds: float | None = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._unavailable: RecognitionError | None = None
+
+    def warm(self) -> None:
+        with self._lock:
+            if self._unavailable is not None:
+                # A missing package or model will not appear mid-session; fail fast to the fallback.
+                raise self._unavailable
+            if not self._loaded:
+                started = time.perf_counter()
+                try:
+                    self._load()
+                except RecognitionError as exc:
+                    self._unavailable = exc
+                    raise
+                self.load_seconds = time.perf_counter() - started
+                self._loaded = True
+
+    def transcribe(self, clip: AudioClip) -> str:
+        """Text heard in ``clip`` ("" for nothing intelligible); latency excludes the one-time model load."""
+        try:
+            self.warm()
+            started = time.perf_counter()
+            try:
+                return self._transcribe(clip).strip()
+            finally:
+                self.latency.add(time.perf_counter() - started)
+        except RecognitionError:
+            self.errors += 1
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        load = round(self.load_seconds * 1000, 1) if self.load_seconds is not None else None
+        return {"backend": self.name, "errors": self.errors, "load_ms": load, **self.latency.to_dict()}
+
+    def _load(self) -> None:
+        pass
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        raise NotImplementedError
+
+
+class GoogleRecognizer(_Backend):
+    """SpeechRecognition's free Google Web Speech endpoint (needs network)."""
+
+    name = "google"
+
+    def _load(self) -> None:
+        try:
+            import speech_recognition as sr
+        except ImportError as exc:
+            raise RecognitionError("Install SpeechRecognition: pip install SpeechRecognition") from exc
+        self._sr = sr
+        self._recognizer = sr.Recognizer()
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        try:
+            return self._recognizer.recognize_google(clip.to_audio_data())
+        except self._sr.UnknownValueError:
+            return ""
+        except self._sr.RequestError as exc:
+            raise RecognitionError(f"Google speech request failed: {exc}") from exc
+
+
+class VoskRecognizer(_Backend):
+    """Offline Kaldi models via ``vosk``; ``model_path`` is an unpacked model directory."""
+
+    name = "vosk"
+
+    def __init__(self, model_path: str | None = None) -> None:
+        super().__init__()
+        self.model_path = model_path
+
+    def _load(self) -> None:
+        try:
+            import vosk
+        except ImportError as exc:
+            raise RecognitionError("Install vosk for offline recognition: pip install vosk") from exc
+        vosk.SetLogLevel(-1)
+        try:
+            self._model = vosk.Model(self.model_path) if self.model_path else vosk.Model(lang="en-us")
+        except Exception as exc:  # noqa: BLE001
+            raise RecognitionError(f"Could not load the Vosk model: {exc}") from exc
+        self._vosk = vosk
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        # Recognizers are cheap next to the model and not thread-safe, so one per utterance.
+        recognizer = self._vosk.KaldiRecognizer(self._model, TARGET_RATE)
+        recognizer.AcceptWaveform(_pcm16(clip))
+        return json.loads(recognizer.FinalResult()).get("text", "")
+
+
+class SphinxRecognizer(_Backend):
+    """Offline CMU PocketSphinx (5.x API) with its bundled US English model."""
+
+    name = "sphinx"
+
+    def _load(self) -> None:
+        try:
+            from pocketsphinx import Decoder
+        except ImportError as exc:
+            raise RecognitionError("Install pocketsphinx for offline recognition: pip install pocketsphinx") from exc
+        try:
+            self._decoder = Decoder(samprate=TARGET_RATE)
+        except Exception as exc:  # noqa: BLE001
+            raise RecognitionError(f"Could not start the PocketSphinx decoder: {exc}") from exc
+        self._decode_lock = threading.Lock()
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        with self._decode_lock:
+            self._decoder.start_utt()
+            self._decoder.process_raw(_pcm16(clip), full_utt=True)
+            self._decoder.end_utt()
+            hypothesis = self._decoder.hyp()
+        return hypothesis.hypstr if hypothesis is not None else ""
+
+
+class WhisperRecognizer(_Backend):
+    """Offline Whisper via ``faster-whisper``, int8 on the CPU by default."""
+
+    name = "whisper"
+
+    def __init__(self, model: str = "base.en", compute_type: str = "int8") -> None:
+        super().__init__()
+        self.model = model
+        self.compute_type = compute_type
+
+    def _load(self) -> None:
+        try:
+            import numpy
+            from faster_whisper import WhisperModel
+        except ImportError as exc:
+            raise RecognitionError("Install faster-whisper for Whisper models: pip install faster-whisper") from exc
+        self._numpy = numpy
+        try:
+            self._model = WhisperModel(self.model, device="cpu", compute_type=self.compute_type)
+        except Exception as exc:  # noqa: BLE001
+            raise RecognitionError(f"Could not load the Whisper model {self.model!r}: {exc}") from exc
+        self._decode_lock = threading.Lock()
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        np = self._numpy
+        samples = np.frombuffer(_pcm16(clip), dtype=np.int16).astype(np.float32) / 32768.0
+        with self._decode_lock:
+            segments, _info = self._model.transcribe(samples, language="en", beam_size=1)
+            return "".join(segment.text for segment in segments)
+
+
+class FallbackRecognizer(_Backend):
+    """Tries each backend in order, moving on when one raises ``RecognitionError``."""
+
+    def __init__(self, backends: list[_Backend]) -> None:
+        super().__init__()
+        self.backends = backends
+        self.name = ",".join(backend.name for backend in backends)
+
+    def warm(self) -> None:
+        for backend in self.backends:
+            try:
+                backend.warm()
+            except RecognitionError:
+                continue
+
+    def _transcribe(self, clip: AudioClip) -> str:
+        failures = []
+        for backend in self.backends:
+            try:
+                return backend.transcribe(clip)
+            except RecognitionError as exc:
+                failures.append(str(exc))
+        raise RecognitionError("; ".join(failures))
+
+    def stats(self) -> dict[str, Any]:
+        stats = super().stats()
+        stats["backends"] = [backend.stats() for backend in self.backends]
+        return stats
+
+
+BACKENDS = {
+    "google": GoogleRecognizer,
+    "vosk": lambda: VoskRecognizer(os.getenv("JANE_VOSK_MODEL") or None),
+    "sphinx": SphinxRecognizer,
+    "pocketsphinx": SphinxRecognizer,
+    "whisper": lambda: WhisperRecognizer(os.getenv("JANE_WHISPER_MODEL") or "base.en"),
+}
+
+
+def recognizer_from_env() -> _Backend:
+    """``JANE_STT_BACKEND``: one of google, vosk, sphinx, whisper, or a comma-separated fallback order."""
+    names = [name.strip().lower() for name in os.getenv("JANE_STT_BACKEND", "google").split(",") if name.strip()]
+    backends = [BACKENDS[name]() for name in names if name in BACKENDS] or [GoogleRecognizer()]
+    return backends[0] if len(backends) == 1 else FallbackRecognizer(backends)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from jane.actions import ActionExecutor, ActionResult
+    from jane.commands import ParsedCommand
+
+    Handler = Callable[[ActionExecutor, ParsedCommand], ActionResult]
+
+ENTRY_POINT_GROUP = "jane.actions"
+DEFAULT_ACTION_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """Metadata for one action plus where to find its handler.
+
+    ``handler`` is a ``"module:callable"`` reference that is only imported the first time the
+    action runs. The callable takes ``(executor, cmd)`` and returns an ``ActionResult``.
+    ``kind`` picks the async engine's worker pool: ``"cpu"``, ``"io"`` or ``"network"``.
+    ``elevated`` optionally names a ``(executor, cmd) -> ElevatedCommand | None`` planner so the
+    action can join a batch of approved commands that share one elevation prompt.
+    ``shares`` names state the action reads or writes (``"notes"``); in a batch of commands, those
+    sharing a value run one after another in order, as do repeats of one action.
+    """
+
+    action: str
+    handler: str
+    kind: str = "io"
+    high_risk: bool = False
+    timeout: float | None = DEFAULT_ACTION_TIMEOUT
+    elevated: str = ""
+    shares: str = ""
+
+
+def _load(reference: str) -> Callable:
+    module_name, _, attr = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class ActionRegistry:
+    def __init__(self, specs: Iterable[ActionSpec] = ()) -> None:
+        self._specs: dict[str, ActionSpec] = {}
+        self._handlers: dict[str, Handler] = {}
+        self._lock = threading.Lock()
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ActionSpec, handler: Handler | None = None) -> None:
+        with self._lock:
+            self._specs[spec.action] = spec
+            if handler is not None:
+                self._handlers[spec.action] = handler
+            else:
+                self._handlers.pop(spec.action, None)
+
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """Register the ``ActionSpec`` objects published under an entry-point group.
+
+        Only the module holding each spec is imported here; its handler still loads lazily.
+        """
+        found = 0
+        for entry in entry_points(group=group):
+            try:
+                spec = entry.load()
+            except Exception:
+                continue
+            if isinstance(spec, ActionSpec):
+                self.register(spec)
+                found += 1
+        return found
+
+    def spec(self, action: str) -> ActionSpec | None:
+        return self._specs.get(action)
+
+    def handler(self, action: str) -> Handler | None:
+        handler = self._handlers.get(action)
+        if handler is not None:
+            return handler
+        spec = self._specs.get(action)
+        if spec is None:
+            return None
+        with self._lock:
+            handler = self._handlers.get(action)
+            if handler is None:
+                handler = self._handlers[action] = _load(spec.handler)
+        return handler
+
+    def elevated_planner(self, action: str) -> Callable | None:
+        spec = self._specs.get(action)
+        if spec is None or not spec.elevated:
+            return None
+        return _load(spec.elevated)
+
+    def actions(self) -> list[str]:
+        return list(self._specs)
+
+    def loaded(self) -> list[str]:
+        return list(self._handlers)
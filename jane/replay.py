@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Iterator, TextIO
+
+from jane.commands import parse_commands
+
+
+def _read_lines(stream: TextIO) -> Iterator[str]:
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def replay(source: TextIO, sink: TextIO, workers: int = 1, chunk_size: int = 1000, fuzzy: bool = True) -> int:
+    count = 0
+    for parsed in parse_commands(_read_lines(source), workers=workers, chunk_size=chunk_size, fuzzy=fuzzy):
+        sink.write(json.dumps(parsed.to_dict(), ensure_ascii=False))
+        sink.write("\n")
+        count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m jane.replay",
+        description="Classify newline-delimited utterances and write one ParsedCommand JSON record per line.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="Utterance file, or '-' for stdin (default).")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON output file, or '-' for stdout (default).")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Parser processes to use (default: 1).")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Lines per worker chunk (default: 1000).")
+    parser.add_argument("--no-fuzzy", action="store_true", help="Disable misspelling recovery before chat fallback.")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        replay(source, sink, workers=args.workers, chunk_size=max(1, args.chunk_size), fuzzy=not args.no_fuzzy)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable
+
+_UNITS = {"s": 1, "sec": 1, "second": 1, "m": 60, "min": 60, "minute": 60, "h": 3600, "hr": 3600, "hour": 3600}
+_DELAY = re.compile(
+    r"\b(?:in|after)\s+(\d+(?:\.\d+)?|an?|one)\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?|[smh])\b",
+    re.IGNORECASE,
+)
+
+
+def parse_delay(text: str) -> tuple[float, str] | None:
+    """Split "in 20 minutes to stretch" into ``(1200.0, "stretch")``; None without a delay."""
+    found = _DELAY.search(text)
+    if found is None:
+        return None
+    amount, unit = found.groups()
+    count = 1.0 if amount.lower() in {"a", "an", "one"} else float(amount)
+    unit = unit.lower()
+    unit = unit[:-1] if unit.endswith("s") and len(unit) > 1 else unit
+    rest = f"{text[: found.start()]} {text[found.end() :]}"
+    rest = re.sub(r"^\s*(?:,\s*)?(?:to\s+|that\s+)?", "", " ".join(rest.split()), flags=re.IGNORECASE)
+    return count * _UNITS[unit], rest.strip(" ,.")
+
+
+@dataclass(eq=False)
+class ScheduledJob:
+    """A pending timer. ``callback`` returns the delay until it should run again, or None when done."""
+
+    id: int
+    label: str
+    kind: str
+    due: float
+    callback: Callable[[ScheduledJob], float | None] = field(repr=False)
+    on_cancel: Callable[[ScheduledJob], None] | None = field(default=None, repr=False)
+    cancelled: bool = False
+
+    def to_dict(self, now: float | None = None) -> dict[str, Any]:
+        remaining = max(0.0, self.due - (time.monotonic() if now is None else now))
+        return {
+            "id": self.id,
+            "label": self.label,
+            "kind": self.kind,
+            "due_in": round(remaining, 1),
+            "due_at": datetime.fromtimestamp(time.time() + remaining).strftime("%H:%M:%S"),
+        }
+
+
+class Scheduler:
+    """Timers on one thread around a heap ordered by due time.
+
+    Pending jobs cost a heap entry each, so thousands of reminders do not need thousands of
+    threads. Cancelling marks the job and drops it from the id table; its stale heap entry is
+    skipped when it surfaces, and the heap is rebuilt once stale entries dominate. Callbacks run
+    on the scheduler thread and should hand anything slow to a worker pool.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.fired = 0
+        self._heap: list[tuple[float, int, ScheduledJob]] = []
+        self._jobs: dict[int, ScheduledJob] = {}
+        self._ids = itertools.count(1)
+        self._order = itertools.count()
+        self._stale = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._cond = threading.Condition()
+
+    def schedule(
+        self,
+        delay: float,
+        callback: Callable[[ScheduledJob], float | None],
+        label: str = "",
+        kind: str = "action",
+        on_cancel: Callable[[ScheduledJob], None] | None = None,
+    ) -> ScheduledJob:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler is closed.")
+            job = ScheduledJob(next(self._ids), label, kind, self.clock() + max(0.0, delay), callback, on_cancel)
+            self._jobs[job.id] = job
+            self._push(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="jane-scheduler", daemon=True)
+                self._thread.start()
+            return job
+
+    def cancel(self, job_id: int) -> bool:
+        with self._cond:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return False
+            self._retire(job)
+        if job.on_cancel is not None:
+            job.on_cancel(job)
+        return True
+
+    def cancel_all(self, kind: str | None = None) -> int:
+        with self._cond:
+            jobs = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+            for job in jobs:
+                del self._jobs[job.id]
+                self._retire(job)
+        for job in jobs:
+            if job.on_cancel is not None:
+                job.on_cancel(job)
+        return len(jobs)
+
+    def pending(self, kind: str | None = None) -> list[ScheduledJob]:
+        with self._cond:
+            jobs = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+        return sorted(jobs, key=lambda job: job.due)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            for job in self._jobs.values():
+                job.cancelled = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._stale = 0
+            self._cond.notify_all()
+
+    def _push(self, job: ScheduledJob) -> None:
+        heapq.heappush(self._heap, (job.due, next(self._order), job))
+        self._cond.notify_all()
+
+    def _retire(self, job: ScheduledJob) -> None:
+        job.cancelled = True
+        self._stale += 1
+        if self._stale > 64 and self._stale * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._stale = 0
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    due, _order, job = self._heap[0]
+                    if job.cancelled:
+                        heapq.heappop(self._heap)
+                        self._stale = max(0, self._stale - 1)
+                        continue
+                    wait = due - self.clock()
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+                    heapq.heappop(self._heap)
+                    break
+            try:
+                again = job.callback(job)
+            except Exception:
+                again = None
+            with self._cond:
+                self.fired += 1
+                if job.cancelled or self._closed:
+                    continue
+                if again is None:
+                    self._jobs.pop(job.id, None)
+                else:
+                    job.due = max(self.clock(), job.due + max(0.0, again))
+                    self._push(job)
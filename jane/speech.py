@@ -3,22 +3,55 @@ from __future__ import annotations
 import threading
 
 import pyttsx3
-import speech_recognition as sr
+
+from jane.audio import AudioClip, CaptureSession, MicrophoneSource, capture_session_from_env
+from jane.recognizers import RecognitionError, RecognizerBackend, recognizer_from_env
 
 
 class SpeechEngine:
-    def __init__(self) -> None:
-        self.recognizer = sr.Recognizer()
+    def __init__(self, capture: CaptureSession | None = None, recognizer: RecognizerBackend | None = None) -> None:
+        # Chosen per deployment with JANE_STT_BACKEND; offline models load once, in warm_up().
+        self.recognizer = recognizer if recognizer is not None else recognizer_from_env()
         self.tts = pyttsx3.init()
         self._speak_lock = threading.Lock()
+        # The microphone is opened on first listen (or by start_capture) and then kept open.
+        self._capture = capture
+        self._capture_lock = threading.Lock()
+
+    @property
+    def capture(self) -> CaptureSession:
+        with self._capture_lock:
+            if self._capture is None:
+                self._capture = capture_session_from_env(MicrophoneSource())
+            return self._capture
+
+    def start_capture(self) -> None:
+        self.capture.start()
+
+    def warm_up(self) -> None:
+        def _warm() -> None:
+            try:
+                self.recognizer.warm()
+            except RecognitionError:
+                pass  # Reported on the first listen, where the user can see it.
+
+        threading.Thread(target=_warm, name="jane-stt-warmup", daemon=True).start()
 
     def listen_once(self, timeout: int = 5, phrase_time_limit: int = 8) -> str:
-        with sr.Microphone() as source:
-            self.recognizer.adjust_for_ambient_noise(source, duration=0.4)
-            audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
-        return self.recognizer.recognize_google(audio)
+        return self.recognize(self.capture.listen(timeout=timeout, phrase_time_limit=phrase_time_limit))
+
+    def recognize(self, clip: AudioClip) -> str:
+        return self.recognizer.transcribe(clip)
 
     def speak(self, text: str) -> None:
         with self._speak_lock:
             self.tts.say(text)
             self.tts.runAndWait()
+
+    def stop_speaking(self) -> None:
+        # Not under _speak_lock: it has to cut into a runAndWait that is holding it.
+        self.tts.stop()
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.close()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+
+_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+|\n+")
+_ABBREVIATIONS = frozenset({"e.g.", "i.e.", "etc.", "vs.", "mr.", "mrs.", "ms.", "dr.", "st.", "no."})
+
+
+class SentenceSplitter:
+    """Turns a stream of text chunks into complete sentences as soon as each one ends.
+
+    A sentence is only released once the whitespace after its closing punctuation has arrived,
+    so a chunk boundary inside "3.5" or "e.g." never splits it.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> list[str]:
+        self._buffer += chunk
+        sentences: list[str] = []
+        start = 0
+        for boundary in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start : boundary.start()].strip()
+            if not candidate:
+                start = boundary.end()
+                continue
+            last_word = candidate.rsplit(None, 1)[-1].lower()
+            if last_word in _ABBREVIATIONS and "\n" not in boundary.group():
+                continue
+            sentences.append(candidate)
+            start = boundary.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> str:
+        tail, self._buffer = self._buffer.strip(), ""
+        return tail
+
+
+def split_sentences(text: str) -> list[str]:
+    splitter = SentenceSplitter()
+    sentences = splitter.feed(text)
+    tail = splitter.flush()
+    return sentences + [tail] if tail else sentences
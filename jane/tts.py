@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from jane.profiling import HotPathStats
+
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+# Seconds an utterance may wait before it is too late to be worth saying; None never expires.
+STALE_AFTER: dict[int, float | None] = {PRIORITY_URGENT: None, PRIORITY_NORMAL: 20.0, PRIORITY_LOW: 5.0}
+_DEFAULT = object()
+
+
+def utterance_key(text: str, key: str | None = None) -> str:
+    """The caller's ``key`` when given; otherwise the text itself, so only exact repeats collide."""
+    return f"key:{key}" if key is not None else "text:" + " ".join(text.lower().split())
+
+
+@dataclass(order=True)
+class Utterance:
+    priority: int
+    seq: int
+    text: str = field(compare=False)
+    key: str = field(compare=False)
+    enqueued: float = field(compare=False)
+    max_age: float | None = field(compare=False)
+    # Part of something that must be heard in full; overflow trimming never drops it.
+    keep: bool = field(default=False, compare=False)
+    dropped: bool = field(default=False, compare=False)
+
+
+class SpeechQueue:
+    """One worker thread that speaks queued utterances, most urgent first, then in arrival order.
+
+    A new utterance supersedes a pending one said with the same ``key`` (a countdown passes one,
+    so it only ever says its latest number); without a key only an exact repeat is dropped.
+    Beyond ``max_depth`` pending utterances the least urgent, newest ones are shed;
+    ``coalesce=False`` ones are never shed and do not count. Utterances that waited longer than
+    their priority's ``STALE_AFTER`` are dropped rather than spoken late. An urgent utterance
+    interrupts a less urgent one that is playing, via ``interrupt``.
+    """
+
+    def __init__(
+        self,
+        speak: Callable[[str], None],
+        interrupt: Callable[[], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        max_depth: int = 32,
+    ) -> None:
+        self.speak = speak
+        self.interrupt = interrupt
+        self.on_error = on_error
+        self.max_depth = max_depth
+        self.wait_latency = HotPathStats()
+        self.speak_time = HotPathStats()
+        self.counters = {"spoken": 0, "coalesced": 0, "duplicates": 0, "stale": 0, "overflow": 0, "interrupted": 0}
+        self._heap: list[Utterance] = []
+        self._pending: dict[str, Utterance] = {}
+        self._seq = itertools.count()
+        self._current: Utterance | None = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="jane-tts", daemon=True)
+        self._thread.start()
+
+    def say(
+        self,
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+        max_age: float | None | object = _DEFAULT,
+        coalesce: bool = True,
+        key: str | None = None,
+    ) -> bool:
+        """Queue ``text``; returns False when it was dropped as a duplicate of what is already pending.
+
+        ``key`` names what the text is about, so a newer utterance with the same key replaces a
+        pending one. ``coalesce=False`` opts out of superseding and of overflow trimming, for text
+        whose every part must be heard (the sentences of a streamed reply).
+        """
+        text = text.strip()
+        if not text:
+            return False
+        max_age = STALE_AFTER.get(priority, None) if max_age is _DEFAULT else max_age
+        interrupt = False
+        with self._cond:
+            if self._closed:
+                return False
+            seq = next(self._seq)
+            key = utterance_key(text, key) if coalesce else f"#{seq}"
+            previous = self._pending.get(key)
+            if previous is not None:
+                if previous.text == text and previous.priority <= priority:
+                    self.counters["duplicates"] += 1
+                    return False
+                previous.dropped = True
+                self.counters["coalesced"] += 1
+            utterance = Utterance(priority, seq, text, key, time.monotonic(), max_age, keep=not coalesce)
+            self._pending[key] = utterance
+            heapq.heappush(self._heap, utterance)
+            self._trim()
+            current = self._current
+            if priority == PRIORITY_URGENT and current is not None and current.priority > PRIORITY_URGENT:
+                interrupt = self.interrupt is not None
+                self.counters["interrupted"] += interrupt
+            self._cond.notify()
+        if interrupt:
+            self.interrupt()
+        return True
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            stats: dict[str, Any] = dict(self.counters)
+            stats["depth"] = len(self._pending)
+            stats["speaking"] = self._current is not None
+            # The worker adds samples under the same lock, so read them in one consistent snapshot.
+            stats["wait"] = self.wait_latency.to_dict()
+            stats["speak"] = self.speak_time.to_dict()
+        return stats
+
+    def clear(self) -> int:
+        """Drop everything pending (the utterance playing now finishes); returns how many were dropped."""
+        with self._cond:
+            dropped = len(self._pending)
+            for utterance in self._pending.values():
+                utterance.dropped = True
+            self._pending.clear()
+            self._heap.clear()
+            return dropped
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.clear()
+
+    def _trim(self) -> None:
+        # Kept utterances neither count towards max_depth nor get shed.
+        candidates = [item for item in self._pending.values() if not item.keep]
+        while len(candidates) > self.max_depth:
+            # Shed the least urgent, newest-queued utterance first.
+            victim = max(candidates, key=lambda item: (item.priority, item.seq))
+            candidates.remove(victim)
+            victim.dropped = True
+            del self._pending[victim.key]
+            self.counters["overflow"] += 1
+
+    def _next(self) -> Utterance | None:
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                while self._heap and self._heap[0].dropped:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                utterance = heapq.heappop(self._heap)
+                del self._pending[utterance.key]
+                waited = time.monotonic() - utterance.enqueued
+                if utterance.max_age is not None and waited > utterance.max_age:
+                    self.counters["stale"] += 1
+                    continue
+                self.wait_latency.add(waited)
+                self._current = utterance
+                return utterance
+
+    def _run(self) -> None:
+        while True:
+            utterance = self._next()
+            if utterance is None:
+                return
+            started = time.monotonic()
+            try:
+                self.speak(utterance.text)
+            except Exception as exc:  # noqa: BLE001
+                if self.on_error is not None:
+                    self.on_error(exc)
+            finally:
+                with self._cond:
+                    self._current = None
+                    self.counters["spoken"] += 1
+                    self.speak_time.add(time.monotonic() - started)
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import queue
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Protocol
+
+from jane.audio import _TYPECODES, AudioClip, CaptureSession, rms
+
+
+class AudioRingBuffer:
+    """Fixed-size byte ring addressed by absolute stream offsets.
+
+    ``total`` counts every byte ever written, so a caller can remember where a segment started
+    and slice it out later, as long as it is still within the last ``capacity`` bytes.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.total = 0
+        self._data = bytearray(capacity)
+
+    def write(self, chunk: bytes) -> None:
+        chunk = chunk[-self.capacity :]
+        start = self.total % self.capacity
+        head = min(len(chunk), self.capacity - start)
+        self._data[start : start + head] = chunk[:head]
+        self._data[: len(chunk) - head] = chunk[head:]
+        self.total += len(chunk)
+
+    def slice(self, start: int, end: int | None = None) -> bytes:
+        end = self.total if end is None else min(end, self.total)
+        start = max(start, self.total - self.capacity, 0)
+        if start >= end:
+            return b""
+        first, last = start % self.capacity, end % self.capacity
+        if first < last:
+            return bytes(self._data[first:last])
+        return bytes(self._data[first:]) + bytes(self._data[:last])
+
+
+def frame_features(clip: AudioClip, frame_ms: int = 20) -> list[tuple[float, float]]:
+    """Per-frame (relative log energy, zero-crossing rate): a cheap spectral sketch for template matching."""
+    samples = array(_TYPECODES[clip.sample_width])
+    samples.frombytes(clip.data[: len(clip.data) - len(clip.data) % clip.sample_width])
+    size = max(1, clip.sample_rate * frame_ms // 1000)
+    frames = []
+    for offset in range(0, len(samples) - size + 1, size):
+        frame = samples[offset : offset + size]
+        energy = math.sqrt(sum(s * s for s in frame) / size)
+        crossings = sum(1 for a, b in zip(frame, frame[1:]) if (a < 0) != (b < 0))
+        frames.append((math.log10(energy + 1.0), crossings / size))
+    if not frames:
+        return []
+    peak = max(energy for energy, _zcr in frames)
+    return [(energy - peak, zcr * 4.0) for energy, zcr in frames]
+
+
+def _voiced_span(features: list[tuple[float, float]], floor: float = -1.0) -> tuple[int, int]:
+    """First and one-past-last frame within ``floor`` (log10 units) of the loudest frame."""
+    voiced = [index for index, (energy, _zcr) in enumerate(features) if energy >= floor]
+    return (voiced[0], voiced[-1] + 1) if voiced else (0, 0)
+
+
+def _dtw(template: list[tuple[float, float]], segment: list[tuple[float, float]], open_end: bool) -> tuple[float, int]:
+    """Length-normalised DTW cost of ``template`` against ``segment`` (or its best prefix when ``open_end``)."""
+    n, m = len(template), len(segment)
+    if not n or not m:
+        return math.inf, 0
+    inf = math.inf
+    previous = [inf] * (m + 1)
+    previous[0] = 0.0
+    for i in range(1, n + 1):
+        te, tz = template[i - 1]
+        current = [inf] * (m + 1)
+        for j in range(1, m + 1):
+            se, sz = segment[j - 1]
+            cost = math.sqrt((te - se) ** 2 + (tz - sz) ** 2)
+            current[j] = cost + min(previous[j], previous[j - 1], current[j - 1])
+        previous = current
+    if not open_end:
+        return previous[m] / (n + m), m
+    lo = max(1, n // 2)
+    best, end = min(((previous[j] / (n + j), j) for j in range(lo, m + 1)), default=(inf, 0))
+    return best, end
+
+
+class WakeWordDetector(Protocol):
+    def detect(self, clip: AudioClip) -> float | None:
+        """Seconds into ``clip`` where the wake word ends, or None when it is not there."""
+
+
+class TemplateWakeWord:
+    """Matches the start of a segment against a few enrolled recordings of the wake word.
+
+    Features are 20 ms energy/zero-crossing frames and matching is open-ended DTW, so a
+    detection costs a few milliseconds of pure Python and also tells where the command starts.
+    """
+
+    def __init__(self, templates: list[list[tuple[float, float]]] | None = None, threshold: float = 0.35) -> None:
+        self.templates = list(templates or [])
+        self.threshold = threshold
+        self.frame_ms = 20
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.templates)
+
+    def enroll(self, clip: AudioClip) -> None:
+        """Add one recording of just the wake word; with two or more the threshold is re-derived."""
+        features = frame_features(clip, self.frame_ms)
+        start, end = _voiced_span(features)
+        if end > start:
+            self.templates.append(features[start:end])
+        if len(self.templates) >= 2:
+            spread = [
+                _dtw(a, b, open_end=False)[0]
+                for index, a in enumerate(self.templates)
+                for b in self.templates[index + 1 :]
+            ]
+            self.threshold = max(0.15, max(spread) * 1.5)
+
+    def detect(self, clip: AudioClip) -> float | None:
+        if not self.templates:
+            return None
+        segment = frame_features(clip, self.frame_ms)
+        # Leading pre-roll silence would otherwise have to align with the template's first syllable.
+        start, _end = _voiced_span(segment)
+        scored = []
+        for template in self.templates:
+            window = segment[start : start + 2 * len(template)]
+            scored.append(_dtw(template, window, open_end=True))
+        cost, end = min(scored)
+        if cost > self.threshold:
+            return None
+        return (start + end) * self.frame_ms / 1000
+
+    def save(self, path: str | Path) -> None:
+        payload = {"threshold": self.threshold, "frame_ms": self.frame_ms, "templates": self.templates}
+        Path(path).write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> TemplateWakeWord:
+        try:
+            raw = json.loads(Path(path).read_text(encoding="utf-8"))
+            templates = [[(float(e), float(z)) for e, z in template] for template in raw["templates"]]
+            return cls(templates, float(raw["threshold"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+
+def wake_word_file() -> Path:
+    return Path(os.getenv("JANE_WAKEWORD_FILE", "jane_wakeword.json"))
+
+
+class WakeWordListener:
+    """Always-on listening that only pays for recognition after the wake word.
+
+    Audio from the capture session goes into a ring buffer. A chunk-energy gate against the
+    session's calibrated threshold finds speech segments. Each segment's opening is checked by
+    the local ``detector``, and only the audio after a detected wake word reaches ``recognize``
+    (on its own worker, so the gate never stalls). Silence and other speech cost one RMS per chunk.
+
+    A microphone failure goes to ``on_error`` and the session is reopened once after
+    ``restart_delay`` seconds; if that fails too the listener stops and calls ``on_stopped``.
+    """
+
+    IDLE, CANDIDATE, REJECTED, COMMAND = range(4)
+
+    def __init__(
+        self,
+        session: CaptureSession,
+        detector: WakeWordDetector,
+        recognize: Callable[[AudioClip], str],
+        on_command: Callable[[str], None],
+        on_wake: Callable[[], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        on_stopped: Callable[[Exception], None] | None = None,
+        ring_seconds: float = 15.0,
+        wake_window: float = 1.6,
+        gap: float = 0.25,
+        pause: float = 0.8,
+        command_timeout: float = 4.0,
+        phrase_time_limit: float = 8.0,
+        pre_roll: float = 0.2,
+        restart_delay: float = 1.0,
+    ) -> None:
+        self.session = session
+        self.detector = detector
+        self.recognize = recognize
+        self.on_command = on_command
+        self.on_wake = on_wake
+        self.on_error = on_error
+        self.on_stopped = on_stopped
+        source = session.source
+        self._rate = source.sample_rate * source.sample_width
+        self.ring = AudioRingBuffer(int(ring_seconds * self._rate))
+        self.wake_window = wake_window
+        self.gap = gap
+        self.pause = pause
+        self.command_timeout = command_timeout
+        self.phrase_time_limit = phrase_time_limit
+        self.pre_roll = pre_roll
+        self.restart_delay = restart_delay
+        self.counters = {
+            "chunks": 0,
+            "segments": 0,
+            "detector_runs": 0,
+            "wakes": 0,
+            "recognizer_calls": 0,
+            "restarts": 0,
+        }
+        self._state = self.IDLE
+        self._voiced = 0
+        self._quiet = 0.0
+        self._start = 0
+        self._spoke = False
+        self._holding = False
+        self._chunks: queue.Queue[bytes] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jane-recognize")
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if not self.running:
+            self.stop()  # Tidies up after a listener that gave up on a failed microphone.
+            self._stop.clear()
+            self._chunks = self.session.subscribe()
+            self._thread = threading.Thread(target=self._run, name="jane-wakeword", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+            self.session.unsubscribe(self._chunks)
+            self._chunks = None
+            self._idle()
+
+    def close(self) -> None:
+        self.stop()
+        self._worker.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, float | int]:
+        stats: dict[str, float | int] = dict(self.counters)
+        stats["gated_seconds"] = round(self.counters["chunks"] * self._chunk_seconds(), 1)
+        return stats
+
+    def feed(self, chunk: bytes) -> None:
+        """Advance the gate by one chunk; the listener thread calls this for each chunk it receives."""
+        self.ring.write(chunk)
+        self.counters["chunks"] += 1
+        seconds = len(chunk) / self._rate
+        loud = rms(chunk, self.session.source.sample_width) > self.session.energy_threshold
+        self._quiet = 0.0 if loud else self._quiet + seconds
+
+        if self._state == self.IDLE:
+            self._voiced = self._voiced + 1 if loud else 0
+            if self._voiced >= 2:
+                self._state = self.CANDIDATE
+                self._hold(True)
+                self._start = max(0, self.ring.total - 2 * len(chunk) - int(self.pre_roll * self._rate))
+                self.counters["segments"] += 1
+        elif self._state == self.CANDIDATE:
+            length = (self.ring.total - self._start) / self._rate
+            if self._quiet >= self.gap or length >= self.wake_window:
+                self._check_wake()
+        elif self._state == self.REJECTED:
+            if self._quiet >= self.gap:
+                self._idle()
+        elif self._state == self.COMMAND:
+            self._spoke = self._spoke or loud
+            length = (self.ring.total - self._start) / self._rate
+            if not self._spoke and length >= self.command_timeout:
+                self._idle()
+            elif self._spoke and (self._quiet >= self.pause or length >= self.phrase_time_limit):
+                self._finish_command()
+
+    def _check_wake(self) -> None:
+        width = self.session.source.sample_width
+        clip = AudioClip(self.ring.slice(self._start), self.session.source.sample_rate, width)
+        self.counters["detector_runs"] += 1
+        end = self.detector.detect(clip)
+        if end is None:
+            self._state = self.REJECTED
+            return
+        self.counters["wakes"] += 1
+        self._start += int(end * self.session.source.sample_rate) * width
+        # Still talking when the wake word ended: the command followed without a pause.
+        self._spoke = self._quiet == 0.0
+        self._state = self.COMMAND
+        if self.on_wake is not None:
+            self.on_wake()
+
+    def _finish_command(self) -> None:
+        source = self.session.source
+        clip = AudioClip(self.ring.slice(self._start), source.sample_rate, source.sample_width)
+        self._idle()
+        self.counters["recognizer_calls"] += 1
+        self._worker.submit(self._recognize, clip)
+
+    def _recognize(self, clip: AudioClip) -> None:
+        try:
+            text = self.recognize(clip)
+        except Exception as exc:  # noqa: BLE001
+            if self.on_error is not None:
+                self.on_error(exc)
+            return
+        if text:
+            self.on_command(text)
+
+    def _idle(self) -> None:
+        self._state, self._voiced = self.IDLE, 0
+        self._hold(False)
+
+    def _hold(self, hold: bool) -> None:
+        # Keep the session from calibrating against the speech being gated.
+        if hold != self._holding:
+            self._holding = hold
+            self.session.hold_calibration(hold)
+
+    def _chunk_seconds(self) -> float:
+        return self.session.source.chunk / self.session.source.sample_rate
+
+    def _report(self, exc: Exception) -> None:
+        if self.on_error is not None:
+            self.on_error(exc)
+
+    def _restart(self, error: Exception) -> bool:
+        """Reopen the session after a device error; False once the listener has to give up."""
+        self._idle()
+        self._report(error)
+        if self._stop.wait(self.restart_delay):
+            return False
+        try:
+            self.session.start()
+        except Exception as exc:  # noqa: BLE001
+            (self.on_stopped or self._report)(exc)
+            return False
+        self.counters["restarts"] += 1
+        return True
+
+    def _run(self) -> None:
+        chunks = self._chunks
+        while not self._stop.is_set():
+            try:
+                chunk = chunks.get(timeout=0.2)
+            except queue.Empty:
+                error = self.session.error
+                if error is not None and not self._restart(error):
+                    return
+                continue
+            self.feed(chunk)
@@ -1,18 +1,55 @@
 from __future__ import annotations
 
 import json
+import queue
+import re
 import threading
+import uuid
 from collections import deque
-from dataclasses import asdict
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, urlparse
 
 from jane.actions import ActionExecutor
-from jane.commands import ParsedCommand, parse_command
+from jane.commands import ParsedCommand, configure_parse_cache_from_env, parse_cache_stats, plan_commands
+from jane.profiling import profile_dir_from_env, start_profiling
 
 BASE_DIR = Path(__file__).resolve().parent
+JOB_ROUTE = re.compile(r"^/api/jobs/(\d+)(/cancel)?$")
+
+
+class EventHub:
+    """Fan-out of dashboard events to every connected ``/api/stream`` client.
+
+    Each subscriber gets a bounded queue; a client that stops reading loses events instead of
+    stalling the chat worker that publishes them. Events that answer a request carry its
+    ``request_id`` so each browser only shows its own replies.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        events: queue.Queue = queue.Queue(maxsize=self.maxsize)
+        with self._lock:
+            self._subscribers.add(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(events)
+
+    def publish(self, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for events in subscribers:
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                pass
 
 
 class JaneWebState:
@@ -20,7 +57,10 @@ class JaneWebState:
         self.logs: deque[str] = deque(maxlen=300)
         self.pending: deque[ParsedCommand] = deque()
         self._lock = threading.Lock()
+        self.events = EventHub()
         self.executor = ActionExecutor(self._speak)
+        self.executor.sentence_sink = self._speak_streamed
+        configure_parse_cache_from_env()
         self._log("[BOOT] JANE Web is online.")
         self._speak("Hello, I am JANE. Ready on the web dashboard.")
 
@@ -31,40 +71,114 @@ class JaneWebState:
     def _speak(self, text: str) -> None:
         self._log(f"JANE: {text}")
 
-    def process(self, text: str) -> dict:
+    def _speak_streamed(self, sentence: str, request_id: str | None = None) -> None:
+        self._log(f"JANE: {sentence}")
+        self.events.publish({"type": "sentence", "text": sentence, "request_id": request_id})
+
+    def _sink(self, request_id: str):
+        return lambda sentence: self._speak_streamed(sentence, request_id)
+
+    def process(self, text: str, request_id: str | None = None) -> dict:
+        request_id = request_id or uuid.uuid4().hex
+        response = self._process(text, request_id)
+        response["request_id"] = request_id
+        return response
+
+    def _process(self, text: str, request_id: str) -> dict:
         self._log(f"You: {text}")
-        parsed = parse_command(text)
-        if parsed.action == "empty":
+        plan = plan_commands(text)
+        if not plan:
             return {"status": "ignored", "message": "Empty command."}
 
-        if parsed.high_risk:
-            with self._lock:
-                self.pending.append(parsed)
-            self._speak(f"High-risk command queued: {parsed.raw}")
+        runnable: list[ParsedCommand] = []
+        queued: list[ParsedCommand] = []
+        for parsed in plan:
+            if self.executor.requires_approval(parsed):
+                with self._lock:
+                    self.pending.append(parsed)
+                self._speak(f"High-risk command queued: {parsed.raw}")
+                queued.append(parsed)
+            else:
+                runnable.append(parsed)
+
+        if len(plan) == 1:
+            parsed = plan[0]
+            if queued:
+                return {
+                    "status": "queued",
+                    "message": "High-risk command is waiting for approval.",
+                    "parsed": parsed.to_dict(),
+                }
+            result = self.executor.submit(parsed, sink=self._sink(request_id)).result()
+            if not result.streamed:
+                self._speak(result.message)
             return {
-                "status": "queued",
-                "message": "High-risk command is waiting for approval.",
-                "parsed": asdict(parsed),
+                "status": "executed" if result.ok else "failed",
+                "message": result.message,
+                "streamed": result.streamed,
+                "parsed": parsed.to_dict(),
             }
 
-        result = self.executor.execute(parsed)
-        self._speak(result.message)
+        messages: list[str] = []
+        status = "queued"
+        streamed = False
+        if runnable:
+            result = self.executor.execute_many(runnable, self._sink(request_id))
+            if result.streamed:
+                streamed = not queued
+            else:
+                self._speak(result.message)
+                messages.append(result.message)
+            status = "executed" if result.ok else "failed"
+        if queued:
+            messages.append(f"{len(queued)} high-risk command(s) waiting for approval.")
         return {
-            "status": "executed" if result.ok else "failed",
-            "message": result.message,
-            "parsed": asdict(parsed),
+            "status": status,
+            "message": " ".join(messages) if messages else result.message,
+            "streamed": streamed,
+            "plan": [parsed.to_dict() for parsed in plan],
+            "queued": len(queued),
         }
 
-    def approve(self) -> tuple[int, dict]:
+    def approve(self, request_id: str | None = None) -> tuple[int, dict]:
         with self._lock:
             if not self.pending:
                 return HTTPStatus.NOT_FOUND, {"detail": "No pending high-risk command."}
             command = self.pending.popleft()
 
+        request_id = request_id or uuid.uuid4().hex
         self._log(f"[APPROVED] {command.raw}")
-        result = self.executor.execute(command)
-        self._speak(result.message)
-        return HTTPStatus.OK, {"status": "executed" if result.ok else "failed", "message": result.message}
+        result = self.executor.submit(command, sink=self._sink(request_id)).result()
+        if not result.streamed:
+            self._speak(result.message)
+        return HTTPStatus.OK, {
+            "status": "executed" if result.ok else "failed",
+            "message": result.message,
+            "streamed": result.streamed,
+            "request_id": request_id,
+        }
+
+    def approve_all(self) -> tuple[int, dict]:
+        with self._lock:
+            commands = list(self.pending)
+            self.pending.clear()
+        if not commands:
+            return HTTPStatus.NOT_FOUND, {"detail": "No pending high-risk command."}
+
+        for command in commands:
+            self._log(f"[APPROVED] {command.raw}")
+        # Each result is logged and returned whole below, so streamed sentences are not broadcast.
+        results = self.executor.submit_approved(commands, sink=lambda _sentence: None).result()
+        for command, result in zip(commands, results):
+            self._speak(f"{command.raw}: {result.message}")
+        return HTTPStatus.OK, {
+            "status": "executed" if all(result.ok for result in results) else "failed",
+            "message": " ".join(result.message for result in results),
+            "results": [
+                {"parsed": command.to_dict(), "ok": result.ok, "message": result.message}
+                for command, result in zip(commands, results)
+            ],
+        }
 
     def deny(self) -> tuple[int, dict]:
         with self._lock:
@@ -76,15 +190,42 @@ class JaneWebState:
         self._speak(msg)
         return HTTPStatus.OK, {"status": "denied", "message": msg}
 
+    def cancel_scheduled(self, job_id: int | None) -> tuple[int, dict]:
+        cancelled = self.executor.cancel_scheduled(job_id)
+        if not cancelled:
+            return HTTPStatus.NOT_FOUND, {"detail": "No such scheduled item."}
+        msg = f"Cancelled {cancelled} scheduled item(s)."
+        self._speak(msg)
+        return HTTPStatus.OK, {"status": "cancelled", "message": msg}
+
+    def job(self, job_id: int, since: int) -> tuple[int, dict]:
+        jobs = self.executor.job_status(job_id, since)
+        if not jobs:
+            return HTTPStatus.NOT_FOUND, {"detail": "No such job."}
+        return HTTPStatus.OK, jobs[0]
+
+    def cancel_job(self, job_id: int | None) -> tuple[int, dict]:
+        cancelled = self.executor.cancel_job(job_id)
+        if not cancelled:
+            return HTTPStatus.NOT_FOUND, {"detail": "No running job could be cancelled."}
+        msg = f"Cancelling {cancelled} background job(s)."
+        self._speak(msg)
+        return HTTPStatus.OK, {"status": "cancelling", "message": msg}
+
     def snapshot(self) -> dict:
         with self._lock:
-            pending = [asdict(c) for c in self.pending]
+            pending = [c.to_dict() for c in self.pending]
             logs = list(self.logs)
         return {
             "name": "JANE",
             "deployed_by": "Visrodeck Technology",
             "pending": pending,
             "logs": logs,
+            "scheduled": self.executor.scheduled(),
+            "jobs": self.executor.job_status(),
+            "parse_cache": parse_cache_stats(),
+            "chat_cache": self.executor.chat_cache_stats(),
+            "chat_gateway": self.executor.chat_gateway.stats(),
         }
 
 
@@ -110,6 +251,27 @@ class JaneRequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(data)
 
+    def _send_events(self) -> None:
+        """Server-sent events: chat sentences are pushed here as the model produces them."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        events = self.state.events.subscribe()
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=15)
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.state.events.unsubscribe(events)
+
     def _read_json_body(self) -> dict:
         length = int(self.headers.get("Content-Length", "0"))
         if length <= 0:
@@ -121,13 +283,30 @@ class JaneRequestHandler(BaseHTTPRequestHandler):
             return {}
 
     def do_GET(self):
-        route = urlparse(self.path).path
+        url = urlparse(self.path)
+        route = url.path
         if route in {"/", "/index.html"}:
             self._send_file(BASE_DIR / "templates" / "index.html", "text/html; charset=utf-8")
             return
         if route == "/api/state":
             self._send_json(self.state.snapshot())
             return
+        if route == "/api/stream":
+            self._send_events()
+            return
+        if route == "/api/jobs":
+            self._send_json({"jobs": self.state.executor.job_status()})
+            return
+        found = JOB_ROUTE.match(route)
+        if found and not found.group(2):
+            try:
+                since = int(parse_qs(url.query).get("since", ["0"])[0])
+            except ValueError:
+                self._send_json({"detail": "since must be an integer."}, HTTPStatus.BAD_REQUEST)
+                return
+            status, payload = self.state.job(int(found.group(1)), since)
+            self._send_json(payload, status)
+            return
         if route == "/static/style.css":
             self._send_file(BASE_DIR / "static" / "style.css", "text/css; charset=utf-8")
             return
@@ -147,23 +326,66 @@ class JaneRequestHandler(BaseHTTPRequestHandler):
         if route == "/api/command":
             payload = self._read_json_body()
             text = str(payload.get("text", ""))
-            self._send_json(self.state.process(text))
+            self._send_json(self.state.process(text, _request_id(payload)))
             return
         if route == "/api/approve":
-            status, payload = self.state.approve()
+            status, payload = self.state.approve(_request_id(self._read_json_body()))
+            self._send_json(payload, status)
+            return
+        if route == "/api/approve_all":
+            status, payload = self.state.approve_all()
             self._send_json(payload, status)
             return
         if route == "/api/deny":
             status, payload = self.state.deny()
             self._send_json(payload, status)
             return
+        if route == "/api/scheduled/cancel":
+            payload = self._read_json_body()
+            try:
+                job_id = int(payload["id"]) if payload.get("id") is not None else None
+            except (TypeError, ValueError):
+                self._send_json({"detail": "id must be an integer."}, HTTPStatus.BAD_REQUEST)
+                return
+            status, payload = self.state.cancel_scheduled(job_id)
+            self._send_json(payload, status)
+            return
+        if route == "/api/jobs/cancel":
+            status, payload = self.state.cancel_job(None)
+            self._send_json(payload, status)
+            return
+        found = JOB_ROUTE.match(route)
+        if found and found.group(2):
+            status, payload = self.state.cancel_job(int(found.group(1)))
+            self._send_json(payload, status)
+            return
         self.send_error(HTTPStatus.NOT_FOUND, "Not Found")
 
     def log_message(self, fmt: str, *args):
         return
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8000) -> None:
+def _request_id(payload: dict) -> str | None:
+    """Client-chosen id for a request, so its streamed events can be told apart from others'."""
+    value = str(payload.get("request_id") or "").strip()
+    return value[:64] or None
+
+
+def run_server(host: str = "0.0.0.0", port: int = 8000, profile: str | Path | None = None) -> None:
+    """Serve the dashboard; with ``profile`` (or ``JANE_PROFILE``) the session is profiled until shutdown."""
+    profile = profile or profile_dir_from_env()
+    profiler = None
+    if profile:
+        profiler = start_profiling(profile, lambda p: p.instrument(JaneWebState, "snapshot", "JaneWebState.snapshot"))
     server = ThreadingHTTPServer((host, port), JaneRequestHandler)
+    JaneRequestHandler.state.executor.warm_up()
     print(f"JANE Web running on http://{host}:{port}")
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if profiler is not None:
+            print(f"JANE profile written to {profiler.stop()}")
+
@@ -1,16 +1,51 @@
 const cmd = document.getElementById('cmd');
 const send = document.getElementById('send');
 const approve = document.getElementById('approve');
+const approveAll = document.getElementById('approve-all');
 const deny = document.getElementById('deny');
 const voice = document.getElementById('voice');
 const statusEl = document.getElementById('status');
 const logbox = document.getElementById('logbox');
 const queue = document.getElementById('queue');
+const scheduledEl = document.getElementById('scheduled');
+const cancelAll = document.getElementById('cancel-all');
+const jobsEl = document.getElementById('jobs');
+const jobOutput = document.getElementById('job-output');
+const cancelJobsBtn = document.getElementById('cancel-jobs');
+const cacheEl = document.getElementById('cache');
+const chatCacheEl = document.getElementById('chat-cache');
+const chatGatewayEl = document.getElementById('chat-gateway');
 
 const synth = window.speechSynthesis;
 
 function setStatus(msg) { statusEl.textContent = msg; }
 
+function renderCache(stats) {
+  if (!stats || !stats.enabled) {
+    cacheEl.textContent = 'Parse cache: disabled';
+    return;
+  }
+  const rate = (stats.hit_rate * 100).toFixed(1);
+  cacheEl.textContent = `Parse cache: ${stats.hits} hits / ${stats.misses} misses / `
+    + `${stats.evictions} evictions, ${stats.size}/${stats.maxsize} entries (${rate}% hit rate)`;
+}
+
+function renderChatCache(stats) {
+  if (!stats || !stats.enabled) {
+    chatCacheEl.textContent = 'Chat cache: disabled';
+    return;
+  }
+  const rate = (stats.hit_rate * 100).toFixed(1);
+  chatCacheEl.textContent = `Chat cache: ${stats.hits} hits / ${stats.misses} misses / `
+    + `${stats.evictions} evictions, ${stats.entries} entries (${rate}% hit rate)`;
+}
+
+function renderChatGateway(stats) {
+  if (!stats) return;
+  chatGatewayEl.textContent = `Chat gateway: ${stats.calls} calls / ${stats.coalesced} coalesced / `
+    + `${stats.throttled} throttled / ${stats.rejected} rejected, ${stats.active} active, ${stats.waiting} waiting`;
+}
+
 function speak(text) {
   if (!synth || !text) return;
   const u = new SpeechSynthesisUtterance(text);
@@ -18,6 +53,125 @@ function speak(text) {
   synth.speak(u);
 }
 
+// Chat replies arrive here one sentence at a time while /api/command is still pending, so the
+// browser starts talking before the whole answer exists. Every browser receives every event;
+// only those tagged with this page's own request id belong to the reply being shown.
+let streamedText = '';
+let activeRequest = null;
+
+function newRequestId() {
+  if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+
+function listen() {
+  if (!window.EventSource) return;
+  const events = new EventSource('/api/stream');
+  events.onmessage = (ev) => {
+    const event = JSON.parse(ev.data);
+    if (event.type !== 'sentence') return;
+    if (!event.request_id) {
+      // Not an answer to anyone's request (a scheduled command firing): announce it as is.
+      speak(event.text);
+      return;
+    }
+    if (event.request_id !== activeRequest) return;
+    streamedText = streamedText ? `${streamedText} ${event.text}` : event.text;
+    setStatus(streamedText);
+    speak(event.text);
+  };
+}
+
+function deliver(result) {
+  setStatus(result.message);
+  if (!result.streamed) speak(result.message);
+  streamedText = '';
+  if (result.request_id === activeRequest) activeRequest = null;
+}
+
+function renderScheduled(items) {
+  scheduledEl.innerHTML = '';
+  items.forEach((item) => {
+    const li = document.createElement('li');
+    li.textContent = `${item.kind} :: ${item.label} (at ${item.due_at}) `;
+    const btn = document.createElement('button');
+    btn.className = 'danger small';
+    btn.textContent = 'Cancel';
+    btn.onclick = () => cancelScheduled(item.id);
+    li.appendChild(btn);
+    scheduledEl.appendChild(li);
+  });
+}
+
+async function cancelScheduled(id = null) {
+  try {
+    const result = await post('/api/scheduled/cancel', id === null ? {} : { id });
+    deliver(result);
+    await refresh();
+  } catch (e) {
+    setStatus(`Cancel failed: ${e.message}`);
+  }
+}
+
+// The job whose output is shown, and the last output line already appended for it.
+let watchedJob = null;
+let jobCursor = 0;
+
+function watchJob(id) {
+  watchedJob = id;
+  jobCursor = 0;
+  jobOutput.textContent = '';
+  pollJob();
+}
+
+async function pollJob() {
+  if (watchedJob === null) return;
+  const res = await fetch(`/api/jobs/${watchedJob}?since=${jobCursor}`);
+  if (!res.ok) return;
+  const job = await res.json();
+  job.output.forEach((line) => {
+    jobOutput.textContent += `${line.stream === 'stderr' ? '! ' : ''}${line.text}\n`;
+    jobCursor = line.n;
+  });
+  jobOutput.scrollTop = jobOutput.scrollHeight;
+}
+
+function renderJobs(jobs) {
+  jobsEl.innerHTML = '';
+  jobs.forEach((job) => {
+    const li = document.createElement('li');
+    const progress = job.progress === null ? '' : ` ${Math.round(job.progress * 100)}%`;
+    li.textContent = `#${job.id} ${job.label} :: ${job.status}${progress} (${job.elapsed}s) `;
+    const log = document.createElement('button');
+    log.className = 'small';
+    log.textContent = 'Output';
+    log.onclick = () => watchJob(job.id);
+    li.appendChild(log);
+    if (job.status === 'queued' || job.status === 'running') {
+      const btn = document.createElement('button');
+      btn.className = 'danger small';
+      btn.textContent = 'Cancel';
+      btn.onclick = () => cancelJobs(job.id);
+      li.appendChild(btn);
+    }
+    jobsEl.appendChild(li);
+  });
+  if (watchedJob === null) {
+    const running = jobs.find((job) => job.status === 'running');
+    if (running) watchJob(running.id);
+  }
+}
+
+async function cancelJobs(id = null) {
+  try {
+    const result = await post(id === null ? '/api/jobs/cancel' : `/api/jobs/${id}/cancel`);
+    deliver(result);
+    await refresh();
+  } catch (e) {
+    setStatus(`Cancel failed: ${e.message}`);
+  }
+}
+
 async function refresh() {
   const res = await fetch('/api/state');
   const data = await res.json();
@@ -28,6 +182,12 @@ async function refresh() {
     li.textContent = `${p.action} :: ${p.raw}`;
     queue.appendChild(li);
   });
+  renderScheduled(data.scheduled || []);
+  renderJobs(data.jobs || []);
+  pollJob();
+  renderCache(data.parse_cache);
+  renderChatCache(data.chat_cache);
+  renderChatGateway(data.chat_gateway);
 }
 
 async function post(url, body = null) {
@@ -45,9 +205,10 @@ send.onclick = async () => {
   const text = cmd.value.trim();
   if (!text) return;
   try {
-    const result = await post('/api/command', { text });
-    setStatus(result.message);
-    speak(result.message);
+    activeRequest = newRequestId();
+    streamedText = '';
+    const result = await post('/api/command', { text, request_id: activeRequest });
+    deliver(result);
     cmd.value = '';
     await refresh();
   } catch (e) {
@@ -57,9 +218,20 @@ send.onclick = async () => {
 
 approve.onclick = async () => {
   try {
-    const result = await post('/api/approve');
-    setStatus(result.message);
-    speak(result.message);
+    activeRequest = newRequestId();
+    streamedText = '';
+    const result = await post('/api/approve', { request_id: activeRequest });
+    deliver(result);
+    await refresh();
+  } catch (e) {
+    setStatus(`Approve failed: ${e.message}`);
+  }
+};
+
+approveAll.onclick = async () => {
+  try {
+    const result = await post('/api/approve_all');
+    deliver(result);
     await refresh();
   } catch (e) {
     setStatus(`Approve failed: ${e.message}`);
@@ -77,6 +249,9 @@ deny.onclick = async () => {
   }
 };
 
+cancelAll.onclick = () => cancelScheduled();
+cancelJobsBtn.onclick = () => cancelJobs();
+
 voice.onclick = () => {
   const SR = window.SpeechRecognition || window.webkitSpeechRecognition;
   if (!SR) {
@@ -96,3 +271,4 @@ voice.onclick = () => {
 
 setInterval(refresh, 2500);
 refresh();
+listen();
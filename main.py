@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import sys
 
 
@@ -24,7 +25,30 @@ def _print_syntax_help(exc: SyntaxError) -> None:
     print("This usually means one source file was edited with broken indentation.")
     print("Please restore/update the project files and run again.")
 
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python main.py", description="Start the JANE desktop assistant.")
+    parser.add_argument("--web", action="store_true", help="Serve the web dashboard instead of the desktop app.")
+    parser.add_argument("--host", default="0.0.0.0", help="Web dashboard host (default: 0.0.0.0).")
+    parser.add_argument("--port", type=int, default=8000, help="Web dashboard port (default: 8000).")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="jane_profile",
+        metavar="DIR",
+        help="Profile the session and write reports to DIR on exit (default: jane_profile). Also: JANE_PROFILE.",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = _parse_args()
+    if args.web:
+        from jane_web.server import run_server
+
+        run_server(host=args.host, port=args.port, profile=args.profile)
+        sys.exit(0)
+
     try:
         from jane.app import JaneApp
     except ModuleNotFoundError as exc:
@@ -36,16 +60,12 @@ if __name__ == "__main__":
         _print_syntax_help(exc)
         sys.exit(1)
 
-    JaneApp().run()
-
-    JaneApp().run()
-from jane.app import JaneApp
+    from jane.profiling import profile_dir_from_env, start_profiling
 
-
-if __name__ == "__main__":
-    JaneApp().run()
-from jane_web.server import run_server
-
-
-if __name__ == "__main__":
-    run_server(host="0.0.0.0", port=8000)
+    profile_dir = args.profile or profile_dir_from_env()
+    profiler = start_profiling(profile_dir) if profile_dir else None
+    try:
+        JaneApp().run()
+    finally:
+        if profiler is not None:
+            print(f"[JANE] Profile written to {profiler.stop()}")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+
+from jane.audio import _TYPECODES
+
+
+class FakeAudioSource:
+    """Plays queued PCM, then silence, at the pace a real device would deliver it.
+
+    ``realtime=False`` hands queued audio over as fast as it is read, which keeps tests quick;
+    once the queue is empty reads always block for a chunk's duration, so idle readers do not spin.
+    """
+
+    def __init__(
+        self, sample_rate: int = 16000, sample_width: int = 2, chunk: int = 512, realtime: bool = True
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.chunk = chunk
+        self.realtime = realtime
+        self.reads = 0
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self.failure: Exception | None = None
+
+    @property
+    def chunk_bytes(self) -> int:
+        return self.chunk * self.sample_width
+
+    def tone(self, seconds: float, amplitude: int = 3000, freq: float = 440.0) -> bytes:
+        count = int(seconds * self.sample_rate)
+        step = 2 * math.pi * freq / self.sample_rate
+        samples = array(_TYPECODES[self.sample_width], (int(amplitude * math.sin(step * i)) for i in range(count)))
+        return samples.tobytes()
+
+    def noise(self, seconds: float, amplitude: int = 100) -> bytes:
+        # Deterministic square-ish hum: constant RMS without needing a random source.
+        count = int(seconds * self.sample_rate)
+        samples = array(_TYPECODES[self.sample_width], (amplitude if i % 2 else -amplitude for i in range(count)))
+        return samples.tobytes()
+
+    def fail(self, exc: Exception) -> None:
+        """Make reads and reopening raise ``exc``, as an unplugged device would, until ``failure`` is cleared."""
+        self.failure = exc
+
+    def feed(self, pcm: bytes) -> None:
+        with self._lock:
+            self._pending.extend(pcm)
+
+    def open(self) -> None:
+        if self.failure is not None:
+            raise self.failure
+        self._opened += 1
+
+    def read(self) -> bytes:
+        if self.failure is not None:
+            raise self.failure
+        with self._lock:
+            size = self.chunk_bytes
+            data = bytes(self._pending[:size])
+            del self._pending[:size]
+        self.reads += 1
+        if len(data) < size:
+            data += bytes(size - len(data))
+            time.sleep(self.chunk / self.sample_rate)
+        elif self.realtime:
+            time.sleep(self.chunk / self.sample_rate)
+        return data
+
+    def close(self) -> None:
+        self._opened -= 1
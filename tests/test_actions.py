@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_PROBE = """
+import sys
+import jane.actions
+executor = jane.actions.ActionExecutor(print)
+# What the UI and web pollers call from startup on.
+executor.job_status()
+executor.cancel_job()
+print(" ".join(name for name in {names!r} if name in sys.modules))
+executor.close()
+"""
+
+
+def test_import_and_construct_stay_light():
+    names = ("platform", "shlex", "sqlite3", "jane.launchers", "jane.elevation", "jane.jobs", "jane.notes")
+    probe = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(names=names)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert probe.stdout.strip() == ""
+
+
+def _recording_executor(log):
+    from jane.actions import ActionExecutor, ActionResult
+    from jane.registry import ActionRegistry, ActionSpec
+
+    def handler(name, delay):
+        def _run(executor, cmd):
+            time.sleep(delay)
+            log.append(name)
+            return ActionResult(True, name)
+
+        return _run
+
+    registry = ActionRegistry()
+    for action, delay, shares in (
+        ("save_note", 0.2, "notes"),
+        ("find_notes", 0.0, "notes"),
+        ("tell_time", 0.1, ""),
+        ("open_calculator", 0.0, ""),
+    ):
+        registry.register(ActionSpec(action, f"tests:{action}", shares=shares), handler(action, delay))
+    return ActionExecutor(log.append, registry=registry)
+
+
+def test_execute_many_keeps_shared_state_in_order():
+    from jane.commands import plan_commands
+
+    log = []
+    executor = _recording_executor(log)
+    try:
+        result = executor.execute_many(plan_commands("note buy milk then find notes about milk"))
+    finally:
+        executor.close()
+    assert log == ["save_note", "find_notes"]
+    assert result.ok and result.message == "save_note find_notes"
+
+
+def test_execute_many_runs_independent_commands_concurrently():
+    from jane.commands import plan_commands
+
+    log = []
+    executor = _recording_executor(log)
+    try:
+        started = time.monotonic()
+        result = executor.execute_many(plan_commands("what time is it and open calculator and note x"))
+        elapsed = time.monotonic() - started
+    finally:
+        executor.close()
+    # Results come back in command order even though the quick one finished first.
+    assert log == ["open_calculator", "tell_time", "save_note"]
+    assert result.message == "tell_time open_calculator save_note"
+    assert elapsed < 0.28
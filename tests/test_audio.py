@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from jane.audio import CaptureSession, ListenTimeout
+from jane.wakeword import WakeWordListener
+from tests.fakes import FakeAudioSource
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def source():
+    return FakeAudioSource(realtime=False)
+
+
+@pytest.fixture
+def session(source):
+    session = CaptureSession(source, pause=0.2)
+    yield session
+    session.close()
+
+
+def test_listen_returns_the_phrase(source, session):
+    session.start()
+    threading.Timer(0.1, source.feed, [source.noise(0.2) + source.tone(0.5)]).start()
+    clip = session.listen(timeout=2, phrase_time_limit=2)
+    assert 0.5 <= clip.duration < 1.5
+
+
+def test_listen_times_out_on_silence(session):
+    with pytest.raises(ListenTimeout):
+        session.listen(timeout=0.3)
+
+
+def test_listen_raises_the_device_error_and_reopens_afterwards(source, session):
+    session.start()
+    source.fail(OSError("microphone unplugged"))
+    with pytest.raises(OSError, match="unplugged"):
+        session.listen(timeout=2)
+    assert isinstance(session.error, OSError)
+
+    source.failure = None
+    threading.Timer(0.1, source.feed, [source.tone(0.5)]).start()
+    assert session.listen(timeout=2, phrase_time_limit=2).duration >= 0.5
+    assert session.error is None
+
+
+class _NeverWakes:
+    def detect(self, clip):
+        return None
+
+
+def _listener(session, errors, stopped):
+    return WakeWordListener(
+        session,
+        _NeverWakes(),
+        recognize=lambda clip: "",
+        on_command=lambda text: None,
+        on_error=errors.append,
+        on_stopped=stopped.append,
+        restart_delay=0.3,
+    )
+
+
+def test_wake_listener_reports_a_device_error_and_restarts(source, session):
+    errors, stopped = [], []
+    listener = _listener(session, errors, stopped)
+    listener.start()
+    try:
+        source.fail(OSError("microphone unplugged"))
+        _wait_for(lambda: errors)
+        source.failure = None
+        _wait_for(lambda: listener.counters["restarts"] == 1)
+        assert listener.running and not stopped
+        chunks = listener.counters["chunks"]
+        _wait_for(lambda: listener.counters["chunks"] > chunks)
+    finally:
+        listener.close()
+
+
+def test_wake_listener_stops_when_the_device_stays_gone(source, session):
+    errors, stopped = [], []
+    listener = _listener(session, errors, stopped)
+    listener.start()
+    try:
+        source.fail(OSError("microphone unplugged"))
+        _wait_for(lambda: stopped)
+        _wait_for(lambda: not listener.running)
+        assert [str(exc) for exc in errors + stopped] == ["microphone unplugged"] * 2
+    finally:
+        listener.close()
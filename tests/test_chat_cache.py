@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from jane.chat_cache import ChatResponseCache, cache_key, is_standalone_prompt, normalize_prompt
+
+MODEL = "gemini-test"
+
+
+@pytest.fixture
+def cache():
+    cache = ChatResponseCache(":memory:")
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("what is 2+2?", "what is 2-2"),
+        ("what is 2+2?", "What is 2*2"),
+        ("translate 你好 to english", "translate 谢谢 to english"),
+        ("is 3 > 2", "is 3 < 2"),
+        ("what does C++ mean", "what does C# mean"),
+    ],
+)
+def test_different_questions_get_different_keys(cache, first, second):
+    assert cache_key(MODEL, first) != cache_key(MODEL, second)
+    cache.put(MODEL, first, "first answer")
+    assert cache.get(MODEL, second) is None
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("what is 2+2?", "What is 2+2"),
+        ("Tell me a joke!", "  tell   me a JOKE  "),
+        ("translate 你好 to english.", "Translate 你好 to English"),
+    ],
+)
+def test_case_whitespace_and_trailing_punctuation_are_ignored(cache, first, second):
+    assert normalize_prompt(first) == normalize_prompt(second)
+    cache.put(MODEL, first, "answer")
+    assert cache.get(MODEL, second) == "answer"
+
+
+def test_model_is_part_of_the_key(cache):
+    cache.put(MODEL, "tell me a joke", "answer")
+    assert cache.get("other-model", "tell me a joke") is None
+
+
+def test_follow_up_prompts_are_not_standalone():
+    assert is_standalone_prompt("what is 2+2?")
+    assert is_standalone_prompt("translate 你好 to english")
+    assert not is_standalone_prompt("why is that?")
+    assert not is_standalone_prompt("tell me more")
+
+
+def test_expired_entries_miss():
+    cache = ChatResponseCache(":memory:", ttl=-1)
+    cache.put(MODEL, "tell me a joke", "answer")
+    assert cache.get(MODEL, "tell me a joke") is None
+    assert cache.stats()["expired"] == 1
+    cache.close()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from benchmarks.corpus import generate
+from jane.commands import Action, parse_command
+
+
+def _baseline(text):
+    """The original if-chain parse_command, kept as the reference the compiled matcher must agree with."""
+    normalized = text.strip().lower()
+    if not normalized:
+        return "empty", {}, False
+    if "open chrome" in normalized and "whatsapp" in normalized:
+        return "open_whatsapp_web", {"browser": "chrome"}, False
+    if normalized.startswith("open ") and "settings" in normalized and "theme" in normalized:
+        return "change_theme", {}, True
+    download = re.search(r"download\s+(?:this\s+library\s+)?([a-z0-9_\-.]+)", normalized)
+    if "open terminal" in normalized and download:
+        return "install_library", {"library": download.group(1)}, True
+    if "shut down" in normalized or "shutdown" in normalized:
+        return "shutdown_system", {"countdown": 10}, True
+    if "what time" in normalized or "current time" in normalized:
+        return "tell_time", {}, False
+    if "what date" in normalized or "today date" in normalized:
+        return "tell_date", {}, False
+    note = re.search(r"note\s*[:\-]?\s*(.+)$", text.strip(), re.IGNORECASE)
+    if note:
+        return "save_note", {"note": note.group(1).strip()}, False
+    if "open calculator" in normalized:
+        return "open_calculator", {}, False
+    if "open notepad" in normalized or "open editor" in normalized:
+        return "open_notepad", {}, False
+    target = re.match(r"open\s+(.+)", normalized)
+    if target:
+        return "open_app_or_site", {"target": target.group(1).strip()}, False
+    return "chat", {"prompt": text}, False
+
+
+# Intents added after the baseline have nothing to be compared against.
+_NEW_INTENTS = {"find_notes", "list_notes"}
+_EDGE_CASES = [
+    "",
+    "   ",
+    "open whatsapp",
+    "Open Notepad",
+    "open youtube and note this",
+    "OPEN CHROME and whatsapp web",
+    "open terminal",
+    "download numpy",
+    "what time is it in tokyo",
+    "Today date",
+    "please shut down now",
+    "notebook",
+    "open the settings theme",
+    "open settings",
+    "open calculator and notepad",
+    "open",
+    "open   github.com  ",
+    "tell me about notes on jazz",
+    "What's the current time?",
+    "OPEN GMAIL",
+]
+
+
+@pytest.mark.parametrize(
+    "text",
+    sorted({text for action, text in generate(600) if action not in _NEW_INTENTS}) + _EDGE_CASES,
+)
+def test_matches_the_baseline_parser(text):
+    parsed = parse_command(text)
+    assert (str(parsed.action), dict(parsed.params), parsed.high_risk) == _baseline(text)
+
+
+@pytest.mark.parametrize(
+    "text, params",
+    [
+        ("open terminal and download numpy==1.26", {"library": "numpy==1.26"}),
+        ("notes: call bob", {"note": "call bob"}),
+    ],
+)
+def test_deliberate_departures_from_the_baseline(text, params):
+    assert dict(parse_command(text).params) == params
+
+
+@pytest.mark.parametrize(
+    "text, note",
+    [
+        ("Note - find notes about birds later", "find notes about birds later"),
+        ("note: list my notes from yesterday", "list my notes from yesterday"),
+        ("note: cancel the timers subscription", "cancel the timers subscription"),
+        ("note: remind me to call bob", "remind me to call bob"),
+        ("Remember: open terminal and download numpy", "open terminal and download numpy"),
+        ("note: in 5 minutes the pizza is done", "in 5 minutes the pizza is done"),
+    ],
+)
+def test_explicit_note_prefix_beats_every_other_intent(text, note):
+    parsed = parse_command(text)
+    assert parsed.action is Action.SAVE_NOTE
+    assert parsed.params["note"] == note
+    assert not parsed.high_risk
+
+
+@pytest.mark.parametrize(
+    "text, action",
+    [
+        ("find notes about birds", Action.FIND_NOTES),
+        ("list notes from yesterday", Action.LIST_NOTES),
+        ("take a note buy milk", Action.SAVE_NOTE),
+        ("what should I remember about python", Action.CHAT),
+    ],
+)
+def test_notes_without_the_prefix_route_as_before(text, action):
+    assert parse_command(text).action is action
+
+
+@pytest.mark.parametrize(
+    "text, target, high_risk",
+    [
+        ("cancel shutdown", "shutdown", False),
+        ("cancel the countdown", "countdown", False),
+        ("please cancel the timers", "timers", True),
+        ("Jane, cancel all reminders", "reminders", True),
+        ("abort installs", "installs", True),
+    ],
+)
+def test_bulk_cancels_need_approval_but_shutdown_does_not(text, target, high_risk):
+    parsed = parse_command(text)
+    assert parsed.action is Action.CANCEL_SCHEDULED
+    assert parsed.params["target"] == target
+    assert parsed.high_risk is high_risk
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["how do I cancel my timers subscription", "why does nobody remind me of anything"],
+)
+def test_cancel_and_remind_must_start_the_utterance(text):
+    assert parse_command(text).action is Action.CHAT
+
+
+class _Executor:
+    def __init__(self, kinds):
+        self.kinds = list(kinds)
+
+    def cancel_scheduled(self, job_id=None, kind=None):
+        assert kind is not None, "a spoken cancel must never clear every kind at once"
+        cancelled = self.kinds.count(kind)
+        self.kinds = [k for k in self.kinds if k != kind]
+        return cancelled
+
+
+def test_cancel_timers_leaves_reminders_alone():
+    from jane.handlers.schedule import cancel_scheduled
+
+    executor = _Executor(["action", "countdown", "reminder", "reminder"])
+    result = cancel_scheduled(executor, parse_command("cancel timers"))
+    assert result.message == "Cancelled 2 scheduled items."
+    assert executor.kinds == ["reminder", "reminder"]
+
+
+@pytest.mark.parametrize(
+    "text, plan",
+    [
+        ("what time is it and open calculator", [("tell_time", {}), ("open_calculator", {})]),
+        ("open editor; what date is it", [("open_notepad", {}), ("tell_date", {})]),
+        (
+            "note buy milk then find notes about milk",
+            [("save_note", {"note": "buy milk"}), ("find_notes", {"query": "milk"})],
+        ),
+        # Pieces that only mean something together stay one command.
+        ("open chrome and open whatsapp", [("open_whatsapp_web", {"browser": "chrome"})]),
+        ("tell me about salt and pepper", [("chat", {"prompt": "tell me about salt and pepper"})]),
+        ("note: bread and butter", [("save_note", {"note": "bread and butter"})]),
+        ("", []),
+    ],
+)
+def test_plan_commands_splits_only_independent_commands(text, plan):
+    from jane.commands import plan_commands
+
+    assert [(str(cmd.action), dict(cmd.params)) for cmd in plan_commands(text)] == plan
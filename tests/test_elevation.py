@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from jane.elevation import ElevatedCommand, elevation_prefix, run_elevated_batch
+
+
+@pytest.fixture(autouse=True)
+def no_prompt(monkeypatch):
+    # "env" runs the helper as the current user, so the batch path is exercised without a prompt.
+    monkeypatch.setenv("JANE_ELEVATOR", "env")
+
+
+def _python(code: str, reason: str) -> ElevatedCommand:
+    return ElevatedCommand((sys.executable, "-c", code), reason)
+
+
+def test_override_replaces_the_platform_tool(monkeypatch):
+    monkeypatch.setenv("JANE_ELEVATOR", "env FOO=1")
+    assert elevation_prefix("linux") == ["env", "FOO=1"]
+    assert elevation_prefix("windows") == ["env", "FOO=1"]
+
+
+def test_batch_runs_every_command_in_order():
+    outcomes = run_elevated_batch(
+        [
+            _python("print('first')", "first"),
+            _python("import sys; print('broken'); sys.exit(3)", "second"),
+            ElevatedCommand(("/nonexistent/jane-tool",), "third"),
+            _python("print('fourth')", "fourth"),
+        ]
+    )
+    assert [outcome.returncode for outcome in outcomes] == [0, 3, 127, 0]
+    assert [outcome.last_line() for outcome in outcomes[:2]] == ["first", "broken"]
+    assert outcomes[3].ok and outcomes[3].last_line() == "fourth"
+
+
+def test_refused_elevation_marks_every_command_not_run(monkeypatch):
+    monkeypatch.setenv("JANE_ELEVATOR", "false")
+    outcomes = run_elevated_batch([_python("print('never')", "a"), _python("print('never')", "b")])
+    assert [outcome.returncode for outcome in outcomes] == [126, 126]
+    assert all("Not run" in outcome.output for outcome in outcomes)
+
+
+def test_empty_batch_never_prompts():
+    assert run_elevated_batch([]) == []
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from jane import commands
+from jane.commands import Action, parse_command
+from jane.fuzzy import FuzzyVocabulary
+
+
+@pytest.fixture(params=[0, 64], ids=["uncached", "cached"])
+def parse(request):
+    if request.param:
+        commands.enable_parse_cache(request.param)
+    else:
+        commands.disable_parse_cache()
+    yield parse_command
+    commands.disable_parse_cache()
+
+
+@pytest.mark.parametrize(
+    "text, action",
+    [
+        ("open calculater", Action.OPEN_CALCULATOR),
+        ("shut-down", Action.SHUTDOWN_SYSTEM),
+        ("shutdwon now", Action.SHUTDOWN_SYSTEM),
+    ],
+)
+def test_near_misses_are_recovered(parse, text, action):
+    assert parse(text).action is action
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Opens a file in python how?",
+        "shout down",
+        "what times does the store open",
+        "what dates work for a trip",
+    ],
+)
+def test_weak_matches_stay_chat(parse, text):
+    assert parse(text).action is Action.CHAT
+
+
+def test_recovered_captures_keep_the_original_text(parse):
+    assert parse("notte: Call Dr. Smith @ 5pm!").params["note"] == "Call Dr. Smith @ 5pm!"
+    # Run twice so the cached route rebuilds from the second caller's text.
+    assert parse("NOTTE: Buy MILK!").params["note"] == "Buy MILK!"
+    assert parse("notte: buy milk!").params["note"] == "buy milk!"
+
+
+def test_recovered_install_keeps_the_version_pin(parse):
+    parsed = parse("open terminal and downlod numpy==1.26")
+    assert parsed.action is Action.INSTALL_LIBRARY
+    assert parsed.params["library"] == "numpy==1.26"
+    assert parsed.high_risk
+
+
+def test_plurals_are_not_corrections():
+    vocabulary = FuzzyVocabulary(["time", "box", "calculator"])
+    assert vocabulary.closest("times") is None
+    assert vocabulary.closest("boxes") is None
+    assert vocabulary.closest("calculators") is None
+    assert vocabulary.closest("calculater") == ("calculator", 0.9)
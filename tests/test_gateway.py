@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jane.gateway import ChatGateway, GatewayBusy, TokenBucket, chat_gateway_from_env
+
+
+def _slow(result, started: threading.Event | None = None, delay: float = 0.1):
+    def _call():
+        if started is not None:
+            started.set()
+        time.sleep(delay)
+        return result
+
+    return _call
+
+
+def test_identical_keys_in_flight_share_one_call():
+    gateway = ChatGateway(rate_per_minute=None)
+    calls = []
+
+    def _call():
+        calls.append(1)
+        time.sleep(0.1)
+        return "answer"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(gateway.call, "same", _call) for _ in range(4)]
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["answer"] * 4
+    assert len(calls) == 1
+    assert gateway.stats()["coalesced"] == 3
+
+
+def test_different_keys_are_not_coalesced():
+    gateway = ChatGateway(rate_per_minute=None)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(gateway.call, "a", _slow("A"))
+        second = pool.submit(gateway.call, "b", _slow("B"))
+        assert (first.result(timeout=5), second.result(timeout=5)) == ("A", "B")
+    assert gateway.stats()["calls"] == 2
+    assert gateway.stats()["coalesced"] == 0
+
+
+def test_followers_see_the_leaders_error():
+    gateway = ChatGateway(rate_per_minute=None)
+
+    def _fail():
+        time.sleep(0.1)
+        raise RuntimeError("model down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(gateway.call, "same", _fail) for _ in range(2)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model down"):
+                future.result(timeout=5)
+
+
+def test_full_wait_queue_rejects():
+    gateway = ChatGateway(rate_per_minute=None, max_concurrent=1, max_waiting=1)
+    started = threading.Event()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pool.submit(gateway.call, "busy", _slow("done", started, delay=0.5))
+        assert started.wait(5)
+        waiting = pool.submit(gateway.call, "queued", lambda: "queued")
+        deadline = time.monotonic() + 5
+        while gateway.stats()["waiting"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with pytest.raises(GatewayBusy):
+            gateway.call("other", lambda: "never")
+        assert waiting.result(timeout=5) == "queued"
+    assert gateway.stats()["rejected"] == 1
+
+
+def test_zero_queue_still_admits_when_a_slot_is_free():
+    gateway = ChatGateway(rate_per_minute=None, max_concurrent=1, max_waiting=0)
+    assert gateway.call("first", lambda: "ok") == "ok"
+    started = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        busy = pool.submit(gateway.call, "busy", _slow("done", started, delay=0.5))
+        assert started.wait(5)
+        with pytest.raises(GatewayBusy):
+            gateway.call("other", lambda: "never")
+        assert busy.result(timeout=5) == "done"
+    assert gateway.call("after", lambda: "ok") == "ok"
+    assert gateway.stats()["rejected"] == 1
+
+
+def test_token_bucket_refills_at_its_rate():
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=1, clock=lambda: now[0])
+    assert bucket.take() == 0.0
+    assert bucket.take() == pytest.approx(0.5)
+    now[0] += 0.5
+    assert bucket.take() == 0.0
+
+
+def test_limits_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("JANE_CHAT_RPM", "0")
+    monkeypatch.setenv("JANE_CHAT_CONCURRENCY", "2")
+    monkeypatch.setenv("JANE_CHAT_QUEUE", "not a number")
+    gateway = chat_gateway_from_env()
+    assert gateway.bucket is None
+    assert gateway.max_concurrent == 2
+    assert gateway.max_waiting == 16
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from jane import actions
+from jane.actions import ActionExecutor
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    for name in ("GEMINI_API_KEY", "GEMENI_API_KEY", "GOOGLE_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("JANE_CHAT_CACHE", "off")
+
+    def _factory(key):
+        executor.builds.append(key)
+        return object() if executor.working else None
+
+    executor = ActionExecutor(lambda _text: None, model_factory=_factory)
+    executor.builds = []
+    executor.working = True
+    yield executor
+    executor.close()
+
+
+def test_key_set_after_a_failed_check_is_picked_up(executor, monkeypatch):
+    assert not executor._ensure_gemini_ready()
+    assert "not configured" in executor.chat("hello").message
+    monkeypatch.setenv("GEMINI_API_KEY", "first")
+    assert executor._ensure_gemini_ready()
+    assert executor.builds == ["first"]
+
+
+def test_failed_build_is_retried_when_the_key_changes(executor, monkeypatch):
+    executor.working = False
+    monkeypatch.setenv("GEMINI_API_KEY", "bad")
+    assert not executor._ensure_gemini_ready()
+    assert not executor._ensure_gemini_ready()
+    assert executor.builds == ["bad"]
+
+    executor.working = True
+    monkeypatch.setenv("GEMINI_API_KEY", "good")
+    assert executor._ensure_gemini_ready()
+    assert executor.builds == ["bad", "good"]
+
+
+def test_failed_build_is_retried_after_the_retry_window(executor, monkeypatch):
+    executor.working = False
+    monkeypatch.setenv("GEMINI_API_KEY", "key")
+    assert not executor._ensure_gemini_ready()
+    executor.working = True
+    monkeypatch.setattr(actions, "GEMINI_RETRY_SECONDS", 0.0)
+    assert executor._ensure_gemini_ready()
+    assert executor.builds == ["key", "key"]
+
+
+def test_client_is_rebuilt_when_the_key_rotates(executor, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "one")
+    assert executor._ensure_gemini_ready()
+    assert executor._ensure_gemini_ready()
+    monkeypatch.setenv("GEMINI_API_KEY", "two")
+    assert executor._ensure_gemini_ready()
+    assert executor.builds == ["one", "two"]
+
+
+def test_factory_errors_count_as_a_failed_build(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "key")
+    monkeypatch.setenv("JANE_CHAT_CACHE", "off")
+
+    def _factory(key):
+        raise ValueError("bad key")
+
+    executor = ActionExecutor(lambda _text: None, model_factory=_factory)
+    try:
+        assert not executor._ensure_gemini_ready()
+        assert executor.gemini_model is None
+    finally:
+        executor.close()
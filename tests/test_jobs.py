@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+import time
+
+import pytest
+
+from jane.jobs import JobManager, pip_progress
+
+SLEEP = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_concurrent=1, max_lines=10)
+    yield manager
+    manager.cancel_all()
+
+
+def test_jobs_beyond_the_limit_wait_in_order(manager):
+    first = manager.start(SLEEP, "first")
+    second = manager.start(_python("print('second ran')"), "second")
+    _wait_for(lambda: first.status == "running")
+    assert second.status == "queued"
+
+    assert manager.cancel(first.id)
+    _wait_for(lambda: second.done)
+    assert first.status == "cancelled"
+    assert second.status == "succeeded" and second.last_line() == "second ran"
+
+
+def test_cancelling_a_queued_job_never_starts_it(manager):
+    finished = []
+    first = manager.start(SLEEP, "first")
+    queued = manager.start(_python("print('should not run')"), "queued", on_finish=finished.append)
+    assert manager.cancel(queued.id)
+    assert queued.status == "cancelled" and queued.started is None
+    assert finished == [queued]
+    assert not manager.cancel(queued.id)
+    manager.cancel(first.id)
+
+
+def test_output_buffer_is_bounded_and_polled_with_a_cursor(manager):
+    job = manager.start(_python("for n in range(1, 51): print(n)"), "count")
+    _wait_for(lambda: job.done)
+    assert job.status == "succeeded" and job.lines_seen == 50
+    assert [line["text"] for line in job.output()] == [str(n) for n in range(41, 51)]
+    assert [line["n"] for line in job.output(since=47)] == [48, 49, 50]
+    assert job.to_dict(since=50)["output"] == []
+
+
+def test_undecodable_output_does_not_stall_the_job(manager):
+    code = "import sys; sys.stdout.buffer.write(b'bad \\xff byte\\n'); sys.stdout.flush(); print('after')"
+    job = manager.start(_python(code), "bytes")
+    _wait_for(lambda: job.done, timeout=5)
+    assert job.status == "succeeded"
+    assert [line["text"] for line in job.output()] == ["bad � byte", "after"]
+
+
+def test_failing_and_missing_commands_are_reported(manager):
+    failed = manager.start(_python("import sys; sys.exit(3)"), "exit 3")
+    _wait_for(lambda: failed.done)
+    missing = manager.start(["/nonexistent/jane-tool"], "missing")
+    _wait_for(lambda: missing.done)
+    assert (failed.status, failed.returncode) == ("failed", 3)
+    assert missing.status == "failed" and missing.last_line()
+
+
+class _RootProcess:
+    def poll(self):
+        return None
+
+    def terminate(self):
+        raise PermissionError(1, "Operation not permitted")
+
+
+def test_a_job_that_cannot_be_signalled_is_not_reported_cancelled(manager):
+    job = manager.start(SLEEP, "elevated")
+    _wait_for(lambda: job._process is not None)
+    real, job._process = job._process, _RootProcess()
+    try:
+        assert not manager.cancel(job.id)
+        assert manager.cancel_all() == 0
+        assert job.status == "running" and job.last_line().startswith("Cannot cancel")
+    finally:
+        job._process = real
+    assert manager.cancel(job.id)
+    _wait_for(lambda: job.status == "cancelled")
+
+
+def test_pip_progress_phases():
+    assert pip_progress("Collecting numpy") == 0.15
+    assert pip_progress("Successfully installed numpy-1.26") == 1.0
+    assert pip_progress("random chatter") is None
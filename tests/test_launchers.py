@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+import jane.launchers
+from jane.launchers import Launcher, LauncherResolver, load_app_table
+
+
+@pytest.fixture
+def which(monkeypatch):
+    """A fake ``shutil.which`` over a settable set of installed tools; records every probe."""
+
+    class _Which:
+        installed: dict[str, str] = {}
+        probes: list[str] = []
+
+        def __call__(self, name):
+            self.probes.append(name)
+            return self.installed.get(name)
+
+    fake = _Which()
+    fake.installed, fake.probes = {}, []
+    monkeypatch.setattr(jane.launchers.shutil, "which", fake)
+    monkeypatch.setenv("PATH", "/usr/bin")
+    return fake
+
+
+def test_first_installed_launcher_wins_and_is_cached(which):
+    which.installed = {"kcalc": "/usr/bin/kcalc", "xcalc": "/usr/bin/xcalc"}
+    resolver = LauncherResolver(system="linux")
+    assert resolver.resolve("Calculator") == ("/usr/bin/kcalc",)
+    probes = list(which.probes)
+    assert probes == ["gnome-calculator", "kcalc"]  # the Windows and macOS entries are skipped
+    assert resolver.resolve("calculator") == ("/usr/bin/kcalc",)
+    assert which.probes == probes
+
+
+def test_misses_are_cached_too(which):
+    resolver = LauncherResolver(system="linux")
+    assert resolver.resolve("notepad") is None
+    count = len(which.probes)
+    assert resolver.resolve("notepad") is None
+    assert len(which.probes) == count
+
+
+def test_path_change_drops_the_cache(which, monkeypatch):
+    resolver = LauncherResolver(system="linux")
+    assert resolver.resolve("calculator") is None
+    which.installed = {"galculator": "/opt/bin/galculator"}
+    assert resolver.resolve("calculator") is None  # same PATH: the cached miss stands
+    monkeypatch.setenv("PATH", "/opt/bin:/usr/bin")
+    assert resolver.resolve("calculator") == ("/opt/bin/galculator",)
+
+
+def test_register_replaces_an_app_and_its_cached_answer(which):
+    which.installed = {"gnome-calculator": "/usr/bin/gnome-calculator", "qalculate": "/usr/bin/qalculate"}
+    resolver = LauncherResolver(system="linux")
+    assert resolver.resolve("calculator") == ("/usr/bin/gnome-calculator",)
+    resolver.register("Calculator", ["qalculate --light"])
+    assert resolver.resolve("calculator") == ("/usr/bin/qalculate", "--light")
+
+
+def test_platform_specific_entries(which):
+    which.installed = {"open": "/usr/bin/open"}
+    assert LauncherResolver(system="darwin").resolve("calculator") == ("/usr/bin/open", "-a", "Calculator")
+
+
+def test_launch_forgets_a_binary_that_vanished(which, monkeypatch):
+    which.installed = {"kcalc": "/usr/bin/kcalc"}
+    resolver = LauncherResolver(system="linux")
+
+    def popen(argv):
+        raise FileNotFoundError(argv[0])
+
+    monkeypatch.setattr(jane.launchers.subprocess, "Popen", popen)
+    with pytest.raises(FileNotFoundError):
+        resolver.launch("calculator")
+    which.installed = {}
+    with pytest.raises(LookupError):
+        resolver.launch("calculator")
+
+
+def test_user_app_table(tmp_path):
+    table = tmp_path / "apps.json"
+    table.write_text(
+        '{"Spotify": ["spotify", {"command": "open -a Spotify", "platforms": ["darwin"]}], "bad": [{"nope": 1}]}',
+        encoding="utf-8",
+    )
+    apps = load_app_table(table)
+    assert list(apps) == ["spotify"]
+    assert apps["spotify"] == (Launcher(("spotify",)), Launcher(("open", "-a", "Spotify"), frozenset({"darwin"})))
+    assert load_app_table(tmp_path / "missing.json") == {}
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from jane.memory import ConversationMemory, estimate_tokens
+
+
+def _request_tokens(contents) -> int:
+    return sum(estimate_tokens(part) for item in contents for part in item["parts"])
+
+
+def test_recent_turns_are_sent_verbatim_when_they_fit():
+    memory = ConversationMemory(token_budget=1000, summary_budget=200)
+    memory.record("hello", "Hi there.")
+    contents = memory.build_contents("how are you?")
+    assert [item["parts"][0] for item in contents] == ["hello", "Hi there.", "how are you?"]
+
+
+def test_oversized_recent_turn_is_clipped_to_the_budget():
+    memory = ConversationMemory(token_budget=1000, summary_budget=200)
+    memory.record("tell me everything", "x" * 20000)
+    contents = memory.build_contents("and then?")
+    assert _request_tokens(contents) <= 1000
+    assert contents[0]["parts"][0] == "tell me everything"
+    assert contents[1]["parts"][0].endswith("...")
+    assert contents[-1]["parts"][0] == "and then?"
+
+
+def test_budget_holds_across_many_long_turns():
+    memory = ConversationMemory(token_budget=500, summary_budget=100)
+    for index in range(20):
+        memory.record(f"question {index} " + "q" * 900, f"Answer {index}. " + "a" * 3000)
+        assert _request_tokens(memory.build_contents("next")) <= 500
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+
+import pytest
+
+import jane.notes
+from jane.notes import Note, NotesIndex, NoteWriter
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / "notes.txt"
+
+
+def test_unencodable_note_is_written_and_the_writer_keeps_going(journal):
+    writer = NoteWriter(journal)
+    try:
+        writer.append("[2024-05-01 10:00:00] bad \ud800 text").result(timeout=2)
+        writer.append("[2024-05-01 10:01:00] next note").result(timeout=2)
+    finally:
+        writer.close()
+    assert journal.read_text(encoding="utf-8").splitlines() == [
+        "[2024-05-01 10:00:00] bad ? text",
+        "[2024-05-01 10:01:00] next note",
+    ]
+
+
+def test_a_failed_batch_only_fails_its_own_notes(journal, monkeypatch):
+    calls = []
+
+    def fsync(fd):
+        calls.append(fd)
+        if len(calls) == 1:
+            raise ValueError("disk said no")
+
+    monkeypatch.setattr(jane.notes.os, "fsync", fsync)
+    writer = NoteWriter(journal, durability="fsync")
+    try:
+        with pytest.raises(ValueError, match="disk said no"):
+            writer.append("first").result(timeout=2)
+        writer.append("second").result(timeout=2)
+    finally:
+        writer.close()
+    assert len(calls) == 2
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_close_returns_when_the_writer_thread_is_dead(journal):
+    writer = NoteWriter(journal)
+    writer._queue.put(("poison\n", None))  # resolving a None future kills the thread
+    writer._thread.join(2)
+    assert not writer._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        writer.append("lost")
+
+    closer = threading.Thread(target=writer.close, daemon=True)
+    closer.start()
+    closer.join(2)
+    assert not closer.is_alive()
+
+
+def test_durability_none_still_lands_after_flush(journal):
+    writer = NoteWriter(journal, durability="none")
+    try:
+        futures = [writer.append(f"line {n}") for n in range(50)]
+        writer.flush(timeout=2)
+        assert all(future.done() for future in futures)
+        assert journal.read_text(encoding="utf-8").splitlines() == [f"line {n}" for n in range(50)]
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+def index(journal, tmp_path):
+    index = NotesIndex(journal, tmp_path / "notes.sqlite3")
+    yield index
+    index.close()
+
+
+def _append(journal, *lines: str) -> None:
+    with journal.open("a", encoding="utf-8") as fh:
+        fh.write("".join(line + "\n" for line in lines))
+
+
+def test_index_picks_up_external_appends(journal, index):
+    assert index.sync() == 0
+    _append(journal, "[2024-05-01 10:00:00] buy milk", "[2024-05-01 11:00:00] call the dentist")
+    assert index.sync() == 2
+    assert index.sync() == 0
+    _append(journal, "[2024-05-02 09:00:00] milk is on sale")
+    assert sorted(note.text for note in index.search("milk")) == ["buy milk", "milk is on sale"]
+    assert index.count() == 3
+
+
+def test_unfinished_last_line_waits_for_its_newline(journal, index):
+    journal.write_text("[2024-05-01 10:00:00] done\n[2024-05-01 10:01:00] half", encoding="utf-8")
+    assert index.sync() == 1
+    with journal.open("a", encoding="utf-8") as fh:
+        fh.write(" written\n")
+    assert index.sync() == 1
+    assert [note.text for note in index.recent()] == ["done", "half written"]
+
+
+def test_truncated_journal_is_reindexed(journal, index):
+    _append(journal, "[2024-05-01 10:00:00] old one", "[2024-05-01 10:01:00] old two")
+    assert index.count() == 2
+    journal.write_text("[2024-06-01 08:00:00] fresh\n", encoding="utf-8")
+    assert [note.text for note in index.recent()] == ["fresh"]
+    assert index.search("old") == []
+
+
+def test_query_syntax_is_treated_as_plain_words(journal, index):
+    _append(journal, "[2024-05-01 10:00:00] gift ideas and wrapping paper", "[2024-05-01 10:01:00] NEAR the park")
+    assert [note.text for note in index.search('gift AND "ideas')] == ["gift ideas and wrapping paper"]
+    assert [note.text for note in index.search("near(")] == ["NEAR the park"]
+    assert [note.text for note in index.search("wrap* -paper")] == ["gift ideas and wrapping paper"]
+    assert index.search('"*()') == []
+
+
+def test_like_fallback_without_fts(journal, index):
+    index.full_text = False
+    _append(journal, "[2024-05-01 10:00:00] 50% off shoes", "[2024-05-01 10:01:00] shoe laces")
+    assert [note.text for note in index.search("shoe")] == ["shoe laces", "50% off shoes"]
+    assert [note.text for note in index.search("off shoes")] == ["50% off shoes"]
+
+
+def test_between_uses_note_timestamps(journal, index):
+    _append(
+        journal,
+        "[2024-05-01 23:59:59] late",
+        "[2024-05-02 00:00:00] midnight",
+        "[2024-05-02 12:00:00] noon",
+        "no stamp",
+    )
+    notes = index.between(datetime(2024, 5, 2), datetime(2024, 5, 3))
+    assert [note.text for note in notes] == ["midnight", "noon"]
+    assert index.recent(2)[-1] == Note(4, None, "no stamp")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import sys
+import types
+
+import pytest
+
+from jane.audio import AudioClip
+from jane.recognizers import (
+    FallbackRecognizer,
+    RecognitionError,
+    SphinxRecognizer,
+    VoskRecognizer,
+    WhisperRecognizer,
+    recognizer_from_env,
+)
+
+CLIP = AudioClip(bytes(3200), 16000, 2)
+
+
+def _module(monkeypatch, name, **attrs):
+    module = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+@pytest.fixture
+def vosk(monkeypatch):
+    """A fake ``vosk`` whose recognizer always hears "open calculator"."""
+    loads = []
+
+    class Model:
+        def __init__(self, path=None, lang=None):
+            loads.append(path or lang)
+
+    class KaldiRecognizer:
+        def __init__(self, model, rate):
+            self.rate = rate
+
+        def AcceptWaveform(self, data):
+            return True
+
+        def FinalResult(self):
+            return json.dumps({"text": " open calculator "})
+
+    _module(monkeypatch, "vosk", Model=Model, KaldiRecognizer=KaldiRecognizer, SetLogLevel=lambda level: None)
+    return loads
+
+
+@pytest.fixture
+def broken_whisper(monkeypatch):
+    loads = []
+
+    def WhisperModel(name, device, compute_type):
+        loads.append(name)
+        raise OSError(f"model {name} could not be downloaded")
+
+    _module(monkeypatch, "numpy")
+    _module(monkeypatch, "faster_whisper", WhisperModel=WhisperModel)
+    return loads
+
+
+def test_model_is_loaded_once(vosk):
+    recognizer = VoskRecognizer()
+    assert [recognizer.transcribe(CLIP) for _ in range(3)] == ["open calculator"] * 3
+    assert vosk == ["en-us"]
+    stats = recognizer.stats()
+    assert stats["backend"] == "vosk" and stats["errors"] == 0 and stats["load_ms"] is not None
+
+
+def test_failed_model_load_is_a_cached_recognition_error(broken_whisper):
+    recognizer = WhisperRecognizer("tiny.en")
+    for _ in range(2):
+        with pytest.raises(RecognitionError, match="tiny.en"):
+            recognizer.transcribe(CLIP)
+    assert broken_whisper == ["tiny.en"]
+    assert recognizer.stats()["errors"] == 2
+
+
+def test_bad_decoder_config_is_a_recognition_error(monkeypatch):
+    def Decoder(**config):
+        raise ValueError("bad config")
+
+    _module(monkeypatch, "pocketsphinx", Decoder=Decoder)
+    with pytest.raises(RecognitionError, match="bad config"):
+        SphinxRecognizer().warm()
+
+
+def test_fallback_moves_past_a_backend_that_cannot_load(monkeypatch, vosk, broken_whisper):
+    monkeypatch.setenv("JANE_STT_BACKEND", "whisper, vosk")
+    recognizer = recognizer_from_env()
+    assert isinstance(recognizer, FallbackRecognizer) and recognizer.name == "whisper,vosk"
+
+    recognizer.warm()  # must not raise for the broken first backend
+    assert recognizer.transcribe(CLIP) == "open calculator"
+    assert recognizer.transcribe(CLIP) == "open calculator"
+    assert broken_whisper == ["base.en"] and vosk == ["en-us"]
+    whisper, vosk_stats = recognizer.stats()["backends"]
+    assert whisper["errors"] == 2 and vosk_stats["errors"] == 0
+
+
+def test_fallback_reports_every_failure(monkeypatch, broken_whisper):
+    monkeypatch.setitem(sys.modules, "vosk", None)  # "import vosk" raises ImportError
+    recognizer = FallbackRecognizer([WhisperRecognizer(), VoskRecognizer()])
+    with pytest.raises(RecognitionError) as raised:
+        recognizer.transcribe(CLIP)
+    assert "Whisper model" in str(raised.value) and "pip install vosk" in str(raised.value)
+    assert recognizer.stats()["errors"] == 1
+
+
+def test_unknown_names_fall_back_to_google(monkeypatch):
+    monkeypatch.setenv("JANE_STT_BACKEND", "nonsense")
+    assert recognizer_from_env().name == "google"
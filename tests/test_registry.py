@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+import jane.registry
+from jane.registry import ActionRegistry, ActionSpec
+
+_PLUGIN = '''
+from jane.registry import ActionSpec
+
+SPEC = ActionSpec("wave", "{module}:wave", kind="cpu")
+
+
+def wave(executor, cmd):
+    return "waved"
+
+
+def plan(executor, cmd):
+    return None
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    """An importable throwaway module holding a spec, a handler and an elevation planner."""
+    name = "jane_test_plugin"
+    (tmp_path / f"{name}.py").write_text(_PLUGIN.format(module=name), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_handlers_are_imported_on_first_use(plugin):
+    registry = ActionRegistry([ActionSpec("wave", f"{plugin}:wave")])
+    assert registry.actions() == ["wave"] and registry.loaded() == []
+    assert plugin not in sys.modules
+    handler = registry.handler("wave")
+    assert plugin in sys.modules
+    assert handler(None, None) == "waved"
+    assert registry.handler("wave") is handler
+    assert registry.loaded() == ["wave"]
+
+
+def test_unknown_action_has_no_handler():
+    registry = ActionRegistry()
+    assert registry.handler("nope") is None
+    assert registry.spec("nope") is None
+    assert registry.elevated_planner("nope") is None
+
+
+@pytest.mark.parametrize("reference", ["jane_no_such_module:wave", "jane.registry:no_such_handler"])
+def test_bad_handler_path_raises_every_time_until_fixed(reference, plugin):
+    registry = ActionRegistry([ActionSpec("wave", reference)])
+    for _attempt in range(2):
+        with pytest.raises((ImportError, AttributeError)):
+            registry.handler("wave")
+    assert registry.loaded() == []
+    registry.register(ActionSpec("wave", f"{plugin}:wave"))
+    assert registry.handler("wave")(None, None) == "waved"
+
+
+def test_registering_a_spec_drops_the_loaded_handler(plugin):
+    registry = ActionRegistry()
+    registry.register(ActionSpec("wave", f"{plugin}:wave"), handler=lambda executor, cmd: "direct")
+    assert registry.handler("wave")(None, None) == "direct"
+    registry.register(ActionSpec("wave", f"{plugin}:wave"))
+    assert registry.handler("wave")(None, None) == "waved"
+
+
+def test_elevated_planner_loads_from_the_spec(plugin):
+    registry = ActionRegistry([ActionSpec("wave", f"{plugin}:wave", elevated=f"{plugin}:plan")])
+    assert registry.elevated_planner("wave") is sys.modules[plugin].plan
+
+
+class _EntryPoint:
+    def __init__(self, load) -> None:
+        self.load = load
+
+
+def test_discover_registers_published_specs(plugin, monkeypatch):
+    groups = []
+
+    def _broken():
+        raise ImportError("plugin is broken")
+
+    def _entry_points(group):
+        groups.append(group)
+        return [
+            _EntryPoint(lambda: importlib.import_module(plugin).SPEC),
+            _EntryPoint(_broken),
+            _EntryPoint(lambda: "not a spec"),
+        ]
+
+    monkeypatch.setattr(jane.registry, "entry_points", _entry_points)
+    registry = ActionRegistry()
+    assert registry.discover() == 1
+    assert groups == [jane.registry.ENTRY_POINT_GROUP]
+    assert registry.spec("wave").kind == "cpu"
+    assert registry.loaded() == []
+    assert registry.handler("wave")(None, None) == "waved"
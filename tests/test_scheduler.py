@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from jane.scheduler import Scheduler, parse_delay
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = Scheduler()
+    yield scheduler
+    scheduler.close()
+
+
+def _recorder(fired: list[str], done: threading.Event, expected: int):
+    def _callback(job):
+        fired.append(job.label)
+        if len(fired) == expected:
+            done.set()
+        return None
+
+    return _callback
+
+
+def test_jobs_fire_in_due_order(scheduler):
+    fired: list[str] = []
+    done = threading.Event()
+    callback = _recorder(fired, done, 3)
+    for label, delay in (("third", 0.15), ("first", 0.0), ("second", 0.05)):
+        scheduler.schedule(delay, callback, label=label)
+    assert done.wait(5)
+    assert fired == ["first", "second", "third"]
+    assert scheduler.pending() == []
+    assert scheduler.fired == 3
+
+
+def test_cancelled_job_never_fires(scheduler):
+    fired: list[str] = []
+    done = threading.Event()
+    cancelled = []
+    callback = _recorder(fired, done, 1)
+    doomed = scheduler.schedule(0.05, callback, label="doomed", on_cancel=cancelled.append)
+    scheduler.schedule(0.1, callback, label="kept")
+    assert scheduler.cancel(doomed.id)
+    assert not scheduler.cancel(doomed.id)
+    assert cancelled == [doomed] and doomed.cancelled
+    assert done.wait(5)
+    assert fired == ["kept"]
+
+
+def test_cancel_all_by_kind(scheduler):
+    for kind in ("reminder", "reminder", "countdown"):
+        scheduler.schedule(60, lambda _job: None, kind=kind)
+    assert scheduler.cancel_all("reminder") == 2
+    assert [job.kind for job in scheduler.pending()] == ["countdown"]
+    assert scheduler.cancel_all() == 1
+    assert scheduler.pending() == []
+
+
+def test_repeating_job_reschedules_until_it_returns_none(scheduler):
+    runs = []
+    done = threading.Event()
+
+    def _tick(job):
+        runs.append(job.id)
+        if len(runs) == 3:
+            done.set()
+            return None
+        return 0.01
+
+    scheduler.schedule(0, _tick)
+    assert done.wait(5)
+    assert len(runs) == 3 and scheduler.pending() == []
+
+
+def test_failing_callback_does_not_stop_the_scheduler(scheduler):
+    done = threading.Event()
+
+    def _boom(_job):
+        raise RuntimeError("boom")
+
+    scheduler.schedule(0, _boom)
+    scheduler.schedule(0.05, lambda _job: done.set())
+    assert done.wait(5)
+
+
+def test_stale_heap_entries_are_compacted(scheduler):
+    jobs = [scheduler.schedule(600, lambda _job: None) for _ in range(200)]
+    for job in jobs[:150]:
+        scheduler.cancel(job.id)
+    assert len(scheduler.pending()) == 50
+    assert len(scheduler._heap) < 200
+    assert sum(not entry[2].cancelled for entry in scheduler._heap) == 50
+
+
+def test_closed_scheduler_refuses_new_jobs():
+    scheduler = Scheduler()
+    job = scheduler.schedule(60, lambda _job: None)
+    scheduler.close()
+    assert job.cancelled
+    with pytest.raises(RuntimeError):
+        scheduler.schedule(1, lambda _job: None)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("in 20 minutes to stretch", (1200.0, "stretch")),
+        ("in 20 minutes, to stretch", (1200.0, "stretch")),
+        ("call mom in an hour", (3600.0, "call mom")),
+        ("in a minute", (60.0, "")),
+        ("after 1.5 hours that the oven is on", (5400.0, "the oven is on")),
+        ("In 10s check the build", (10.0, "check the build")),
+        ("in one sec", (1.0, "")),
+        ("in 2 H", (7200.0, "")),
+    ],
+)
+def test_parse_delay(text, expected):
+    assert parse_delay(text) == expected
+
+
+@pytest.mark.parametrize("text", ["stretch now", "in 5 days", "within 5 minutes", "in minutes"])
+def test_parse_delay_without_a_delay(text):
+    assert parse_delay(text) is None
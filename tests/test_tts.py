@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from jane.tts import PRIORITY_NORMAL, SpeechQueue
+
+
+class _Voice:
+    """Records what was said; the first utterance blocks on ``gate`` so a backlog can build."""
+
+    def __init__(self):
+        self.spoken = []
+        self.gate = threading.Event()
+
+    def __call__(self, text):
+        if not self.spoken:
+            self.gate.wait(5)
+        self.spoken.append(text)
+
+
+@pytest.fixture
+def voice():
+    return _Voice()
+
+
+@pytest.fixture
+def queue(voice):
+    queue = SpeechQueue(voice)
+    queue.say("hold on")
+    deadline = time.monotonic() + 3
+    while not queue.stats()["speaking"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    yield queue
+    queue.close()
+
+
+def _drain(queue, voice, count):
+    voice.gate.set()
+    deadline = time.monotonic() + 5
+    while len(voice.spoken) < count or queue.depth():
+        assert time.monotonic() < deadline, voice.spoken
+        time.sleep(0.01)
+    return voice.spoken[1:]
+
+
+def test_streamed_sentences_survive_overflow(queue, voice):
+    sentences = [f"Sentence {n}." for n in range(40)]
+    for sentence in sentences:
+        queue.say(sentence, PRIORITY_NORMAL, max_age=None, coalesce=False)
+    queue.say("An ordinary reply.")
+    assert _drain(queue, voice, 42) == sentences + ["An ordinary reply."]
+
+
+def test_overflow_still_sheds_ordinary_utterances(voice):
+    queue = SpeechQueue(voice, max_depth=2)
+    try:
+        queue.say("hold on")
+        while not queue.stats()["speaking"]:
+            time.sleep(0.01)
+        for n in range(4):
+            queue.say(f"Message {n}.")
+        assert queue.stats()["overflow"] == 2
+        assert _drain(queue, voice, 3) == ["Message 0.", "Message 1."]
+    finally:
+        queue.close()
+
+
+def test_messages_differing_only_in_numbers_are_both_spoken(queue, voice):
+    queue.say("You have 3 notes.")
+    queue.say("You have 4 notes.")
+    assert _drain(queue, voice, 3) == ["You have 3 notes.", "You have 4 notes."]
+
+
+def test_same_key_supersedes_and_exact_repeats_are_dropped(queue, voice):
+    for n in (3, 2, 1):
+        queue.say(f"Shutdown in {n}", key="shutdown")
+    assert queue.say("Sorry, I did not catch that.")
+    assert not queue.say("Sorry, I did not catch that.")
+    assert _drain(queue, voice, 3) == ["Shutdown in 1", "Sorry, I did not catch that."]
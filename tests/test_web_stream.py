@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jane_web.server import JaneWebState
+
+
+class _Chunk:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeModel:
+    """Streams a canned two-sentence answer per prompt, slowly enough for requests to overlap."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, contents, stream=False):
+        with self._lock:
+            self.calls += 1
+        prompt = contents[-1]["parts"][0]
+        answer = [f"First about {prompt}. ", f"Second about {prompt}."]
+        if not stream:
+            return _Chunk("".join(answer))
+        return self._stream(answer)
+
+    def _stream(self, answer):
+        for piece in answer:
+            time.sleep(0.05)
+            yield _Chunk(piece)
+
+
+@pytest.fixture
+def state(monkeypatch):
+    monkeypatch.setenv("JANE_CHAT_CACHE", "off")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    state = JaneWebState()
+    model = FakeModel()
+    state.executor.gemini_model_factory = lambda _key: model
+    yield state
+    state.executor.close()
+
+
+def _drain(events) -> list[dict]:
+    received = []
+    while not events.empty():
+        received.append(events.get_nowait())
+    return received
+
+
+def test_concurrent_requests_stream_under_their_own_ids(state):
+    events = state.events.subscribe()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(state.process, "tell me about cats", "req-cats")
+        second = pool.submit(state.process, "tell me about dogs", "req-dogs")
+        responses = [first.result(timeout=10), second.result(timeout=10)]
+
+    assert [response["request_id"] for response in responses] == ["req-cats", "req-dogs"]
+    assert all(response["streamed"] for response in responses)
+    by_request: dict[str, list[str]] = {}
+    for event in _drain(events):
+        by_request.setdefault(event["request_id"], []).append(event["text"])
+    assert by_request == {
+        "req-cats": ["First about tell me about cats.", "Second about tell me about cats."],
+        "req-dogs": ["First about tell me about dogs.", "Second about tell me about dogs."],
+    }
+
+
+def test_coalesced_request_still_streams_to_its_caller(state):
+    events = state.events.subscribe()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(state.process, "tell me a joke", "req-a")
+        time.sleep(0.02)
+        second = pool.submit(state.process, "tell me a joke", "req-b")
+        first.result(timeout=10), second.result(timeout=10)
+
+    assert state.executor.gemini_model.calls == 1
+    counts: dict[str, int] = {}
+    for event in _drain(events):
+        counts[event["request_id"]] = counts.get(event["request_id"], 0) + 1
+    assert counts == {"req-a": 2, "req-b": 2}
+
+
+def test_request_id_is_generated_when_missing(state):
+    response = state.process("what time is it")
+    assert response["request_id"]
+    assert not response.get("streamed")